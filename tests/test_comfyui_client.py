@@ -1,5 +1,6 @@
 """Tests for ComfyUI client wrapper."""
 
+import io
 import json
 import pytest
 import os
@@ -135,15 +136,33 @@ class TestLocalComfyUIClient:
         assert result == ["test.png"]
         assert mock_request.call_count == 2
 
+    def test_parse_history_response(self):
+        """Test parsing a /history/{prompt_id} payload into output hints."""
+        pending = {"test-prompt-id": {"status": {"completed": False}, "outputs": {}}}
+        completed = {
+            "test-prompt-id": {
+                "status": {"completed": True},
+                "outputs": {"1": {"gifs": [{"filename": "clip.mp4", "subfolder": "video"}]}},
+            }
+        }
+
+        assert self.client.parse_history_response("test-prompt-id", {}) is None
+        assert self.client.parse_history_response("test-prompt-id", pending) is None
+        assert self.client.parse_history_response("test-prompt-id", completed) == ["video/clip.mp4"]
+
     @patch('videomerge.services.comfyui.base.requests.request')
     def test_download_outputs_success(self, mock_request):
         """Test successful output download."""
         mock_response = Mock()
         mock_response.ok = True
-        mock_response.iter_content.return_value = [b"test", b"image", b"data"]
+        mock_response.raw = io.BytesIO(b"test image data")
         mock_request.return_value = mock_response
 
-        with patch('pathlib.Path.mkdir'), patch('pathlib.Path.open') as mock_open:
+        with (
+            patch('pathlib.Path.mkdir'),
+            patch('pathlib.Path.open') as mock_open,
+            patch('videomerge.services.comfyui.local_client.os.replace') as mock_replace,
+        ):
             mock_file = MagicMock()
             mock_open.return_value.__enter__.return_value = mock_file
 
@@ -152,6 +171,7 @@ class TestLocalComfyUIClient:
 
             assert len(result) == 1
             assert result[0].name == "test.png"
+            mock_replace.assert_called_once_with(dest_dir / "test.png.part", dest_dir / "test.png")
 
     @patch('videomerge.services.comfyui.base.requests.request')
     def test_fetch_output_bytes_success(self, mock_request):
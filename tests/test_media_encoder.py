@@ -0,0 +1,41 @@
+"""Unit tests for the configurable final-render encoder in videomerge.services.media."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+def _media():
+    try:
+        from videomerge.services import media
+    except ImportError as exc:
+        pytest.skip(f"import failed: {exc}")
+    media.resolve_video_encoder.cache_clear()
+    return media
+
+
+class TestResolveVideoEncoder:
+    def test_libx264_does_not_probe_ffmpeg(self):
+        media = _media()
+        with patch.object(media.subprocess, "run") as mock_run:
+            assert media.resolve_video_encoder("libx264") == "libx264"
+        mock_run.assert_not_called()
+
+    def test_available_hardware_encoder_is_used(self):
+        media = _media()
+        probe = MagicMock(returncode=0, stdout=" V....D h264_nvenc  NVIDIA NVENC H.264 encoder\n")
+        with patch.object(media.subprocess, "run", return_value=probe):
+            assert media.resolve_video_encoder("h264_nvenc") == "h264_nvenc"
+            assert media.video_encoder_args("h264_nvenc")[:2] == ["-c:v", "h264_nvenc"]
+
+    def test_missing_hardware_encoder_falls_back_to_libx264(self):
+        media = _media()
+        probe = MagicMock(returncode=0, stdout=" V....D libx264  libx264 H.264\n")
+        with patch.object(media.subprocess, "run", return_value=probe):
+            assert media.resolve_video_encoder("h264_nvenc") == "libx264"
+
+    def test_unknown_encoder_falls_back_to_libx264(self):
+        media = _media()
+        assert media.video_encoder_args("mpeg2video")[:2] == ["-c:v", "libx264"]
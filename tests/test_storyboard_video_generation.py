@@ -193,8 +193,7 @@ class TestSuccessPathsLegacyTail:
             return [f"/data/shared/run-sb-xyz/{int(idx):03d}_clip.mp4"]
 
         rec.register("poll_video_generation_provider", _poll)
-        rec.register("stitch_videos", "/data/shared/run-sb-xyz/stitched.mp4")
-        rec.register("burn_subtitles_into_video", "/data/shared/run-sb-xyz/final.mp4")
+        rec.register("stitch_and_finalize", "/data/shared/run-sb-xyz/final.mp4")
         rec.register("upload_final_video_output", "user-1/run-sb-xyz/final.mp4")
         rec.register("send_completion_webhook", None)
         return rec
@@ -211,8 +210,7 @@ class TestSuccessPathsLegacyTail:
         assert rec.count("start_video_generation_provider") == 2
         assert rec.count("poll_video_generation_provider") == 2
         # legacy tail ran
-        assert rec.count("stitch_videos") == 1
-        assert rec.count("burn_subtitles_into_video") == 1
+        assert rec.count("stitch_and_finalize") == 1
         assert rec.count("upload_final_video_output") == 1
         # exactly one completion webhook, and it is "completed"
         assert rec.count("send_completion_webhook") == 1
@@ -221,9 +219,9 @@ class TestSuccessPathsLegacyTail:
         assert rec.count("handoff_to_compositor") == 0
 
         # Verify stitch received ordered clip paths
-        stitch_call = next(c for c in rec.calls if c[0] == "stitch_videos")
+        stitch_call = next(c for c in rec.calls if c[0] == "stitch_and_finalize")
         _, stitch_args, _ = stitch_call
-        _run_id, clip_paths, _voiceover = stitch_args
+        _run_id, clip_paths, _voiceover, _language = stitch_args
         assert clip_paths == [
             "/data/shared/run-sb-xyz/000_clip.mp4",
             "/data/shared/run-sb-xyz/001_clip.mp4",
@@ -265,7 +263,7 @@ class TestSuccessPathsLegacyTail:
         # start_video_generation_provider args: (provider, video_prompt, image_path, model, w, h, index)
         assert start_args[-1] == 1
         # Stitch received clips in scene order (existing first, new second)
-        stitch_call = next(c for c in rec.calls if c[0] == "stitch_videos")
+        stitch_call = next(c for c in rec.calls if c[0] == "stitch_and_finalize")
         _, stitch_args, _ = stitch_call
         assert stitch_args[1] == [
             "/data/shared/run-sb-xyz/000_clip.mp4",
@@ -289,7 +287,7 @@ class TestSuccessPathsLegacyTail:
         assert final_path == "/data/shared/run-sb-xyz/final.mp4"
         assert rec.count("start_video_generation_provider") == 0
         assert rec.count("poll_video_generation_provider") == 0
-        assert rec.count("stitch_videos") == 1
+        assert rec.count("stitch_and_finalize") == 1
 
 
 # ===========================================================================
@@ -321,7 +319,7 @@ class TestFailurePaths:
         assert rec.count("send_completion_webhook") == 1
         assert rec.webhook_status_calls() == ["failed"]
         # Legacy tail never started
-        assert rec.count("stitch_videos") == 0
+        assert rec.count("stitch_and_finalize") == 0
 
     def test_setup_run_directory_failure_sends_webhook_and_raises(self):
         """Top-level exception path: setup_run_directory fails → failure webhook + ApplicationError."""
@@ -342,7 +340,7 @@ class TestFailurePaths:
         assert rec.webhook_status_calls() == ["failed"]
         # No downstream activities ran
         assert rec.count("generate_voiceover") == 0
-        assert rec.count("stitch_videos") == 0
+        assert rec.count("stitch_and_finalize") == 0
         assert rec.count("handoff_to_compositor") == 0
 
     def test_handoff_failure_sends_exactly_one_failure_webhook(self):
@@ -376,8 +374,7 @@ class TestFailurePaths:
         assert rec.count("send_completion_webhook") == 1
         assert rec.webhook_status_calls() == ["failed"]
         # Legacy tail never ran
-        assert rec.count("stitch_videos") == 0
-        assert rec.count("burn_subtitles_into_video") == 0
+        assert rec.count("stitch_and_finalize") == 0
 
 
 # ===========================================================================
@@ -430,7 +427,7 @@ class TestEffectiveHandoffAutoCompute:
 
         assert final_path == "/data/shared/run-sb-xyz/composed.mp4"
         assert rec.count("handoff_to_compositor") == 1
-        assert rec.count("stitch_videos") == 0
+        assert rec.count("stitch_and_finalize") == 0
 
     def test_auto_legacy_when_brief_missing(self):
         """Without brief/platform/client_id, auto-compute is False → legacy tail runs."""
@@ -457,8 +454,7 @@ class TestEffectiveHandoffAutoCompute:
             "poll_video_generation_provider",
             ["/data/shared/run-sb-xyz/000_clip.mp4"],
         )
-        rec.register("stitch_videos", "/data/shared/run-sb-xyz/stitched.mp4")
-        rec.register("burn_subtitles_into_video", "/data/shared/run-sb-xyz/final.mp4")
+        rec.register("stitch_and_finalize", "/data/shared/run-sb-xyz/final.mp4")
         rec.register("upload_final_video_output", "user-1/run-sb-xyz/final.mp4")
         rec.register("send_completion_webhook", None)
 
@@ -466,4 +462,4 @@ class TestEffectiveHandoffAutoCompute:
 
         assert final_path == "/data/shared/run-sb-xyz/final.mp4"
         assert rec.count("handoff_to_compositor") == 0
-        assert rec.count("stitch_videos") == 1
+        assert rec.count("stitch_and_finalize") == 1
@@ -139,8 +139,7 @@ class TestVideoGenerationWorkflowHandoff:
         assert "handoff_to_compositor" in activity_calls
         assert "poll_compose_status" in activity_calls
         assert "upload_final_video_output" in activity_calls
-        assert "stitch_videos" not in activity_calls
-        assert "burn_subtitles_into_video" not in activity_calls
+        assert "stitch_and_finalize" not in activity_calls
         assert "send_completion_webhook" in activity_calls  # completion notification runs in both paths
 
     def test_handoff_false_calls_legacy_tail_not_handoff(self):
@@ -164,9 +163,7 @@ class TestVideoGenerationWorkflowHandoff:
                 return "/data/shared/run-vgw-123/voiceover.mp3"
             if name == "generate_scene_prompts":
                 return [{"image_prompt": "img1", "video_prompt": "vid1"}]
-            if name == "stitch_videos":
-                return "/data/shared/run-vgw-123/stitched.mp4"
-            if name == "burn_subtitles_into_video":
+            if name == "stitch_and_finalize":
                 return "/data/shared/run-vgw-123/final.mp4"
             if name == "send_completion_webhook":
                 return None
@@ -189,8 +186,7 @@ class TestVideoGenerationWorkflowHandoff:
             result = self._run(wf.run(req))
 
         assert result == "/data/shared/run-vgw-123/final.mp4"
-        assert "stitch_videos" in activity_calls
-        assert "burn_subtitles_into_video" in activity_calls
+        assert "stitch_and_finalize" in activity_calls
         assert "send_completion_webhook" in activity_calls
         assert "handoff_to_compositor" not in activity_calls
 
@@ -241,7 +237,7 @@ class TestVideoGenerationWorkflowHandoff:
 
         assert "handoff_to_compositor" in activity_calls
         assert "send_completion_webhook" in activity_calls
-        assert "stitch_videos" not in activity_calls
+        assert "stitch_and_finalize" not in activity_calls
 
     def test_handoff_builds_payload_with_correct_fields(self):
         """HandoffPayload passed to the activity uses run_id, clip_paths, voiceover_path from workflow state."""
@@ -368,8 +364,7 @@ class TestStoryBoardVideoGenerationHandoff:
         assert "handoff_to_compositor" in activity_calls
         assert "poll_compose_status" in activity_calls
         assert "upload_final_video_output" in activity_calls
-        assert "stitch_videos" not in activity_calls
-        assert "burn_subtitles_into_video" not in activity_calls
+        assert "stitch_and_finalize" not in activity_calls
         assert "send_completion_webhook" in activity_calls  # completion notification runs in both paths
 
     def test_handoff_false_calls_legacy_tail_not_handoff(self):
@@ -395,9 +390,7 @@ class TestStoryBoardVideoGenerationHandoff:
                 return [
                     {"index": 0, "video_prompt": "vp1", "image_path": "/data/shared/run-sb-123/image_000.png"},
                 ]
-            if name == "stitch_videos":
-                return "/data/shared/run-sb-123/stitched.mp4"
-            if name == "burn_subtitles_into_video":
+            if name == "stitch_and_finalize":
                 return "/data/shared/run-sb-123/final.mp4"
             if name == "upload_final_video_output":
                 return "user-1/run-sb-123/final.mp4"
@@ -426,8 +419,7 @@ class TestStoryBoardVideoGenerationHandoff:
                 result = self._run(wf.run(req))
 
         assert result == "/data/shared/run-sb-123/final.mp4"
-        assert "stitch_videos" in activity_calls
-        assert "burn_subtitles_into_video" in activity_calls
+        assert "stitch_and_finalize" in activity_calls
         assert "upload_final_video_output" in activity_calls
         assert "send_completion_webhook" in activity_calls
         assert "handoff_to_compositor" not in activity_calls
@@ -485,7 +477,7 @@ class TestStoryBoardVideoGenerationHandoff:
 
         assert "handoff_to_compositor" in activity_calls
         assert "send_completion_webhook" in activity_calls
-        assert "stitch_videos" not in activity_calls
+        assert "stitch_and_finalize" not in activity_calls
 
     def test_handoff_payload_uses_user_access_token(self):
         """HandoffPayload for storyboard workflow includes user_access_token from the request."""
@@ -158,10 +158,27 @@ async def test_video_generation_workflow_uses_generated_prompts(tmp_path: Path)
         # Return a dummy image hint per scene
         return f"image-{index}.png"
 
-    async def upload_image_for_video_generation(image_hint: str) -> str:
-        return image_hint
+    async def upload_and_start_video_generation_provider(
+        provider: str,
+        prompt_text: str,
+        image_hint: str,
+        run_id: str,
+        model: str,
+        width: int,
+        height: int,
+        index: int,
+    ) -> str:
+        return f"video-job-{index}"
 
-    async def generate_video_from_image(run_id: str, video_prompt: str, image_input: str, index: int) -> List[str]:
+    async def poll_video_generation_provider(
+        provider: str,
+        job_id: str,
+        run_id: str,
+        index: int,
+        timeout_s: int,
+        poll_interval_s: float,
+        model: str = "",
+    ) -> List[str]:
         # Each scene yields one video file
         run_dir = tmp_path / run_id
         run_dir.mkdir(parents=True, exist_ok=True)
@@ -169,18 +186,12 @@ async def test_video_generation_workflow_uses_generated_prompts(tmp_path: Path)
         video_path.write_text("dummy", encoding="utf-8")
         return [str(video_path)]
 
-    async def stitch_videos(run_id: str, video_paths: List[str], voiceover_path: str) -> str:
-        run_dir = tmp_path / run_id
-        output = run_dir / "stitched.mp4"
-        output.write_text("dummy-stitched", encoding="utf-8")
-        # Record for assertions
-        recorded["stitched_videos"] = list(video_paths)
-        return str(output)
-
-    async def burn_subtitles_into_video(run_id: str, stitched_video_path: str, language: str, voiceover_path: str) -> str:
+    async def stitch_and_finalize(run_id: str, video_paths: List[str], voiceover_path: str, language: str) -> str:
         run_dir = tmp_path / run_id
         final = run_dir / "final.mp4"
         final.write_text("dummy-final", encoding="utf-8")
+        # Record for assertions
+        recorded["stitched_videos"] = list(video_paths)
         return str(final)
 
     async def send_completion_webhook(
@@ -218,10 +229,9 @@ async def test_video_generation_workflow_uses_generated_prompts(tmp_path: Path)
                 generate_voiceover,
                 generate_scene_prompts,
                 generate_image,
-                upload_image_for_video_generation,
-                generate_video_from_image,
-                stitch_videos,
-                burn_subtitles_into_video,
+                upload_and_start_video_generation_provider,
+                poll_video_generation_provider,
+                stitch_and_finalize,
                 send_completion_webhook,
             ],
         )
@@ -179,6 +179,31 @@ async def test_start_video_generation_provider():
         mock_provider.submit_image_to_video.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_upload_and_start_video_generation_provider_passes_runpod_path():
+    """Fused activity hands RunPod file paths straight to the provider."""
+    from videomerge.temporal.activities import upload_and_start_video_generation_provider
+
+    mock_provider = MagicMock()
+    mock_provider.submit_image_to_video = AsyncMock(return_value="video-job-789")
+
+    with patch("videomerge.temporal.activities.get_video_provider", return_value=mock_provider), \
+         patch("videomerge.config.RUN_ENV", "runpod"):
+        job_id = await upload_and_start_video_generation_provider(
+            "runpod",
+            "zoom in",
+            "/data/shared/run-1/000_image.png",
+            "run-1",
+            "video_wan2_2_14B_i2v",
+            720,
+            1280,
+            0,
+        )
+
+    assert job_id == "video-job-789"
+    assert mock_provider.submit_image_to_video.call_args.kwargs["image_input"] == "/data/shared/run-1/000_image.png"
+
+
 @pytest.mark.asyncio
 async def test_poll_video_generation_provider_fal(tmp_path):
     """Test poll_video_generation_provider activity with Fal."""
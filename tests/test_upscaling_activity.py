@@ -1,17 +1,12 @@
 import asyncio
 import base64
+import json
 import pytest
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import AsyncMock, Mock, patch, mock_open
 
 from videomerge.exceptions import NonRetryableError
 
 
-def _subprocess_result(stdout: str) -> Mock:
-    result = Mock()
-    result.stdout = stdout
-    return result
-
-
 class TestStartVideoUpscaling:
     def test_start_video_upscaling_uses_config_batch_size_and_returns_job_id(self):
         try:
@@ -22,14 +17,15 @@ class TestStartVideoUpscaling:
         with (
             patch.object(activities_module.activity, "heartbeat", autospec=True),
             patch.object(
-                activities_module.subprocess,
-                "run",
-                side_effect=[
-                    _subprocess_result("640x360"),
-                    _subprocess_result("300"),
-                ],
-                autospec=True,
-            ) as mock_run,
+                activities_module,
+                "_ffprobe_json",
+                AsyncMock(
+                    return_value={
+                        "streams": [{"width": 640, "height": 360, "nb_frames": "300"}],
+                        "format": {"duration": "10.0"},
+                    }
+                ),
+            ) as mock_probe,
             patch.object(
                 activities_module,
                 "open",
@@ -62,10 +58,10 @@ class TestStartVideoUpscaling:
                 async def __aexit__(self, exc_type, exc, tb):
                     return False
 
-                async def post(self, url, json, headers):
+                async def post(self, url, content, headers):
                     post_called["called"] = True
                     captured["url"] = url
-                    captured["json"] = json
+                    captured["json"] = json.loads(content)
                     captured["headers"] = headers
                     return _FakeResponse()
 
@@ -84,7 +80,45 @@ class TestStartVideoUpscaling:
             assert captured["headers"]["Authorization"] == "Bearer test-key"
             assert captured["json"]["input"]["batch_size"] == 21
             assert captured["json"]["input"]["output_resolution"] == 1920
-            assert mock_run.call_count == 2
+            assert captured["json"]["input"]["video"] == (
+                "data:video/mp4;base64," + base64.b64encode(b"fake-mp4-bytes").decode("ascii")
+            )
+            assert mock_probe.await_count == 1
+
+    def test_probe_falls_back_to_duration_times_fps(self):
+        try:
+            from videomerge.temporal import activities as activities_module
+        except ImportError as e:
+            pytest.skip(f"videomerge.temporal.activities import failed in this environment: {e}")
+
+        probe = {
+            "streams": [{"width": 640, "height": 360, "avg_frame_rate": "30000/1001"}],
+            "format": {"duration": "5.005"},
+        }
+        assert activities_module._parse_upscale_probe(probe) == (640, 360, 150)
+
+        with pytest.raises(RuntimeError, match="frame count"):
+            activities_module._parse_upscale_probe({"streams": [{"width": 640, "height": 360}], "format": {}})
+
+
+    def test_request_body_carries_optional_webhook(self, tmp_path):
+        try:
+            from videomerge.temporal import activities as activities_module
+        except ImportError as e:
+            pytest.skip(f"videomerge.temporal.activities import failed in this environment: {e}")
+
+        video = tmp_path / "clip.mp4"
+        video.write_bytes(b"fake-video-bytes")
+
+        body = json.loads(
+            activities_module._build_upscale_request_body(
+                str(video), {"width": 640}, "https://api.example.com/upscale/runpod/callback/wf-1"
+            )
+        )
+        assert body["webhook"] == "https://api.example.com/upscale/runpod/callback/wf-1"
+        assert body["input"]["width"] == 640
+
+        assert "webhook" not in json.loads(activities_module._build_upscale_request_body(str(video), {}))
 
 
 class TestSaveUpscaledVideo:
@@ -111,6 +145,20 @@ class TestSaveUpscaledVideo:
         assert expected.exists()
         assert expected.read_bytes() == raw
 
+    def test_write_base64_to_file_handles_line_wrapped_payload(self, tmp_path):
+        try:
+            from videomerge.temporal import activities as activities_module
+        except ImportError as e:
+            pytest.skip(f"videomerge.temporal.activities import failed in this environment: {e}")
+
+        raw = bytes(range(256)) * 64
+        encoded = base64.encodebytes(raw).decode("ascii")
+        out = tmp_path / "clip_upscaled.mp4"
+
+        asyncio.run(activities_module._write_base64_to_file(encoded, out))
+
+        assert out.read_bytes() == raw
+
 
 class TestPollUpscaleStatus:
     def test_poll_upscale_status_respects_queue_and_running_budgets(self, tmp_path):
@@ -288,3 +336,32 @@ class TestPollUpscaleStatus:
         ):
             with pytest.raises(NonRetryableError, match="image_style does not meet the constraints"):
                 asyncio.run(activities_module.poll_upscale_status(job_id, run_id, video_id))
+
+
+def _raise_non_retryable():
+    raise NonRetryableError("bad input video")
+
+
+class TestCallInMediaProcess:
+    def test_picklable_exception_type_is_preserved(self):
+        try:
+            from videomerge.temporal import activities as activities_module
+        except ImportError as e:
+            pytest.skip(f"videomerge.temporal.activities import failed in this environment: {e}")
+
+        with pytest.raises(NonRetryableError, match="bad input video"):
+            activities_module._call_in_media_process(_raise_non_retryable, (), {})
+
+    def test_http_exception_is_converted_to_runtime_error(self):
+        try:
+            from fastapi import HTTPException
+            from videomerge.temporal import activities as activities_module
+        except ImportError as e:
+            pytest.skip(f"videomerge.temporal.activities import failed in this environment: {e}")
+
+        def _raise_http():
+            raise HTTPException(status_code=500, detail="ffmpeg failed")
+
+        with pytest.raises(RuntimeError, match="ffmpeg failed") as excinfo:
+            activities_module._call_in_media_process(_raise_http, (), {})
+        assert not isinstance(excinfo.value, HTTPException)
@@ -32,3 +32,76 @@ def test_extract_frames_nonexistent_video():
         
         with pytest.raises(ValueError, match="Video file does not exist"):
             extract_first_and_last_frames(video_path, output_dir)
+
+
+def test_extract_frames_uses_single_ffmpeg_process(tmp_path):
+    """Both frames are written by one ffmpeg invocation."""
+    from unittest.mock import MagicMock, patch
+
+    video_path = tmp_path / "000_clip.mp4"
+    video_path.write_bytes(b"not-a-real-video")
+    output_dir = tmp_path / "frames"
+
+    with patch("videomerge.utils.video_frames.subprocess.run", return_value=MagicMock(returncode=0)) as mock_run:
+        first, last = extract_first_and_last_frames(video_path, output_dir)
+
+    mock_run.assert_called_once()
+    cmd = mock_run.call_args.args[0]
+    assert cmd.count(str(video_path)) == 2
+    assert cmd.index(str(first)) < cmd.index(str(last))
+    assert first.name == "000_clip_first.png"
+    assert last.name == "000_clip_last.png"
+
+
+def test_extract_frames_with_pyav_skips_ffmpeg(tmp_path):
+    """When PyAV is available both frames are decoded in-process."""
+    from unittest.mock import patch
+
+    try:
+        import av
+    except ImportError as exc:
+        pytest.skip(f"import failed: {exc}")
+
+    video_path = tmp_path / "000_clip.mp4"
+    with av.open(str(video_path), mode="w") as output:
+        stream = output.add_stream("mpeg4", rate=10)
+        stream.width = 64
+        stream.height = 64
+        stream.pix_fmt = "yuv420p"
+        for i in range(10):
+            frame = av.VideoFrame(64, 64, "yuv420p")
+            frame.pts = i
+            for packet in stream.encode(frame):
+                output.mux(packet)
+        for packet in stream.encode():
+            output.mux(packet)
+
+    with patch("videomerge.utils.video_frames.subprocess.run") as mock_run:
+        first, last = extract_first_and_last_frames(video_path, tmp_path / "frames")
+
+    mock_run.assert_not_called()
+    assert first.read_bytes()[:8] == b"\x89PNG\r\n\x1a\n"
+    assert last.read_bytes()[:8] == b"\x89PNG\r\n\x1a\n"
+
+
+def test_extract_frames_reuses_up_to_date_outputs(tmp_path):
+    """Existing frames newer than the video are returned without re-extracting."""
+    import os
+    from unittest.mock import MagicMock, patch
+
+    video_path = tmp_path / "000_clip.mp4"
+    video_path.write_bytes(b"not-a-real-video")
+    output_dir = tmp_path / "frames"
+    output_dir.mkdir()
+    for name in ("000_clip_first.png", "000_clip_last.png"):
+        (output_dir / name).write_bytes(b"png")
+    os.utime(video_path, (1_000, 1_000))
+
+    with patch("videomerge.utils.video_frames.av", None), patch(
+        "videomerge.utils.video_frames.subprocess.run", return_value=MagicMock(returncode=0)
+    ) as mock_run:
+        extract_first_and_last_frames(video_path, output_dir)
+        mock_run.assert_not_called()
+
+        extract_first_and_last_frames(video_path, output_dir, force=True)
+        mock_run.assert_called_once()
@@ -0,0 +1,42 @@
+"""Unit tests for webhook delivery in videomerge.services.webhook_manager."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+
+def _webhook_module():
+    try:
+        from videomerge.services import webhook_manager as module
+    except ImportError as exc:
+        pytest.skip(f"import failed: {exc}")
+    return module
+
+
+class TestSendWebhook:
+    async def test_client_error_is_not_retryable(self):
+        module = _webhook_module()
+        import httpx
+
+        from videomerge.exceptions import NonRetryableError
+
+        manager = module.WebhookManager()
+        response = httpx.Response(404, text="no such hook", request=httpx.Request("POST", "http://n8n/hook"))
+        with patch.object(manager._client, "post", new=AsyncMock(return_value=response)):
+            with pytest.raises(NonRetryableError):
+                await manager.send_webhook("http://n8n/hook", {"run_id": "r1"})
+
+    async def test_server_error_is_retryable(self):
+        module = _webhook_module()
+        import httpx
+
+        from videomerge.exceptions import NonRetryableError
+
+        manager = module.WebhookManager()
+        response = httpx.Response(503, text="busy", request=httpx.Request("POST", "http://n8n/hook"))
+        with patch.object(manager._client, "post", new=AsyncMock(return_value=response)):
+            with pytest.raises(RuntimeError) as exc_info:
+                await manager.send_webhook("http://n8n/hook", {"run_id": "r1"})
+        assert not isinstance(exc_info.value, NonRetryableError)
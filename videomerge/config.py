@@ -21,12 +21,14 @@ _OVERRIDE_ENV_PATH = Path(os.getenv("DATA_SHARED_BASE", "/data/shared")) / ".tab
 _LAST_OVERRIDE_MTIME: Optional[float] = None
 
 
-def _load_paths() -> tuple[Path, Path, Path]:
+def _load_paths() -> tuple[Path, Path, Path, Path | None]:
     """Load path-based configuration values from the environment."""
     tmp_base = Path(os.getenv("TMP_BASE", "/tmp/media"))
     data_shared_base = Path(os.getenv("DATA_SHARED_BASE", "/data/shared"))
     archive_folder = Path(os.getenv("TIKTOK_VIDEOS_ARCHIVE_FOLDER", "/data/shared/archived"))
-    return tmp_base, data_shared_base, archive_folder
+    comfyui_output_dir_raw = os.getenv("COMFYUI_OUTPUT_DIR")
+    comfyui_output_dir = Path(comfyui_output_dir_raw) if comfyui_output_dir_raw else None
+    return tmp_base, data_shared_base, archive_folder, comfyui_output_dir
 
 
 def _load_comfyui_defaults() -> tuple[str, bool, int, float, str, str | None, str | None, int, int, int]:
@@ -270,10 +272,51 @@ def _load_scene_classifier_defaults() -> tuple[bool, str, str, str | None]:
     return enabled, provider, model, openrouter_api_key
 
 
+def _load_concurrency_defaults() -> tuple[int, int]:
+    """Load child workflow concurrency limits from the environment."""
+    scene_concurrency = max(1, int(os.getenv("SCENE_CHILD_WORKFLOW_CONCURRENCY", "5")))
+    upscale_concurrency = max(1, int(os.getenv("UPSCALE_CHILD_WORKFLOW_CONCURRENCY", "5")))
+    return scene_concurrency, upscale_concurrency
+
+
+def _load_worker_defaults() -> tuple[str | None, int | None, int | None, int, int, bool]:
+    """Load Temporal worker task-queue routing and activity concurrency from the environment."""
+    render_task_queue = os.getenv("RENDER_TASK_QUEUE") or None
+    generation_max_raw = os.getenv("GENERATION_MAX_CONCURRENT_ACTIVITIES")
+    generation_max = max(1, int(generation_max_raw)) if generation_max_raw else None
+    upscale_max_raw = os.getenv("UPSCALE_MAX_CONCURRENT_ACTIVITIES")
+    upscale_max = max(1, int(upscale_max_raw)) if upscale_max_raw else None
+    render_max = max(1, int(os.getenv("RENDER_MAX_CONCURRENT_ACTIVITIES", "1")))
+    media_pool_workers = max(1, int(os.getenv("MEDIA_PROCESS_POOL_WORKERS", "1")))
+    disable_eager = _str_to_bool(os.getenv("TEMPORAL_DISABLE_EAGER_ACTIVITY_EXECUTION"), "false")
+    return render_task_queue, generation_max, upscale_max, render_max, media_pool_workers, disable_eager
+
+
+def _load_upscale_request_defaults() -> tuple[str | None, str | None, int, bool]:
+    """Load RunPod upscale submission options (completion callback, body compression)."""
+    callback_base_url = (os.getenv("UPSCALE_CALLBACK_BASE_URL") or "").strip().rstrip("/")
+    callback_token = (os.getenv("UPSCALE_CALLBACK_TOKEN") or "").strip()
+    callback_wait_seconds = max(0, int(os.getenv("UPSCALE_CALLBACK_WAIT_SECONDS", "600")))
+    gzip_request = _str_to_bool(os.getenv("UPSCALE_GZIP_REQUEST"), "false")
+    return callback_base_url or None, callback_token or None, callback_wait_seconds, gzip_request
+
+
+def _load_voiceover_cache_defaults() -> tuple[int, int]:
+    """Load voiceover cache eviction limits (entry TTL in seconds, max cached entries)."""
+    ttl_seconds = max(0, int(os.getenv("VOICEOVER_CACHE_TTL_SECONDS", "604800")))
+    max_entries = max(0, int(os.getenv("VOICEOVER_CACHE_MAX_ENTRIES", "500")))
+    return ttl_seconds, max_entries
+
+
+def _load_encoder_defaults() -> str:
+    """Load the ffmpeg video encoder used for final renders from the environment."""
+    return os.getenv("ENCODER", "libx264").strip() or "libx264"
+
+
 def _apply_config() -> None:
     """Populate module-level constants from current environment variables."""
-    global TMP_BASE, DATA_SHARED_BASE, TIKTOK_VIDEOS_ARCHIVE_FOLDER
-    TMP_BASE, DATA_SHARED_BASE, TIKTOK_VIDEOS_ARCHIVE_FOLDER = _load_paths()
+    global TMP_BASE, DATA_SHARED_BASE, TIKTOK_VIDEOS_ARCHIVE_FOLDER, COMFYUI_OUTPUT_DIR
+    TMP_BASE, DATA_SHARED_BASE, TIKTOK_VIDEOS_ARCHIVE_FOLDER, COMFYUI_OUTPUT_DIR = _load_paths()
 
     global VOICEOVER_SERVICE_URL, N8N_VOICEOVER_WEBHOOK_URL, VOICEOVER_API_KEY, SUBTITLE_CONFIG_PATH, TEMPORAL_SERVER_URL
     global GENERATE_SCENES_TIMEOUT_MINUTES, DEFAULT_ACTIVITY_TIMEOUT_MINUTES, STITCH_TIMEOUT_MINUTES
@@ -393,6 +436,38 @@ def _apply_config() -> None:
         OPENROUTER_API_KEY,
     ) = _load_scene_classifier_defaults()
 
+    global SCENE_CHILD_WORKFLOW_CONCURRENCY, UPSCALE_CHILD_WORKFLOW_CONCURRENCY
+    (
+        SCENE_CHILD_WORKFLOW_CONCURRENCY,
+        UPSCALE_CHILD_WORKFLOW_CONCURRENCY,
+    ) = _load_concurrency_defaults()
+
+    global RENDER_TASK_QUEUE, GENERATION_MAX_CONCURRENT_ACTIVITIES, RENDER_MAX_CONCURRENT_ACTIVITIES
+    global UPSCALE_MAX_CONCURRENT_ACTIVITIES, MEDIA_PROCESS_POOL_WORKERS
+    global TEMPORAL_DISABLE_EAGER_ACTIVITY_EXECUTION
+    (
+        RENDER_TASK_QUEUE,
+        GENERATION_MAX_CONCURRENT_ACTIVITIES,
+        UPSCALE_MAX_CONCURRENT_ACTIVITIES,
+        RENDER_MAX_CONCURRENT_ACTIVITIES,
+        MEDIA_PROCESS_POOL_WORKERS,
+        TEMPORAL_DISABLE_EAGER_ACTIVITY_EXECUTION,
+    ) = _load_worker_defaults()
+
+    global ENCODER
+    ENCODER = _load_encoder_defaults()
+
+    global UPSCALE_CALLBACK_BASE_URL, UPSCALE_CALLBACK_TOKEN, UPSCALE_CALLBACK_WAIT_SECONDS, UPSCALE_GZIP_REQUEST
+    (
+        UPSCALE_CALLBACK_BASE_URL,
+        UPSCALE_CALLBACK_TOKEN,
+        UPSCALE_CALLBACK_WAIT_SECONDS,
+        UPSCALE_GZIP_REQUEST,
+    ) = _load_upscale_request_defaults()
+
+    global VOICEOVER_CACHE_TTL_SECONDS, VOICEOVER_CACHE_MAX_ENTRIES
+    VOICEOVER_CACHE_TTL_SECONDS, VOICEOVER_CACHE_MAX_ENTRIES = _load_voiceover_cache_defaults()
+
 
 def _load_env() -> None:
     """Load environment variables from the .env file and shared override file if present."""
@@ -68,7 +68,7 @@ def _write_voiceover_metadata(run_dir: Path, audio_duration: float) -> None:
 def _save_hint_to_file(*, client_type: ClientType, hint: str, dest_path: Path) -> None:
     """Fetch an output hint from ComfyUI (local or RunPod) and save it to `dest_path`."""
 
-    client = get_comfyui_client(client_type, force_refresh=True)
+    client = get_comfyui_client(client_type)
     _filename, content = client.fetch_output_bytes(hint)
     dest_path.parent.mkdir(parents=True, exist_ok=True)
     dest_path.write_bytes(content)
@@ -85,8 +85,8 @@ def _prepare_image_input_for_video(*, image_hint: str) -> str:
     if image_hint.startswith("data:image/"):
         return image_hint
 
-    image_client = get_comfyui_client(ClientType.IMAGE, force_refresh=True)
-    video_client = get_comfyui_client(ClientType.VIDEO, force_refresh=True)
+    image_client = get_comfyui_client(ClientType.IMAGE)
+    video_client = get_comfyui_client(ClientType.VIDEO)
     filename, content = image_client.fetch_output_bytes(image_hint)
     uploaded = video_client.upload_image_to_input(filename, content, overwrite=True)
     return uploaded
@@ -129,8 +129,8 @@ async def run_test(req: TestRunRequest) -> TestRunResponse:
         image_files: List[str] = []
         video_files: List[str] = []
 
-        image_client = get_comfyui_client(ClientType.IMAGE, force_refresh=True)
-        video_client = get_comfyui_client(ClientType.VIDEO, force_refresh=True)
+        image_client = get_comfyui_client(ClientType.IMAGE)
+        video_client = get_comfyui_client(ClientType.VIDEO)
 
         for index, prompt in enumerate(scene_prompts):
             image_prompt = prompt.get("image_prompt") if isinstance(prompt, dict) else None
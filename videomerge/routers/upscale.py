@@ -1,12 +1,15 @@
+import hmac
+
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import JSONResponse
 from temporalio.client import Client
 from temporalio.exceptions import WorkflowAlreadyStartedError
 from temporalio.common import WorkflowIDReusePolicy
+from temporalio.service import RPCError, RPCStatusCode
 
 from videomerge.config import TEMPORAL_SERVER_URL
 from videomerge.models import UpscaleStartRequest
-from videomerge.temporal.workflows import VideoUpscalingWorkflow
+from videomerge.temporal.workflows import VideoUpscalingChildWorkflow, VideoUpscalingWorkflow
 from videomerge.services.metrics import jobs_enqueued_total
 from videomerge.utils.logging import get_logger
 
@@ -64,3 +67,31 @@ async def upscale_start(req: UpscaleStartRequest):
     except Exception as e:
         logger.error(f"Failed to start upscaling workflow with workflow_id={workflow_id}: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to start upscaling workflow: {e}")
+
+
+@router.post("/upscale/runpod/callback/{workflow_id}")
+async def upscale_runpod_callback(workflow_id: str, token: str = ""):
+    """RunPod completion webhook: wake the upscaling child workflow waiting on this job.
+
+    The callback URL carries the shared UPSCALE_CALLBACK_TOKEN as ``?token=``;
+    requests without it are rejected. The request body (which carries the
+    base64 video) is deliberately not read; the workflow fetches the result
+    through its status poll.
+    """
+    from videomerge.config import UPSCALE_CALLBACK_TOKEN
+
+    if not UPSCALE_CALLBACK_TOKEN or not hmac.compare_digest(token.encode("utf-8"), UPSCALE_CALLBACK_TOKEN.encode("utf-8")):
+        logger.warning("Rejected RunPod upscale callback for workflow_id=%s: invalid token", workflow_id)
+        raise HTTPException(status_code=403, detail="Invalid callback token")
+
+    logger.info("Received RunPod upscale callback for workflow_id=%s", workflow_id)
+    client = await Client.connect(TEMPORAL_SERVER_URL)
+    try:
+        handle = client.get_workflow_handle(workflow_id)
+        await handle.signal(VideoUpscalingChildWorkflow.upscale_job_finished)
+    except RPCError as e:
+        if e.status == RPCStatusCode.NOT_FOUND:
+            raise HTTPException(status_code=404, detail=f"No running workflow with id {workflow_id}")
+        logger.error(f"Failed to signal upscaling workflow_id={workflow_id}: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to signal upscaling workflow: {e}")
+    return JSONResponse(content={"workflow_id": workflow_id, "signalled": True}, status_code=200)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import re
 from abc import ABC, abstractmethod
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
@@ -21,6 +22,27 @@ from videomerge.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+_ENDPOINT_ID_PATTERNS = (
+    (re.compile(r"^history/[^/]+$"), "history/{prompt_id}"),
+    (re.compile(r"^v2/[^/]+/status/[^/]+$"), "v2/{instance_id}/status/{job_id}"),
+    (re.compile(r"^v2/[^/]+/(run|runsync)$"), r"v2/{instance_id}/\1"),
+    (re.compile(r"^output/.+$"), "output/{filename}"),
+)
+
+
+def endpoint_label(base_url: str, url: str) -> str:
+    """Return the metrics ``endpoint`` label for ``url``.
+
+    Prompt, job and instance ids are collapsed into placeholders so the label
+    set stays bounded no matter how many prompts are polled.
+    """
+    endpoint = url.replace(base_url.rstrip('/'), '').lstrip('/').split('?', 1)[0]
+    for pattern, label in _ENDPOINT_ID_PATTERNS:
+        if pattern.match(endpoint):
+            return pattern.sub(label, endpoint)
+    return endpoint
+
+
 class ClientType(Enum):
     """Type of ComfyUI client."""
     IMAGE = "image"
@@ -99,14 +121,24 @@ class ComfyUIClient(ABC):
         """Fetch a single output file as bytes."""
         pass
 
+    def fetch_output_to_file(self, hint: str, dest_dir: Path) -> Path:
+        """Fetch a single output file straight to ``dest_dir`` and return its path.
+
+        Unlike :meth:`fetch_output_bytes` this never holds the whole file in memory.
+        """
+        return self.download_outputs([hint], dest_dir)[0]
+
     @abstractmethod
-    def upload_image_to_input(self, filename: str, content: bytes, overwrite: bool = True) -> str:
-        """Upload image to ComfyUI input directory."""
+    def upload_image_to_input(self, filename: str, content: bytes | BinaryIO, overwrite: bool = True) -> str:
+        """Upload image to ComfyUI input directory.
+
+        ``content`` may be raw bytes or a binary file object, which is streamed.
+        """
         pass
 
     def _make_request(self, method: str, url: str, **kwargs) -> requests.Response:
         """Make HTTP request with metrics collection."""
-        endpoint = url.replace(self.base_url.rstrip('/'), '').lstrip('/')
+        endpoint = endpoint_label(self.base_url, url)
 
         with comfyui_request_seconds.labels(endpoint=endpoint).time():
             try:
@@ -118,6 +150,10 @@ class ComfyUIClient(ABC):
                 comfyui_requests_total.labels(endpoint=endpoint, status='5xx').inc()
                 raise
 
+    def default_headers(self) -> Dict[str, str]:
+        """Request headers for callers issuing their own HTTP requests to this instance."""
+        return self._default_headers()
+
     def _default_headers(self) -> Dict[str, str]:
         """Headers that mimic browser requests to satisfy certain proxies."""
         try:
@@ -67,10 +67,8 @@ def get_comfyui_client(client_type: ClientType = ClientType.IMAGE, force_refresh
     """
     global _image_client, _video_client, _image_client_config_hash, _video_client_config_hash
 
-    from videomerge.config import ensure_config_current
-
-    ensure_config_current()
-
+    # _get_config_hash() runs ensure_config_current(), so the cached client is
+    # reused until the .env/override files actually change.
     current_config_hash = _get_config_hash(client_type)
 
     if client_type == ClientType.IMAGE:
@@ -1,16 +1,55 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import os
+import shutil
 import time
 import uuid
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Dict, List, Optional, Tuple
 
 from videomerge.services.comfyui.base import ComfyUIClient
 from videomerge.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = get_logger(__name__)
 
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
+def _link_or_copy_local_output(src: Path, dst: Path) -> bool:
+    """Materialize a ComfyUI output that is visible on the local filesystem.
+
+    Hard-links ``src`` to ``dst`` when both live on the same device, otherwise
+    falls back to ``shutil.copyfile`` (which uses ``os.sendfile`` on Linux).
+    Returns ``False`` when ``src`` is not available so callers can fall back to
+    downloading over HTTP.
+    """
+    try:
+        src_stat = src.stat()
+    except OSError:
+        return False
+
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if dst.exists():
+        dst.unlink()
+    if src_stat.st_dev == dst.parent.stat().st_dev:
+        try:
+            os.link(src, dst)
+            return True
+        except OSError as exc:
+            logger.debug("[comfyui] Hard link %s -> %s failed, copying instead: %s", src, dst, exc)
+    shutil.copyfile(src, dst)
+    return True
+
+
+def _partial_download_path(out_path: Path) -> Path:
+    """Sibling temp path a download streams into before being renamed onto ``out_path``."""
+    return out_path.with_name(out_path.name + ".part")
+
 
 class LocalComfyUIClient(ComfyUIClient):
     """ComfyUI client for local development environment."""
@@ -184,8 +223,10 @@ class LocalComfyUIClient(ComfyUIClient):
         prefer_node_ids: Optional[List[str]] = None,
     ) -> List[str]:
         """Poll local ComfyUI until outputs are available."""
-        hist_url = f"{self.base_url}/history"
-        logger.info("[comfyui] Polling history for prompt_id=%s (via /history)", prompt_id)
+        # /history/{prompt_id} returns only this prompt's entry instead of the
+        # full server history, keeping each poll small on busy instances.
+        hist_url = f"{self.base_url}/history/{prompt_id}"
+        logger.info("[comfyui] Polling history for prompt_id=%s (via /history/{prompt_id})", prompt_id)
         deadline = time.time() + timeout_s
         last_error = None
         attempts = 0
@@ -236,12 +277,22 @@ class LocalComfyUIClient(ComfyUIClient):
 
     def download_outputs(self, file_hints: List[str], dest_dir: Path) -> List[Path]:
         """Download output files from local ComfyUI."""
+        # Read at call time so a hot-reloaded COMFYUI_OUTPUT_DIR takes effect.
+        from videomerge.config import COMFYUI_OUTPUT_DIR
+
         saved: List[Path] = []
         for hint in file_hints:
             if "/" in hint:
                 subfolder, filename = hint.rsplit("/", 1)
             else:
                 subfolder, filename = "", hint
+            out_path = dest_dir / filename
+            if COMFYUI_OUTPUT_DIR is not None and _link_or_copy_local_output(
+                COMFYUI_OUTPUT_DIR / subfolder / filename, out_path
+            ):
+                logger.info("[comfyui] Linked output %s from %s", hint, COMFYUI_OUTPUT_DIR)
+                saved.append(out_path)
+                continue
             params = {"filename": filename, "type": "output"}
             if subfolder:
                 params["subfolder"] = subfolder
@@ -250,11 +301,83 @@ class LocalComfyUIClient(ComfyUIClient):
             r = self._make_request("GET", url, params=params, stream=True, timeout=60, headers=self._default_headers())
             r.raise_for_status()
             dest_dir.mkdir(parents=True, exist_ok=True)
-            out_path = dest_dir / filename
-            with out_path.open("wb") as f:
-                for chunk in r.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            r.raw.decode_content = True
+            # Stream into a temp file and rename it into place, so an interrupted
+            # attempt never leaves a truncated output under the final name.
+            part_path = _partial_download_path(out_path)
+            try:
+                with part_path.open("wb") as f:
+                    shutil.copyfileobj(r.raw, f, length=_DOWNLOAD_CHUNK_SIZE)
+                os.replace(part_path, out_path)
+            except BaseException:
+                part_path.unlink(missing_ok=True)
+                raise
+            saved.append(out_path)
+        return saved
+
+    def parse_history_response(self, prompt_id: str, data: Dict[str, Any]) -> Optional[List[str]]:
+        """Output hints from a ``/history/{prompt_id}`` payload, or None while the prompt is pending."""
+        hist = data.get("history") or data
+        entry = hist.get(prompt_id) or {}
+        status = entry.get("status") or {}
+        if entry and (not status or status.get("completed")):
+            outputs = self._parse_history_outputs({prompt_id: entry})
+            if outputs:
+                return [f"{sf + '/' if sf else ''}{fn}" for (fn, sf) in outputs]
+        return None
+
+    async def download_outputs_async(
+        self,
+        file_hints: List[str],
+        dest_dir: Path,
+        *,
+        http_client: "httpx.AsyncClient",
+        output_name: Optional[Callable[[str], str]] = None,
+    ) -> List[Path]:
+        """Async counterpart of :meth:`download_outputs` on a caller-owned ``httpx.AsyncClient``.
+
+        Outputs are linked from ``COMFYUI_OUTPUT_DIR`` when it is mounted, otherwise
+        streamed from ``/view`` in 1 MB chunks into a ``.part`` file that is renamed
+        into place once complete. Filesystem work runs in worker
+        threads so the event loop never blocks on disk. ``output_name`` maps a
+        ComfyUI filename to the name it is saved under.
+        """
+        from videomerge.config import COMFYUI_OUTPUT_DIR
+
+        headers = self._default_headers()
+        saved: List[Path] = []
+        for hint in file_hints:
+            if "/" in hint:
+                subfolder, filename = hint.rsplit("/", 1)
+            else:
+                subfolder, filename = "", hint
+            out_path = dest_dir / (output_name(filename) if output_name else filename)
+            if COMFYUI_OUTPUT_DIR is not None and await asyncio.to_thread(
+                _link_or_copy_local_output, COMFYUI_OUTPUT_DIR / subfolder / filename, out_path
+            ):
+                logger.info("[comfyui] Linked output %s from %s", hint, COMFYUI_OUTPUT_DIR)
+                saved.append(out_path)
+                continue
+            params = {"filename": filename, "type": "output"}
+            if subfolder:
+                params["subfolder"] = subfolder
+            url = f"{self.base_url}/view"
+            logger.info("[comfyui] Downloading output %s from %s", hint, url)
+            async with http_client.stream("GET", url, params=params, headers=headers, timeout=60.0) as response:
+                response.raise_for_status()
+                await asyncio.to_thread(dest_dir.mkdir, parents=True, exist_ok=True)
+                part_path = _partial_download_path(out_path)
+                try:
+                    f = await asyncio.to_thread(part_path.open, "wb")
+                    try:
+                        async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                            await asyncio.to_thread(f.write, chunk)
+                    finally:
+                        await asyncio.to_thread(f.close)
+                    await asyncio.to_thread(os.replace, part_path, out_path)
+                except BaseException:
+                    await asyncio.to_thread(part_path.unlink, missing_ok=True)
+                    raise
             saved.append(out_path)
         return saved
 
@@ -272,7 +395,7 @@ class LocalComfyUIClient(ComfyUIClient):
         r.raise_for_status()
         return filename, r.content
 
-    def upload_image_to_input(self, filename: str, content: bytes, overwrite: bool = True) -> str:
+    def upload_image_to_input(self, filename: str, content: bytes | BinaryIO, overwrite: bool = True) -> str:
         """Upload image to local ComfyUI input directory."""
         url = f"{self.base_url}/upload/image"
         files = {"image": (filename, content, "application/octet-stream")}
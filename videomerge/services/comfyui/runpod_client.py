@@ -2,13 +2,20 @@ from __future__ import annotations
 
 import base64
 import json
+import logging
 import time
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
 
+try:
+    # SIMD base64 for the large video payloads; same b64encode/b64decode API.
+    import pybase64 as _fast_base64
+except ImportError:  # pragma: no cover - pybase64 is optional
+    _fast_base64 = base64
+
 from videomerge.config import (
     IMAGE_WIDTH,
     IMAGE_HEIGHT,
@@ -141,7 +148,8 @@ class RunPodComfyUIClient(ComfyUIClient):
 
             url = f"{self.base_url}/v2/{self.instance_id}/run"
             headers = self._default_headers()
-            logger.debug("[comfyui] RunPod T2I payload: %s", json.dumps(payload, indent=2))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[comfyui] RunPod T2I payload: %s", json.dumps(payload, indent=2))
             
             resp = self._make_request(
                 "POST",
@@ -224,7 +232,7 @@ class RunPodComfyUIClient(ComfyUIClient):
                 if not mime_type:
                     mime_type = "image/png"
                     
-                b64_data = base64.b64encode(content).decode("utf-8")
+                b64_data = _fast_base64.b64encode(content).decode("utf-8")
                 filename = Path(image_data).name
                 clean_image_data = f"data:{mime_type};base64,{b64_data}"
                 logger.debug(f"[comfyui] Converted local file {filename} to base64 data URL")
@@ -265,7 +273,8 @@ class RunPodComfyUIClient(ComfyUIClient):
 
             url = f"{self.base_url}/v2/{self.instance_id}/run"
             headers = self._default_headers()
-            logger.debug("[comfyui] RunPod I2V payload: %s", json.dumps(payload, indent=2))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[comfyui] RunPod I2V payload: %s", json.dumps(payload, indent=2))
             
             resp = self._make_request(
                 "POST",
@@ -324,7 +333,8 @@ class RunPodComfyUIClient(ComfyUIClient):
                 resp.raise_for_status()
                 data = resp.json()
                 
-                logger.debug("[comfyui] RunPod status response: %s", json.dumps(data, indent=2))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[comfyui] RunPod status response: %s", json.dumps(data, indent=2))
                 
                 raw_status = data.get("status", "")
                 status = raw_status.upper()
@@ -392,7 +402,6 @@ class RunPodComfyUIClient(ComfyUIClient):
         
         try:
             frames_dir = dest_dir / "first_last"
-            frames_dir.mkdir(parents=True, exist_ok=True)
             
             logger.info(f"[comfyui] Extracting first and last frames from {video_path.name}")
             first_frame, last_frame = extract_first_and_last_frames(video_path, frames_dir)
@@ -421,7 +430,7 @@ class RunPodComfyUIClient(ComfyUIClient):
                     media_type = media_type.split(";", 1)[0]
 
                 try:
-                    decoded = base64.b64decode(data_part.strip())
+                    decoded = _fast_base64.b64decode(data_part.strip())
                 except Exception as exc:
                     logger.warning("[comfyui] Failed to decode base64 output: %s", exc)
                     continue
@@ -491,7 +500,7 @@ class RunPodComfyUIClient(ComfyUIClient):
                 if ";" in media_type:
                     media_type = media_type.split(";", 1)[0]
 
-                decoded_data = base64.b64decode(data_part.strip())
+                decoded_data = _fast_base64.b64decode(data_part.strip())
                 filename = output_filename_for_index(
                     media_type=media_type,
                     provided=filename_meta,
@@ -524,7 +533,7 @@ class RunPodComfyUIClient(ComfyUIClient):
             logger.warning("[comfyui] Failed to fetch %s from generic endpoint: %s", hint, e)
             raise
 
-    def upload_image_to_input(self, filename: str, content: bytes, overwrite: bool = True) -> str:
+    def upload_image_to_input(self, filename: str, content: bytes | BinaryIO, overwrite: bool = True) -> str:
         """Upload image to RunPod for processing."""
         raise NotImplementedError(
             "upload_image_to_input is not supported for RunPod serverless ComfyUI. "
@@ -6,22 +6,25 @@ from pathlib import Path
 from typing import Any, List, Optional
 
 
+_EXTENSION_MEDIA_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+    ".mp4": "video/mp4",
+}
+
+
 def guess_media_type(filename: Optional[str], media_hint: Optional[str]) -> str:
     """Guess MIME type from filename or media hint."""
     if media_hint and "/" in media_hint:
         return media_hint.lower()
     if filename:
-        lower = filename.lower()
-        if lower.endswith(".png"):
-            return "image/png"
-        if lower.endswith(".jpg") or lower.endswith(".jpeg"):
-            return "image/jpeg"
-        if lower.endswith(".webp"):
-            return "image/webp"
-        if lower.endswith(".gif"):
-            return "image/gif"
-        if lower.endswith(".mp4"):
-            return "video/mp4"
+        # Lower-case only the extension rather than the whole filename.
+        _, dot, ext = filename.rpartition(".")
+        if dot:
+            return _EXTENSION_MEDIA_TYPES.get("." + ext.lower(), "application/octet-stream")
     return "application/octet-stream"
 
 
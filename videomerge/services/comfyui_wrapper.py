@@ -14,6 +14,7 @@ from videomerge.config import (
     COMFYUI_POLL_INTERVAL_SECONDS,
 )
 from videomerge.utils.logging import get_logger
+from videomerge.services.comfyui.base import endpoint_label
 from videomerge.services.metrics import (
     comfyui_requests_total,
     comfyui_request_seconds,
@@ -24,7 +25,7 @@ logger = get_logger(__name__)
 
 def _make_comfyui_request(method: str, url: str, **kwargs) -> requests.Response:
     """Make HTTP request to ComfyUI with metrics collection."""
-    endpoint = url.replace(COMFYUI_URL.rstrip('/'), '').lstrip('/')
+    endpoint = endpoint_label(COMFYUI_URL, url)
 
     with comfyui_request_seconds.labels(endpoint=endpoint).time():
         try:
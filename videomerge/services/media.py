@@ -1,8 +1,20 @@
+import functools
 import subprocess
 from pathlib import Path
 from typing import Optional, List
 from fastapi import HTTPException
 
+from videomerge.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Encoder-specific ffmpeg arguments; libx264 is the software default.
+_VIDEO_ENCODER_ARGS = {
+    "libx264": ["-c:v", "libx264", "-preset", "veryfast", "-crf", "23"],
+    "h264_nvenc": ["-c:v", "h264_nvenc", "-preset", "p4", "-b:v", "6M"],
+    "h264_videotoolbox": ["-c:v", "h264_videotoolbox", "-b:v", "6M"],
+}
+
 
 def run_ffmpeg(cmd: List[str]) -> None:
     result = subprocess.run(cmd, capture_output=True, text=True)
@@ -59,3 +71,48 @@ def get_duration(file_path: Path) -> Optional[float]:
         return None
     except Exception:
         return None
+
+
+def get_video_stream_signature(file_path: Path) -> Optional[tuple]:
+    """Return (codec, width, height, frame rate, pix_fmt) of the first video stream, or None."""
+    try:
+        cmd = [
+            'ffprobe', '-v', 'quiet', '-select_streams', 'v:0',
+            '-show_entries', 'stream=codec_name,width,height,r_frame_rate,pix_fmt',
+            '-of', 'csv=p=0', str(file_path)
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode == 0 and result.stdout.strip():
+            return tuple(result.stdout.strip().splitlines()[0].split(','))
+        return None
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_video_encoder(requested: str) -> str:
+    """Return ``requested`` if this ffmpeg build provides it, else fall back to libx264."""
+    if requested == "libx264":
+        return requested
+    if requested not in _VIDEO_ENCODER_ARGS:
+        logger.warning("Unsupported ENCODER=%s, falling back to libx264", requested)
+        return "libx264"
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"], capture_output=True, text=True
+        )
+        available = result.returncode == 0 and requested in result.stdout
+    except Exception:
+        available = False
+    if not available:
+        logger.warning("ffmpeg encoder %s is not available, falling back to libx264", requested)
+        return "libx264"
+    return requested
+
+
+def video_encoder_args(encoder: Optional[str] = None) -> List[str]:
+    """ffmpeg ``-c:v`` arguments for the configured (or given) final-render encoder."""
+    if encoder is None:
+        from videomerge.config import ENCODER
+        encoder = ENCODER
+    return list(_VIDEO_ENCODER_ARGS[resolve_video_encoder(encoder)])
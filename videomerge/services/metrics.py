@@ -186,6 +186,24 @@ comfyui_request_seconds = Histogram(
 )
 
 
+# Every value get_length_bucket() can return. Children for each bucket are
+# created up front so hot paths skip .labels() and dashboards see all series
+# from startup instead of only after the first observation.
+LENGTH_BUCKETS = ("15", "30", "45")
+
+
+def _length_bucket_children(metric):
+    return {bucket: metric.labels(length_bucket=bucket) for bucket in LENGTH_BUCKETS}
+
+
+voiceover_length_seconds_by_bucket = _length_bucket_children(voiceover_length_seconds)
+total_images_generation_seconds_by_bucket = _length_bucket_children(total_images_generation_seconds)
+total_videos_generation_seconds_by_bucket = _length_bucket_children(total_videos_generation_seconds)
+videos_completed_total_by_bucket = _length_bucket_children(videos_completed_total)
+stitch_seconds_by_bucket = _length_bucket_children(stitch_seconds)
+subtitles_seconds_by_bucket = _length_bucket_children(subtitles_seconds)
+
+
 def get_length_bucket(length_seconds: float) -> str:
     """Map a raw audio/video length in seconds to a 15/30/45 second bucket."""
     if length_seconds <= 20:
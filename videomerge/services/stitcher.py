@@ -11,8 +11,9 @@ from videomerge.services.subtitles import (
     build_chunks_from_words,
     write_srt_from_chunks,
     burn_subtitles,
+    build_subtitle_filter,
 )
-from videomerge.services.media import get_duration
+from videomerge.services.media import get_duration, get_video_stream_signature, video_encoder_args
 from videomerge.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -69,7 +70,27 @@ def _compute_clip_plan(video_paths: List[Path], voiceover_duration: float, video
     return selected, 0.0, False
 
 
-def concat_videos(video_paths: Iterable[Path], output_path: Path) -> Path:
+def _concat_list_text(video_paths: Iterable[Path]) -> str:
+    """Render a concat-demuxer input list for the given (already Path) clips."""
+    return "".join(f"file '{p.resolve().as_posix()}'\n" for p in video_paths)
+
+
+def _clips_share_stream_format(video_paths: List[Path]) -> bool:
+    """True when every clip has the same video codec/size/fps/pix_fmt, so the
+    concat demuxer output can be stream-copied instead of re-encoded."""
+    first = None
+    for p in video_paths:
+        sig = get_video_stream_signature(p)
+        if sig is None:
+            return False
+        if first is None:
+            first = sig
+        elif sig != first:
+            return False
+    return first is not None
+
+
+def concat_videos(video_paths: Iterable[str | Path], output_path: str | Path) -> Path:
     """Concat the given video files into output_path using ffmpeg (no voiceover).
 
     Robust against non-seekable/network volumes by writing to a local temp file first
@@ -85,18 +106,21 @@ def concat_videos(video_paths: Iterable[Path], output_path: Path) -> Path:
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     concat_list = output_path.parent / "inputs.txt"
-    with open(concat_list, "w", encoding="utf-8") as f:
-        for p in video_paths:
-            f.write(f"file '{Path(p).resolve().as_posix()}'\n")
+    concat_list.write_text(_concat_list_text(video_paths), encoding="utf-8")
+
+    stream_copy = _clips_share_stream_format(video_paths)
 
     def _run_ffmpeg(dst: Path, with_faststart: bool) -> subprocess.CompletedProcess:
         cmd = [
             'ffmpeg', '-hide_banner', '-loglevel', 'error', '-y',
             '-f', 'concat', '-safe', '0',
             '-i', str(concat_list),
-            '-c:v', 'libx264', '-preset', 'veryfast', '-crf', '23',
-            '-an',
         ]
+        if stream_copy:
+            cmd += ['-c:v', 'copy']
+        else:
+            cmd += ['-c:v', 'libx264', '-preset', 'veryfast', '-crf', '23']
+        cmd += ['-an']
         if with_faststart:
             cmd += ['-movflags', '+faststart']
         cmd += [str(dst)]
@@ -115,6 +139,10 @@ def concat_videos(video_paths: Iterable[Path], output_path: Path) -> Path:
         if result.returncode != 0 and "Error writing trailer" in (result.stderr or ""):
             logger.warning("[stitcher] ffmpeg reported trailer write error. Retrying without +faststart.")
             result = _run_ffmpeg(tmp_path, with_faststart=False)
+        if result.returncode != 0 and stream_copy:
+            logger.warning("[stitcher] Stream-copy concat failed, retrying with re-encode.")
+            stream_copy = False
+            result = _run_ffmpeg(tmp_path, with_faststart=True)
         if result.returncode != 0:
             raise RuntimeError(f"FFmpeg concat error: {result.stderr}")
         if not tmp_path.exists() or tmp_path.stat().st_size == 0:
@@ -142,10 +170,12 @@ def concat_videos(video_paths: Iterable[Path], output_path: Path) -> Path:
 
 
 def concat_videos_with_voiceover(
-    video_paths: Iterable[Path],
-    voiceover_path: Path,
-    output_path: Path,
+    video_paths: Iterable[str | Path],
+    voiceover_path: str | Path,
+    output_path: str | Path,
     video_speed_factor: float = 1.0,
+    subtitle_filter: str | None = None,
+    encoder: str | None = None,
 ) -> Path:
     """Concat the given video files and mix with the given voiceover into output_path using ffmpeg.
 
@@ -160,6 +190,10 @@ def concat_videos_with_voiceover(
         video_speed_factor: Playback speed multiplier for the video stream
             (e.g. 1.2 = 20 % faster). The voiceover is left untouched so
             it acts as the timing reference via ``-shortest``.
+        subtitle_filter: Optional ffmpeg ``subtitles=`` filter appended to the
+            video chain so subtitles are burned in during the concat encode.
+        encoder: ffmpeg video encoder for the output; defaults to ``ENCODER``
+            from config (falls back to libx264 if unavailable).
     """
     video_paths = [Path(p) for p in video_paths]
     voiceover_path = Path(voiceover_path)
@@ -234,9 +268,7 @@ def concat_videos_with_voiceover(
     import tempfile
     temp_dir = Path(tempfile.gettempdir())
     concat_list = temp_dir / f"inputs_{output_path.stem}.txt"
-    with open(str(concat_list), "w", encoding="utf-8") as f:
-        for p in selected_paths:
-            f.write(f"file '{Path(p).resolve().as_posix()}'\n")
+    concat_list.write_text(_concat_list_text(selected_paths), encoding="utf-8")
 
     # video_too_short defaults to False if duration probing failed above
     if 'video_too_short' not in dir():
@@ -250,6 +282,17 @@ def concat_videos_with_voiceover(
             video_speed_factor, pts_factor,
         )
 
+    # Homogeneous clips with no video filtering (speed-up, subtitles) and no
+    # re-encoded trimmed tail can be remuxed instead of re-encoded.
+    stream_copy = (
+        not apply_speed
+        and not subtitle_filter
+        and trimmed_temp is None
+        and _clips_share_stream_format(selected_paths)
+    )
+    if stream_copy:
+        logger.info("[stitcher] Clips share codec/resolution/fps; stream-copying video")
+
     def _run_ffmpeg(dst: Path, with_faststart: bool) -> subprocess.CompletedProcess:
         cmd = [
             'ffmpeg', '-hide_banner', '-loglevel', 'error', '-y',
@@ -260,27 +303,29 @@ def concat_videos_with_voiceover(
         # Build filter_complex: optionally speed up video, loop if video is shorter than audio,
         # always normalise audio.
         audio_filter = "[1:a]loudnorm=I=-14:TP=-1.5:LRA=7[aud]"
-        if video_too_short:
-            # Video is shorter than audio after speedup. Apply speed if needed, then let
-            # ffmpeg run until -t (voiceover duration) — it will hold the last frame
-            # automatically. No loop filter needed (avoids massive frame buffering).
-            if apply_speed:
-                video_filter = f"[0:v]setpts={pts_factor:.6f}*PTS[vid]"
-                cmd += ['-filter_complex', f'{video_filter};{audio_filter}', '-map', '[vid]', '-map', '[aud]']
-            else:
-                cmd += ['-filter_complex', audio_filter, '-map', '0:v:0', '-map', '[aud]']
-            cmd += ['-t', f"{vo_dur_val:.3f}"]
-        elif apply_speed:
-            video_filter = f"[0:v]setpts={pts_factor:.6f}*PTS[vid]"
+        video_steps: List[str] = []
+        if apply_speed:
+            video_steps.append(f"setpts={pts_factor:.6f}*PTS")
+        if subtitle_filter:
+            # Burn subtitles in the same pass so the video is only encoded once.
+            video_steps.append(subtitle_filter)
+        if video_steps:
+            video_filter = f"[0:v]{','.join(video_steps)}[vid]"
             cmd += ['-filter_complex', f'{video_filter};{audio_filter}', '-map', '[vid]', '-map', '[aud]']
         else:
             cmd += ['-filter_complex', audio_filter, '-map', '0:v:0', '-map', '[aud]']
-        if not video_too_short:
+        if video_too_short:
+            # Video is shorter than audio after speedup. Let ffmpeg run until -t
+            # (voiceover duration) — it will hold the last frame automatically.
+            # No loop filter needed (avoids massive frame buffering).
+            cmd += ['-t', f"{vo_dur_val:.3f}"]
+        else:
             cmd += ['-shortest']
-        cmd += [
-            '-c:v', 'libx264', '-preset', 'veryfast', '-crf', '23',
-            '-c:a', 'aac',
-        ]
+        if stream_copy:
+            cmd += ['-c:v', 'copy']
+        else:
+            cmd += video_encoder_args(encoder)
+        cmd += ['-c:a', 'aac']
         if with_faststart:
             cmd += ['-movflags', '+faststart']
         cmd += [str(dst)]
@@ -299,6 +344,10 @@ def concat_videos_with_voiceover(
         if result.returncode != 0 and "Error writing trailer" in (result.stderr or ""):
             logger.warning("[stitcher] ffmpeg reported trailer write error. Retrying without +faststart.")
             result = _run_ffmpeg(tmp_path, with_faststart=False)
+        if result.returncode != 0 and stream_copy:
+            logger.warning("[stitcher] Stream-copy concat failed, retrying with re-encode.")
+            stream_copy = False
+            result = _run_ffmpeg(tmp_path, with_faststart=True)
         if result.returncode != 0:
             raise RuntimeError(f"FFmpeg concat error: {result.stderr}")
         if not tmp_path.exists() or tmp_path.stat().st_size == 0:
@@ -319,7 +368,16 @@ def concat_videos_with_voiceover(
     return output_path
 
 
-def generate_and_burn_subtitles(input_video: Path, final_path: Path, *, language: str, model_size: str = 'small', position: str = 'bottom', audio_hint: Path | None = None) -> Path:
+def transcribe_to_srt(audio_path: str | Path, srt_path: str | Path, *, language: str, model_size: str = 'small') -> Path:
+    """Transcribe audio_path with Whisper and write the subtitle chunks to srt_path."""
+    srt_path = Path(srt_path)
+    segments = run_whisper_segments(Path(audio_path), language=language, model_size=model_size)
+    chunks = build_chunks_from_words(segments, max_words=4, min_chunk_duration=0.6)
+    write_srt_from_chunks(chunks, srt_path)
+    return srt_path
+
+
+def generate_and_burn_subtitles(input_video: str | Path, final_path: str | Path, *, language: str, model_size: str = 'small', position: str = 'bottom', audio_hint: str | Path | None = None, encoder: str | None = None) -> Path:
     """Generate subtitles for input_video and burn them into final_path."""
     input_video = Path(input_video)
     final_path = Path(final_path)
@@ -327,12 +385,37 @@ def generate_and_burn_subtitles(input_video: Path, final_path: Path, *, language
 
     # Prefer a provided audio hint (e.g., voiceover.mp3) for transcription to avoid failures on videos without audio
     transcription_source = Path(audio_hint) if audio_hint else input_video
-    segments = run_whisper_segments(transcription_source, language=language, model_size=model_size)
-    srt_path = final_path.parent / "generated.srt"
-    chunks = build_chunks_from_words(segments, max_words=4, min_chunk_duration=0.6)
-    write_srt_from_chunks(chunks, srt_path)
+    srt_path = transcribe_to_srt(transcription_source, final_path.parent / "generated.srt", language=language, model_size=model_size)
 
-    burn_subtitles(input_video, srt_path, final_path, position=position or 'bottom', margin_v=None)
+    burn_subtitles(input_video, srt_path, final_path, position=position or 'bottom', margin_v=None, encoder=encoder)
     if not final_path.exists() or final_path.stat().st_size == 0:
         raise RuntimeError("Final subtitled output not created or empty")
     return final_path
+
+
+def concat_and_burn_subtitles(
+    video_paths: Iterable[str | Path],
+    voiceover_path: str | Path,
+    srt_path: str | Path,
+    final_path: str | Path,
+    *,
+    position: str = 'bottom',
+    video_speed_factor: float = 1.0,
+    encoder: str | None = None,
+) -> Path:
+    """Concat clips, mix the voiceover and burn srt_path in a single ffmpeg encode.
+
+    The subtitles are transcribed up front (see transcribe_to_srt), so no
+    intermediate stitched video has to be written, decoded and re-encoded.
+    """
+    final_path = Path(final_path)
+    final_path.parent.mkdir(parents=True, exist_ok=True)
+    concat_videos_with_voiceover(
+        video_paths,
+        voiceover_path,
+        final_path,
+        video_speed_factor=video_speed_factor,
+        subtitle_filter=build_subtitle_filter(Path(srt_path), position or 'bottom'),
+        encoder=encoder,
+    )
+    return final_path
@@ -6,6 +6,7 @@ from fastapi import HTTPException
 from faster_whisper import WhisperModel
 
 from videomerge.config import SUBTITLE_CONFIG_PATH
+from videomerge.services.media import video_encoder_args
 
 
 def load_subtitle_config() -> dict:
@@ -203,7 +204,8 @@ def _alignment_for_position(pos: str) -> int:
     return 2
 
 
-def burn_subtitles(input_video: Path, srt_path: Path, output_path: Path, position: str, margin_v: Optional[int] = None):
+def build_subtitle_filter(srt_path: Path, position: str, margin_v: Optional[int] = None) -> str:
+    """Return the ffmpeg ``subtitles=`` filter string styled from the subtitle config."""
     alignment = _alignment_for_position(position)
     cfg = load_subtitle_config()
     if margin_v is not None:
@@ -229,12 +231,16 @@ def burn_subtitles(input_video: Path, srt_path: Path, output_path: Path, positio
         f"FontSize={font_size},Bold={bold},Outline={outline},Shadow={shadow},"
         f"PrimaryColour={primary},OutlineColour={outline_col}"
     )
-    sub_filter = f"subtitles='{srt_path.resolve().as_posix()}':force_style='{style}'"
+    return f"subtitles='{Path(srt_path).resolve().as_posix()}':force_style='{style}'"
+
+
+def burn_subtitles(input_video: Path, srt_path: Path, output_path: Path, position: str, margin_v: Optional[int] = None, encoder: Optional[str] = None):
+    sub_filter = build_subtitle_filter(srt_path, position, margin_v)
     cmd = [
         'ffmpeg', '-hide_banner', '-loglevel', 'error', '-y',
         '-i', str(input_video),
         '-vf', sub_filter,
-        '-c:v', 'libx264', '-preset', 'veryfast', '-crf', '23',
+        *video_encoder_args(encoder),
         '-c:a', 'aac',
         '-movflags', '+faststart',
         str(output_path)
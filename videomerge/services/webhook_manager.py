@@ -1,15 +1,35 @@
 # videomerge/services/webhook_manager.py
 import asyncio
+import json
 import httpx
 from typing import Dict, Optional
+from videomerge.exceptions import NonRetryableError
 from videomerge.utils.logging import get_logger
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = get_logger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _encode_payload(payload: Dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload).encode("utf-8")
+
 
 class WebhookManager:
     def __init__(self):
-        self._client = httpx.AsyncClient(timeout=30.0)
+        # Webhooks go to the same few N8N hosts; keep idle connections around
+        # long enough to be reused between runs rather than httpx's 5s default.
+        self._client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=32, keepalive_expiry=60.0),
+        )
 
     async def send_webhook(self, webhook_url: str, job_data: Dict, event_type: str = "job_completed") -> bool:
         """Send webhook notification to N8N"""
@@ -18,12 +38,26 @@ class WebhookManager:
             "timestamp": asyncio.get_event_loop().time(),
             "data": job_data,
         }
+        return await self.send_webhook_bytes(
+            webhook_url,
+            _encode_payload(payload),
+            event_type,
+            workflow_id=job_data.get("workflow_id"),
+        )
 
+    async def send_webhook_bytes(
+        self,
+        webhook_url: str,
+        body: bytes,
+        event_type: str = "job_completed",
+        workflow_id: Optional[str] = None,
+    ) -> bool:
+        """Send an already-serialized JSON webhook body on the pooled client."""
         try:
             response = await self._client.post(
                 webhook_url,
-                json=payload,
-                headers={"Content-Type": "application/json"},
+                content=body,
+                headers=_JSON_HEADERS,
             )
 
             try:
@@ -36,14 +70,16 @@ class WebhookManager:
                     event_type,
                     response.text,
                 )
-                raise RuntimeError(
-                    f"Webhook request failed with status {response.status_code}: {response.text}"
-                ) from exc
+                message = f"Webhook request failed with status {response.status_code}: {response.text}"
+                # Client errors (bad URL, rejected payload) will not succeed on retry.
+                if 400 <= response.status_code < 500 and response.status_code not in (408, 429):
+                    raise NonRetryableError(message) from exc
+                raise RuntimeError(message) from exc
 
             logger.info(
                 "Webhook sent successfully to %s for workflow %s (event: %s)",
                 webhook_url,
-                job_data.get("workflow_id"),
+                workflow_id,
                 event_type,
             )
             return True
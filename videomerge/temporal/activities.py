@@ -1,15 +1,37 @@
 import asyncio
+import fnmatch
+import functools
+import gzip
 import json
+import multiprocessing
+import os
+import pickle
+import random
+import shutil
 import time
 import base64
-import subprocess
+import hashlib
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Set
+from urllib.parse import quote
 
-import aiohttp
 import httpx
 from temporalio import activity
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+try:
+    # SIMD base64 for the large video payloads; same b64encode/b64decode API.
+    import pybase64 as _fast_base64
+except ImportError:  # pragma: no cover - pybase64 is optional
+    _fast_base64 = base64
+
 from videomerge.exceptions import NonRetryableError
 
 from videomerge.config import (
@@ -17,6 +39,7 @@ from videomerge.config import (
     COMFYUI_TIMEOUT_SECONDS,
     COMFY_ORG_API_KEY,
     DATA_SHARED_BASE,
+    TMP_BASE,
     IMAGE_GENERATION_N8N_WEBHOOK_URL,
     IMAGE_JOB_TIMEOUT_SECONDS,
     IMAGE_POLL_INTERVAL_SECONDS,
@@ -25,12 +48,17 @@ from videomerge.config import (
     N8N_PROMPTS_WEBHOOK_URL,
     N8N_VOICEOVER_WEBHOOK_URL,
     N8N_WEBHOOK_TIMEOUT_SECONDS,
+    RUNPOD_IMAGE_HTTP_TIMEOUT_SECONDS,
     RUNPOD_UPSCALE_HTTP_TIMEOUT_SECONDS,
+    RUNPOD_VIDEO_HTTP_TIMEOUT_SECONDS,
     RUNPOD_API_KEY,
     RUNPOD_BASE_URL,
     RUNPOD_VIDEO_INSTANCE_ID,
     TABARIO_VIDEO_COMPOSITOR_URL,
     UPSCALE_BATCH_SIZE,
+    UPSCALE_CALLBACK_BASE_URL,
+    UPSCALE_CALLBACK_TOKEN,
+    UPSCALE_GZIP_REQUEST,
     UPSCALE_JOB_TIMEOUT_SECONDS,
     UPSCALE_POLL_INTERVAL_SECONDS,
     UPSCALE_QUEUE_TIMEOUT_SECONDS,
@@ -42,21 +70,27 @@ from videomerge.config import (
 )
 from videomerge.services.media import get_duration
 from videomerge.services.metrics import (
-    voiceover_length_seconds,
+    voiceover_length_seconds_by_bucket,
     get_length_bucket,
-    total_images_generation_seconds,
-    total_videos_generation_seconds,
-    stitch_seconds,
-    subtitles_seconds,
-    videos_completed_total,
+    total_images_generation_seconds_by_bucket,
+    total_videos_generation_seconds_by_bucket,
+    stitch_seconds_by_bucket,
+    subtitles_seconds_by_bucket,
+    videos_completed_total_by_bucket,
     jobs_started_total,
     jobs_completed_total,
     jobs_failed_total,
     job_total_seconds,
     worker_active,
+    comfyui_request_seconds,
+    comfyui_requests_total,
 )
 from videomerge.models import HandoffPayload
 from videomerge.services.comfyui_client import get_image_client, get_video_client, refresh_comfyui_client, ClientType, get_comfyui_client
+from videomerge.services.comfyui.base import endpoint_label
+from videomerge.services.comfyui.local_client import LocalComfyUIClient
+from videomerge.services.comfyui.runpod_client import RunPodComfyUIClient
+from videomerge.services.comfyui.utils import extract_runpod_outputs
 from videomerge.services.media_providers.registry import get_image_provider, get_video_provider
 from videomerge.services.comfyui_wrapper import (
     submit_text_to_image,
@@ -66,9 +100,13 @@ from videomerge.services.comfyui_wrapper import (
     upload_image_to_input,
     submit_image_to_video,
 )
-from videomerge.services.stitcher import concat_videos_with_voiceover, generate_and_burn_subtitles
+from videomerge.services.stitcher import (
+    concat_and_burn_subtitles,
+    concat_videos_with_voiceover,
+    generate_and_burn_subtitles,
+    transcribe_to_srt,
+)
 from videomerge.services.supabase_client import supabase_storage_client
-from videomerge.services.voiceover import synthesize_voice
 from videomerge.services.webhook_manager import webhook_manager
 from videomerge.utils.logging import get_logger
 
@@ -81,11 +119,136 @@ class ActivityTimeoutError(Exception):
     pass
 
 
-_metrics_lock = asyncio.Lock()
-_active_runs: set[str] = set()
+# Keyed by run_id; its size is the worker_active gauge. setdefault/pop are
+# atomic under the GIL and activities share one event loop, so no lock is needed.
 _job_start_times: Dict[str, float] = {}
 
 
+class _BoundedCache(OrderedDict):
+    """Dict capped at ``maxsize`` entries, evicting the least recently stored.
+
+    Per-run caches are cleared by ``_forget_run``; the cap only matters for
+    runs that never reach their completion webhook (failed or cancelled).
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+_RUN_CACHE_MAX_ENTRIES = 1024
+# run_id -> bucket, or None once a lookup found no voiceover metadata.
+_length_bucket_cache: Dict[str, Optional[str]] = _BoundedCache(_RUN_CACHE_MAX_ENTRIES)
+_voiceover_meta_cache: Dict[str, Dict[str, Any]] = _BoundedCache(_RUN_CACHE_MAX_ENTRIES)
+# Run directories this worker has already created (keys only); see _ensure_run_dir.
+_ensured_run_dirs: Dict[str, None] = _BoundedCache(_RUN_CACHE_MAX_ENTRIES)
+
+_media_process_pool: Optional[ProcessPoolExecutor] = None
+_shared_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_shared_http_client() -> httpx.AsyncClient:
+    """Return the module-level pooled ``httpx.AsyncClient`` for outbound calls.
+
+    Reusing one client keeps TCP/TLS connections to N8N alive across activity
+    invocations instead of paying a fresh handshake per request. Callers pass
+    their own per-request ``timeout``.
+    """
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(float(N8N_WEBHOOK_TIMEOUT_SECONDS), connect=10.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50, keepalive_expiry=60.0),
+        )
+    return _shared_http_client
+
+
+async def close_shared_http_client() -> None:
+    """Close the shared HTTP client; called on worker shutdown."""
+    global _shared_http_client
+    if _shared_http_client is not None:
+        await _shared_http_client.aclose()
+        _shared_http_client = None
+
+
+def _get_media_process_pool() -> ProcessPoolExecutor:
+    """Return the lazily created process pool used for stitching and subtitles.
+
+    The pool uses the ``spawn`` start method because the worker process runs
+    Temporal's native threads, which are not fork-safe.
+    """
+    global _media_process_pool
+    if _media_process_pool is None:
+        from videomerge.config import MEDIA_PROCESS_POOL_WORKERS
+
+        _media_process_pool = ProcessPoolExecutor(
+            max_workers=MEDIA_PROCESS_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _media_process_pool
+
+
+def shutdown_media_process_pool() -> None:
+    """Shut down the media process pool if it was started."""
+    global _media_process_pool
+    if _media_process_pool is not None:
+        _media_process_pool.shutdown(wait=False, cancel_futures=True)
+        _media_process_pool = None
+
+
+def _call_in_media_process(fn, args: tuple, kwargs: Dict[str, Any]) -> Any:
+    """Invoke ``fn`` inside a pool process, normalising errors for pickling.
+
+    Exceptions that survive a pickle round trip (including NonRetryableError
+    and ApplicationError) are re-raised unchanged so retry policies still see
+    their type. Those that cannot be rebuilt in the parent, such as FastAPI's
+    HTTPException, are re-raised as RuntimeError carrying their detail.
+    """
+    try:
+        return fn(*args, **kwargs)
+    except Exception as exc:
+        if not _is_http_exception(exc):
+            try:
+                pickle.loads(pickle.dumps(exc))
+            except Exception:
+                pass
+            else:
+                raise
+        detail = getattr(exc, "detail", None) or str(exc) or type(exc).__name__
+        raise RuntimeError(detail) from None
+
+
+def _is_http_exception(exc: BaseException) -> bool:
+    """Return True for Starlette/FastAPI HTTPExceptions, which unpickle badly."""
+    try:
+        from starlette.exceptions import HTTPException
+    except ImportError:  # pragma: no cover - starlette ships with fastapi
+        return False
+    return isinstance(exc, HTTPException)
+
+
+async def _run_in_process_with_heartbeats(
+    fn,
+    *args,
+    heartbeat_interval_s: float = 30.0,
+    **kwargs,
+) -> Any:
+    """Run a CPU-heavy function in the media process pool while heartbeating."""
+
+    loop = asyncio.get_running_loop()
+    call = functools.partial(_call_in_media_process, fn, args, kwargs)
+    return await _run_async_with_heartbeats(
+        lambda: loop.run_in_executor(_get_media_process_pool(), call),
+        heartbeat_interval_s=heartbeat_interval_s,
+    )
+
+
 async def _run_in_thread_with_heartbeats(
     fn,
     *args,
@@ -144,19 +307,267 @@ async def _run_async_with_heartbeats(
             pass
 
 
-def _safe_heartbeat() -> None:
+def _safe_heartbeat(*details: Any) -> None:
     """Call Temporal activity heartbeat if running in an activity context."""
 
     try:
-        activity.heartbeat()
+        activity.heartbeat(*details)
     except Exception:
         return
 
 
-def _load_length_bucket(run_id: str) -> Optional[str]:
-    """Load cached length_bucket for a given run, if available."""
+def _safe_is_cancelled() -> bool:
+    """Return True if the current Temporal activity has been cancelled."""
+
     try:
-        bucket_path = DATA_SHARED_BASE / run_id / "length_bucket.txt"
+        return activity.is_cancelled()
+    except Exception:
+        return False
+
+
+def _parse_runpod_status(prompt_id: str, data: Dict[str, Any]) -> Optional[List[str]]:
+    """Output hints from a RunPod ``/status`` payload, or None while pending."""
+    status = str(data.get("status", "")).upper()
+    if status == "COMPLETED":
+        result_files = extract_runpod_outputs(data.get("output"))
+        logger.info("[comfyui] RunPod job completed with %d outputs", len(result_files))
+        return result_files
+    if status in ("FAILED", "ERROR"):
+        error_msg = data.get("error", "Unknown RunPod error")
+        logger.error("[comfyui] RunPod job FAILED for prompt_id=%s: %s", prompt_id, error_msg)
+        raise NonRetryableError(f"RunPod job failed: {error_msg}")
+    return None
+
+
+async def _poll_comfyui_outputs(
+    client,
+    prompt_id: str,
+    *,
+    timeout_s: int,
+    poll_interval_s: float,
+) -> List[str]:
+    """Wait for a ComfyUI prompt to finish and return its output file hints.
+
+    Local ComfyUI (``/history/{prompt_id}``) and RunPod (``/status/{job_id}``)
+    are polled natively on the event loop with the shared HTTP client, so no
+    executor thread is parked per in-flight job. Any other client falls back
+    to its blocking ``poll_until_complete`` in a thread.
+    """
+    if isinstance(client, LocalComfyUIClient):
+        url = f"{client.base_url}/history/{prompt_id}"
+        request_timeout = 15.0
+        parse = functools.partial(client.parse_history_response, prompt_id)
+    elif isinstance(client, RunPodComfyUIClient):
+        url = f"{client.base_url}/v2/{client.instance_id}/status/{prompt_id}"
+        request_timeout = float(
+            RUNPOD_IMAGE_HTTP_TIMEOUT_SECONDS
+            if client.client_type == ClientType.IMAGE
+            else RUNPOD_VIDEO_HTTP_TIMEOUT_SECONDS
+        )
+        parse = functools.partial(_parse_runpod_status, prompt_id)
+    else:
+        return await _run_in_thread_with_heartbeats(
+            client.poll_until_complete,
+            prompt_id,
+            timeout_s=timeout_s,
+            poll_interval_s=poll_interval_s,
+            heartbeat_interval_s=30.0,
+        )
+
+    http_client = _get_shared_http_client()
+    headers = client.default_headers()
+    endpoint = endpoint_label(client.base_url, url)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    deadline = started + timeout_s
+    last_error: Optional[Exception] = None
+    while loop.time() < deadline:
+        # Heartbeat every poll so a dead worker is detected within the
+        # workflow's heartbeat_timeout, and stop early if the run was cancelled.
+        _safe_heartbeat({"prompt_id": prompt_id, "elapsed": round(loop.time() - started, 1)})
+        if _safe_is_cancelled():
+            raise asyncio.CancelledError()
+        try:
+            with comfyui_request_seconds.labels(endpoint=endpoint).time():
+                response = await http_client.get(url, headers=headers, timeout=request_timeout)
+            comfyui_requests_total.labels(endpoint=endpoint, status=f"{str(response.status_code)[0]}xx").inc()
+            response.raise_for_status()
+            result = parse(_response_json(response))
+            if result is not None:
+                return result
+        except (httpx.HTTPError, ValueError) as exc:
+            last_error = exc
+            logger.debug("[comfyui] polling error for prompt_id=%s: %s", prompt_id, exc)
+        await asyncio.sleep(poll_interval_s)
+    raise TimeoutError(f"Timed out waiting for ComfyUI results for {prompt_id}. Last error: {last_error}")
+
+
+def _indexed_output_name(name: str, index: Optional[int]) -> str:
+    """Swap ComfyUI's ``000_`` filename prefix for the clip's ``{index:03d}_``."""
+    if index is None or not name.startswith("000_"):
+        return name
+    return f"{index:03d}_{name[4:]}"
+
+
+def _rename_outputs_for_index(paths: List[Path], index: int) -> List[Path]:
+    """Rename already-saved outputs to their indexed names in one batch."""
+    renamed: List[Path] = []
+    for p in paths:
+        new_name = _indexed_output_name(p.name, index)
+        if new_name != p.name:
+            new_path = p.with_name(new_name)
+            os.replace(p, new_path)
+            p = new_path
+        renamed.append(p)
+    return renamed
+
+
+async def _download_comfyui_outputs(
+    client, file_hints: List[str], dest_dir: Path, *, index: Optional[int] = None
+) -> List[Path]:
+    """Save ComfyUI outputs into ``dest_dir``.
+
+    Local ComfyUI outputs go through the client's ``download_outputs_async`` on
+    the shared HTTP client, so no executor thread is held for the transfer.
+    Other clients (RunPod returns base64 payloads) use their blocking
+    ``download_outputs`` in a thread.
+
+    When ``index`` is given, ``000_*`` outputs are saved as ``{index:03d}_*``:
+    local outputs land under that name directly, other clients' files are
+    renamed in the same worker thread that downloaded them.
+    """
+    if not isinstance(client, LocalComfyUIClient):
+        if index is None:
+            return await asyncio.to_thread(client.download_outputs, file_hints, dest_dir)
+
+        def _download_and_rename() -> List[Path]:
+            return _rename_outputs_for_index(client.download_outputs(file_hints, dest_dir), index)
+
+        return await asyncio.to_thread(_download_and_rename)
+
+    return await client.download_outputs_async(
+        file_hints,
+        dest_dir,
+        http_client=_get_shared_http_client(),
+        output_name=lambda name: _indexed_output_name(name, index),
+    )
+
+
+def _json_bytes(obj: Any, *, indent: bool = True) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes, using orjson when available.
+
+    ``indent=False`` produces compact output for files that are only ever
+    read back by code.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _response_json(response: Any) -> Any:
+    """Parse an httpx response body straight from bytes with orjson when available."""
+    content = getattr(response, "content", None)
+    if orjson is not None and isinstance(content, (bytes, bytearray)):
+        return orjson.loads(content)
+    return response.json()
+
+
+def _loads_json(data: Any) -> Any:
+    """Parse JSON from bytes or str, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump_json(path: Path, obj: Any, *, indent: bool = True) -> None:
+    """Write ``obj`` as UTF-8 JSON to ``path``."""
+    path.write_bytes(_json_bytes(obj, indent=indent))
+
+
+async def _awrite_json(path: Path, obj: Any, *, indent: bool = True) -> None:
+    """Serialize and write ``obj`` off the event loop.
+
+    Prompt lists and manifests can carry long scripts or inline images, so both
+    the encode and the write run in the executor.
+    """
+    await asyncio.to_thread(_dump_json, path, obj, indent=indent)
+
+
+def _write_json_if_changed(path: Path, obj: Any) -> bool:
+    """Serialize ``obj`` and write it via :func:`_write_bytes_if_changed`."""
+    return _write_bytes_if_changed(path, _json_bytes(obj))
+
+
+def _write_bytes_if_changed(path: Path, data: bytes) -> bool:
+    """Write ``data`` to ``path`` unless the file already holds identical bytes.
+
+    Returns ``True`` when the file was written and ``False`` when the write was
+    skipped because the existing content hashes to the same digest.
+    """
+    if path.exists():
+        existing_digest = hashlib.blake2b(path.read_bytes(), digest_size=16).digest()
+        if existing_digest == hashlib.blake2b(data, digest_size=16).digest():
+            return False
+    path.write_bytes(data)
+    return True
+
+
+def _list_file_names(directory: Path, pattern: str) -> Set[str]:
+    """Return the names of files in ``directory`` matching ``pattern`` (empty if missing).
+
+    Uses one ``scandir`` pass and the dirent file type, so on shared storage
+    only symlinked entries cost an extra ``stat``.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {
+                entry.name
+                for entry in entries
+                if fnmatch.fnmatchcase(entry.name, pattern) and entry.is_file()
+            }
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
+def _ensure_run_dir(run_id: str) -> Path:
+    """Return ``DATA_SHARED_BASE / run_id``, creating it once per worker.
+
+    ``mkdir(exist_ok=True)`` still costs a metadata round trip on shared
+    storage, so later activities of the same run skip it. Entries are dropped
+    when the run's completion webhook is sent.
+    """
+    run_dir = DATA_SHARED_BASE / run_id
+    key = str(run_dir)
+    if key not in _ensured_run_dirs:
+        run_dir.mkdir(parents=True, exist_ok=True)
+        _ensured_run_dirs[key] = None
+    return run_dir
+
+
+def _forget_run(run_id: str) -> None:
+    """Drop this worker's per-run caches once the run has finished."""
+    _length_bucket_cache.pop(run_id, None)
+    _voiceover_meta_cache.pop(run_id, None)
+    _ensured_run_dirs.pop(str(DATA_SHARED_BASE / run_id), None)
+
+
+def _read_length_bucket_file(run_id: str) -> Optional[str]:
+    """Read a run's length bucket from disk (blocking; call via the executor).
+
+    ``generate_voiceover`` stores it in ``voiceover_metadata.json``; runs
+    started before that fall back to the older ``length_bucket.txt``.
+    """
+    run_dir = DATA_SHARED_BASE / run_id
+    try:
+        metadata_path = run_dir / "voiceover_metadata.json"
+        if metadata_path.exists():
+            value = _loads_json(metadata_path.read_bytes()).get("length_bucket")
+            if value:
+                return str(value)
+        bucket_path = run_dir / "length_bucket.txt"
         if bucket_path.exists():
             value = bucket_path.read_text(encoding="utf-8").strip()
             return value or None
@@ -165,53 +576,149 @@ def _load_length_bucket(run_id: str) -> Optional[str]:
     return None
 
 
+async def _aload_length_bucket(run_id: str) -> Optional[str]:
+    """Load cached length_bucket for a given run, if available.
+
+    Served from the per-process cache when possible; falls back to the run
+    directory (e.g. when another worker ran the voiceover), read off the
+    event loop since ``DATA_SHARED_BASE`` may be a network mount.
+    """
+    if run_id in _length_bucket_cache:
+        return _length_bucket_cache[run_id]
+    value = await asyncio.to_thread(_read_length_bucket_file, run_id)
+    # Misses are cached too: image-only and upscale runs never have a
+    # voiceover, and would otherwise re-probe the shared FS on every scene.
+    _length_bucket_cache[run_id] = value
+    return value
+
+
 @activity.defn
 async def setup_run_directory(run_id: str, payload: Dict[str, Any]) -> str:
     """Creates the run directory and saves the manifest."""
     activity.heartbeat()
-    start_ts = time.time()
-    first_start = False
-    async with _metrics_lock:
-        if run_id not in _active_runs:
-            _active_runs.add(run_id)
-            _job_start_times[run_id] = start_ts
-            worker_active.set(len(_active_runs))
-            first_start = True
-    if first_start:
+    start_ts = time.monotonic()
+    if _job_start_times.setdefault(run_id, start_ts) == start_ts:
+        worker_active.set(len(_job_start_times))
         jobs_started_total.inc()
+    # Always create (the run may be re-submitted after cleanup), then record it.
     run_dir = DATA_SHARED_BASE / run_id
-    run_dir.mkdir(parents=True, exist_ok=True)
+    await asyncio.to_thread(run_dir.mkdir, parents=True, exist_ok=True)
+    _ensured_run_dirs[str(run_dir)] = None
     manifest_path = run_dir / "manifest.json"
     try:
-        manifest_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-        logger.info(f"Manifest saved for run_id={run_id}")
+        if await asyncio.to_thread(_write_json_if_changed, manifest_path, payload):
+            logger.info("Manifest saved for run_id=%s", run_id)
+        else:
+            logger.info("Manifest unchanged for run_id=%s; skipping write", run_id)
     except Exception as e:
-        logger.warning(f"Failed to write manifest for run_id={run_id}: {e}")
+        logger.warning("Failed to write manifest for run_id=%s: %s", run_id, e)
     return str(run_dir)
 
 
+def _voiceover_cache_key(script: str, voice_id: str, language: str) -> str:
+    return hashlib.sha256(f"{script}|{voice_id}|{language}".encode("utf-8")).hexdigest()
+
+
+def _voiceover_cache_enabled() -> bool:
+    from videomerge.config import VOICEOVER_CACHE_MAX_ENTRIES, VOICEOVER_CACHE_TTL_SECONDS
+
+    return VOICEOVER_CACHE_TTL_SECONDS > 0 and VOICEOVER_CACHE_MAX_ENTRIES > 0
+
+
+def _restore_cached_voiceover(cache_key: str, audio_path: Path) -> Optional[Dict[str, Any]]:
+    """Copy a cached voiceover to ``audio_path``; returns its metadata, or None on a miss."""
+    from videomerge.config import VOICEOVER_CACHE_TTL_SECONDS
+
+    if not _voiceover_cache_enabled():
+        return None
+    cache_dir = DATA_SHARED_BASE / "voiceover_cache"
+    cached_audio = cache_dir / f"{cache_key}.mp3"
+    cached_meta = cache_dir / f"{cache_key}.json"
+    try:
+        if time.time() - cached_meta.stat().st_mtime > VOICEOVER_CACHE_TTL_SECONDS:
+            return None
+        metadata = _loads_json(cached_meta.read_bytes())
+        if cached_audio.stat().st_size == 0:
+            return None
+        # Each run gets its own copy so nothing a run does to its voiceover.mp3
+        # can reach the cache or other runs.
+        audio_path.unlink(missing_ok=True)
+        shutil.copyfile(cached_audio, audio_path)
+        os.utime(cached_meta)
+    except (OSError, ValueError):
+        return None
+    return metadata
+
+
+def _prune_voiceover_cache(cache_dir: Path) -> None:
+    """Drop expired cache entries, then the least recently used beyond the entry limit."""
+    from videomerge.config import VOICEOVER_CACHE_MAX_ENTRIES, VOICEOVER_CACHE_TTL_SECONDS
+
+    entries = []
+    for meta in cache_dir.glob("*.json"):
+        try:
+            entries.append((meta.stat().st_mtime, meta))
+        except OSError:
+            continue
+    entries.sort(key=lambda entry: entry[0], reverse=True)
+    cutoff = time.time() - VOICEOVER_CACHE_TTL_SECONDS
+    for index, (mtime, meta) in enumerate(entries):
+        if index < VOICEOVER_CACHE_MAX_ENTRIES and mtime >= cutoff:
+            continue
+        # Metadata goes first so a concurrent reader never sees it without its audio.
+        meta.unlink(missing_ok=True)
+        meta.with_suffix(".mp3").unlink(missing_ok=True)
+
+
+def _store_voiceover_in_cache(cache_key: str, audio_path: Path, audio_duration: Any) -> None:
+    if not _voiceover_cache_enabled():
+        return
+    cache_dir = DATA_SHARED_BASE / "voiceover_cache"
+    cached_audio = cache_dir / f"{cache_key}.mp3"
+    tmp_audio = cache_dir / f"{cache_key}.{os.getpid()}.mp3.tmp"
+    try:
+        if not audio_path.exists() or audio_path.stat().st_size == 0:
+            return
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(audio_path, tmp_audio)
+        os.replace(tmp_audio, cached_audio)
+        # Metadata is written last so a readable .json implies the .mp3 is complete.
+        _dump_json(cache_dir / f"{cache_key}.json", {"audio_duration": audio_duration}, indent=False)
+        _prune_voiceover_cache(cache_dir)
+    except OSError as exc:
+        tmp_audio.unlink(missing_ok=True)
+        logger.warning(f"[voiceover] Failed to cache voiceover {cache_key}: {exc}")
+
+
 @activity.defn
 async def generate_voiceover(run_id: str, script: str, language: str, elevenlabs_voice_id: str) -> str:
     """Trigger voiceover generation through N8N and record duration metrics."""
     activity.heartbeat()
-    run_dir = DATA_SHARED_BASE / run_id
-    run_dir.mkdir(parents=True, exist_ok=True)
+    run_dir = await asyncio.to_thread(_ensure_run_dir, run_id)
     audio_path = run_dir / "voiceover.mp3"
 
-    url = N8N_VOICEOVER_WEBHOOK_URL
-    if not url:
-        raise RuntimeError("N8N_VOICEOVER_WEBHOOK_URL environment variable is not set")
-    payload: Dict[str, Any] = {
-        "script": script,
-        "runId": run_id,
-        "elevenlabs_voice_id": elevenlabs_voice_id,
-        "language": language,
-    }
+    # Identical (script, voice, language) inputs reuse a previously synthesized
+    # voiceover, so activity retries and templated scripts skip the N8N call.
+    cache_key = _voiceover_cache_key(script, elevenlabs_voice_id, language)
+    cached = await asyncio.to_thread(_restore_cached_voiceover, cache_key, audio_path)
+    if cached is not None:
+        logger.info(f"[voiceover] Reusing cached voiceover {cache_key[:12]} for run_id={run_id}")
+        data = cached
+    else:
+        url = N8N_VOICEOVER_WEBHOOK_URL
+        if not url:
+            raise RuntimeError("N8N_VOICEOVER_WEBHOOK_URL environment variable is not set")
+        payload: Dict[str, Any] = {
+            "script": script,
+            "runId": run_id,
+            "elevenlabs_voice_id": elevenlabs_voice_id,
+            "language": language,
+        }
 
-    logger.info(f"[voiceover] Calling N8N webhook for run_id={run_id}")
+        logger.info(f"[voiceover] Calling N8N webhook for run_id={run_id}")
 
-    async with httpx.AsyncClient(timeout=float(N8N_WEBHOOK_TIMEOUT_SECONDS)) as client:
-        response = await client.post(url, json=payload)
+        client = _get_shared_http_client()
+        response = await client.post(url, json=payload, timeout=float(N8N_WEBHOOK_TIMEOUT_SECONDS))
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError as exc:
@@ -220,7 +727,8 @@ async def generate_voiceover(run_id: str, script: str, language: str, elevenlabs
                 raise RuntimeError(f"N8N voiceover webhook failed with status {response.status_code}: {error_detail}") from exc
             except Exception:
                 raise RuntimeError(f"N8N voiceover webhook failed with status {response.status_code}: {response.text}") from exc
-        data = response.json()
+        data = _response_json(response)
+        await asyncio.to_thread(_store_voiceover_in_cache, cache_key, audio_path, data.get("audio_duration"))
 
     audio_duration_raw = data.get("audio_duration")
     duration: Optional[float] = None
@@ -232,27 +740,23 @@ async def generate_voiceover(run_id: str, script: str, language: str, elevenlabs
                 f"[voiceover] Invalid audio_duration '{audio_duration_raw}' for run_id={run_id}."
             )
 
+    # length_bucket rides along in the metadata file so the shared FS sees a
+    # single write per voiceover.
+    metadata_payload: Dict[str, Any] = {}
+    if duration is not None:
+        length_bucket = get_length_bucket(duration)
+        metadata_payload = {"audio_duration": duration, "length_bucket": length_bucket}
+        _voiceover_meta_cache[run_id] = metadata_payload
+        _length_bucket_cache[run_id] = length_bucket
+        voiceover_length_seconds_by_bucket[length_bucket].observe(duration)
+
     metadata_path = run_dir / "voiceover_metadata.json"
     try:
-        metadata_payload = {"audio_duration": duration} if duration is not None else {}
-        metadata_path.write_text(
-            json.dumps(metadata_payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        await _awrite_json(metadata_path, metadata_payload, indent=False)
         logger.info(f"[voiceover] Saved audio metadata for run_id={run_id}: {metadata_payload}")
     except Exception as exc:
         logger.warning(f"[voiceover] Failed to write metadata for run_id={run_id}: {exc}")
 
-    if duration is not None:
-        length_bucket = get_length_bucket(duration)
-        voiceover_length_seconds.labels(length_bucket=length_bucket).observe(duration)
-
-        try:
-            bucket_path = run_dir / "length_bucket.txt"
-            bucket_path.write_text(length_bucket, encoding="utf-8")
-        except Exception as exc:
-            logger.warning(f"[voiceover] Failed to write length_bucket for run_id={run_id}: {exc}")
-
     logger.info(f"[voiceover] Voiceover generation triggered successfully for run_id={run_id}")
     return str(audio_path)
 
@@ -264,14 +768,18 @@ async def generate_scene_prompts(run_id: str, script: str, image_style: str | No
     run_dir = DATA_SHARED_BASE / run_id
     metadata_path = run_dir / "voiceover_metadata.json"
 
-    try:
-        metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
-    except FileNotFoundError as exc:
-        raise RuntimeError(
-            f"voiceover_metadata.json not found for run_id={run_id}; cannot generate prompts"
-        ) from exc
-    except json.JSONDecodeError as exc:
-        raise RuntimeError(f"Invalid voiceover metadata for run_id={run_id}: {exc}") from exc
+    # generate_voiceover normally ran moments ago in this process; only fall
+    # back to the metadata file when it ran elsewhere (or the worker restarted).
+    metadata = _voiceover_meta_cache.get(run_id)
+    if metadata is None:
+        try:
+            metadata = _loads_json(await asyncio.to_thread(metadata_path.read_bytes))
+        except FileNotFoundError as exc:
+            raise RuntimeError(
+                f"voiceover_metadata.json not found for run_id={run_id}; cannot generate prompts"
+            ) from exc
+        except json.JSONDecodeError as exc:
+            raise RuntimeError(f"Invalid voiceover metadata for run_id={run_id}: {exc}") from exc
 
     audio_duration = metadata.get("audio_duration")
     if audio_duration is None:
@@ -295,17 +803,17 @@ async def generate_scene_prompts(run_id: str, script: str, image_style: str | No
     logger.info(f"[prompts] Calling N8N prompts webhook for run_id={run_id}")
 
     try:
-        async with httpx.AsyncClient(timeout=float(N8N_WEBHOOK_TIMEOUT_SECONDS)) as client:
-            response = await client.post(url, json=payload)
+        client = _get_shared_http_client()
+        response = await client.post(url, json=payload, timeout=float(N8N_WEBHOOK_TIMEOUT_SECONDS))
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
             try:
-                response.raise_for_status()
-            except httpx.HTTPStatusError as exc:
-                try:
-                    error_detail = response.json()
-                    raise RuntimeError(f"N8N prompts webhook failed with status {response.status_code}: {error_detail}") from exc
-                except Exception:
-                    raise RuntimeError(f"N8N prompts webhook failed with status {response.status_code}: {response.text}") from exc
-            data = response.json()
+                error_detail = response.json()
+                raise RuntimeError(f"N8N prompts webhook failed with status {response.status_code}: {error_detail}") from exc
+            except Exception:
+                raise RuntimeError(f"N8N prompts webhook failed with status {response.status_code}: {response.text}") from exc
+        data = _response_json(response)
     except httpx.TimeoutException as exc:
         raise ActivityTimeoutError(
             f"N8N prompts webhook timed out after {N8N_WEBHOOK_TIMEOUT_SECONDS}s for run_id={run_id}"
@@ -317,7 +825,7 @@ async def generate_scene_prompts(run_id: str, script: str, image_style: str | No
 
     prompts_path = run_dir / "scene_prompts.json"
     try:
-        prompts_path.write_text(json.dumps(prompts, ensure_ascii=False, indent=2), encoding="utf-8")
+        await _awrite_json(prompts_path, prompts)
         logger.info(f"[prompts] Saved scene prompts for run_id={run_id} to {prompts_path}")
     except Exception as exc:
         logger.warning(f"[prompts] Failed to write scene prompts for run_id={run_id}: {exc}")
@@ -334,8 +842,7 @@ async def generate_image_scene_prompts(
 ) -> List[Dict[str, Any]]:
     """Generate scene prompts for image-only orchestration and persist the full response."""
     _safe_heartbeat()
-    run_dir = DATA_SHARED_BASE / run_id
-    run_dir.mkdir(parents=True, exist_ok=True)
+    run_dir = _ensure_run_dir(run_id)
 
     url = N8N_PROMPTS_WEBHOOK_URL
     if not url:
@@ -350,21 +857,21 @@ async def generate_image_scene_prompts(
     logger.info(f"[image-prompts] Calling Create Scenes webhook for run_id={run_id}")
 
     try:
-        async with httpx.AsyncClient(timeout=float(N8N_WEBHOOK_TIMEOUT_SECONDS)) as client:
-            response = await client.post(url, json=payload)
+        client = _get_shared_http_client()
+        response = await client.post(url, json=payload, timeout=float(N8N_WEBHOOK_TIMEOUT_SECONDS))
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
             try:
-                response.raise_for_status()
-            except httpx.HTTPStatusError as exc:
-                try:
-                    error_detail = response.json()
-                    raise RuntimeError(
-                        f"Create Scenes webhook failed with status {response.status_code}: {error_detail}"
-                    ) from exc
-                except Exception:
-                    raise RuntimeError(
-                        f"Create Scenes webhook failed with status {response.status_code}: {response.text}"
-                    ) from exc
-            data = response.json()
+                error_detail = response.json()
+                raise RuntimeError(
+                    f"Create Scenes webhook failed with status {response.status_code}: {error_detail}"
+                ) from exc
+            except Exception:
+                raise RuntimeError(
+                    f"Create Scenes webhook failed with status {response.status_code}: {response.text}"
+                ) from exc
+        data = _response_json(response)
     except httpx.TimeoutException as exc:
         raise ActivityTimeoutError(
             f"Create Scenes webhook timed out after {N8N_WEBHOOK_TIMEOUT_SECONDS}s for run_id={run_id}"
@@ -374,19 +881,22 @@ async def generate_image_scene_prompts(
     if not isinstance(prompts, list):
         raise RuntimeError(f"Create Scenes webhook returned invalid payload for run_id={run_id}: {data}")
 
+    # The two files are independent, so write them concurrently.
     scenes_response_path = run_dir / "scenes_response.json"
-    try:
-        scenes_response_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-        logger.info(f"[image-prompts] Saved scenes response for run_id={run_id} to {scenes_response_path}")
-    except Exception as exc:
-        logger.warning(f"[image-prompts] Failed to write scenes response for run_id={run_id}: {exc}")
-
     prompts_path = run_dir / "scene_prompts.json"
-    try:
-        prompts_path.write_text(json.dumps(prompts, ensure_ascii=False, indent=2), encoding="utf-8")
+    response_result, prompts_result = await asyncio.gather(
+        _awrite_json(scenes_response_path, data, indent=False),
+        _awrite_json(prompts_path, prompts),
+        return_exceptions=True,
+    )
+    if isinstance(response_result, Exception):
+        logger.warning(f"[image-prompts] Failed to write scenes response for run_id={run_id}: {response_result}")
+    else:
+        logger.info(f"[image-prompts] Saved scenes response for run_id={run_id} to {scenes_response_path}")
+    if isinstance(prompts_result, Exception):
+        logger.warning(f"[image-prompts] Failed to write scene prompts for run_id={run_id}: {prompts_result}")
+    else:
         logger.info(f"[image-prompts] Saved scene prompts for run_id={run_id} to {prompts_path}")
-    except Exception as exc:
-        logger.warning(f"[image-prompts] Failed to write scene prompts for run_id={run_id}: {exc}")
 
     return prompts
 
@@ -403,12 +913,11 @@ async def persist_scene_prompts(run_id: str, prompts: List[Dict[str, Any]]) -> N
         prompts: List of prompt dictionaries to write to scene_prompts.json.
     """
     activity.heartbeat()
-    run_dir = DATA_SHARED_BASE / run_id
-    run_dir.mkdir(parents=True, exist_ok=True)
+    run_dir = _ensure_run_dir(run_id)
 
     prompts_path = run_dir / "scene_prompts.json"
     try:
-        prompts_path.write_text(json.dumps(prompts, ensure_ascii=False, indent=2), encoding="utf-8")
+        await _awrite_json(prompts_path, prompts)
         logger.info(f"[scene-prompts] Persisted scene_prompts.json for run_id={run_id}")
     except Exception as exc:
         logger.error(f"[scene-prompts] Failed to write scene_prompts.json for run_id={run_id}: {exc}")
@@ -422,13 +931,12 @@ async def load_storyboard_scene_inputs(run_id: str) -> List[Dict[str, Any]]:
     run_dir = DATA_SHARED_BASE / run_id
     prompts_path = run_dir / "scene_prompts.json"
 
-    if not prompts_path.exists():
+    try:
+        prompts = _loads_json(await asyncio.to_thread(prompts_path.read_bytes))
+    except FileNotFoundError as exc:
         message = f"scene_prompts.json not found for run_id={run_id} at {prompts_path}"
         logger.error(message)
-        raise RuntimeError(message)
-
-    try:
-        prompts = json.loads(prompts_path.read_text(encoding="utf-8"))
+        raise RuntimeError(message) from exc
     except json.JSONDecodeError as exc:
         message = f"Invalid scene_prompts.json for run_id={run_id}: {exc}"
         logger.error(message)
@@ -439,6 +947,7 @@ async def load_storyboard_scene_inputs(run_id: str) -> List[Dict[str, Any]]:
         logger.error(message)
         raise RuntimeError(message)
 
+    existing_images = await asyncio.to_thread(_list_file_names, run_dir, "image_*.png")
     scene_inputs: List[Dict[str, Any]] = []
     for sequence_number, prompt in enumerate(prompts, start=1):
         if not isinstance(prompt, dict):
@@ -453,7 +962,7 @@ async def load_storyboard_scene_inputs(run_id: str) -> List[Dict[str, Any]]:
             raise RuntimeError(message)
 
         image_path = run_dir / f"image_{sequence_number:03d}.png"
-        if not image_path.exists():
+        if image_path.name not in existing_images:
             message = f"Storyboard image not found for run_id={run_id}: {image_path}"
             logger.error(message)
             raise RuntimeError(message)
@@ -482,18 +991,16 @@ async def persist_image_output(run_id: str, user_id: str, image_hint: str, index
         user_access_token: Supabase user JWT for authenticated storage upload
     """
     activity.heartbeat()
-    run_dir = DATA_SHARED_BASE / run_id
-    run_dir.mkdir(parents=True, exist_ok=True)
+    run_dir = _ensure_run_dir(run_id)
 
     sequence_number = index + 1
     file_name = f"image_{sequence_number:03d}.png"
     destination_path = run_dir / file_name
 
     if image_hint.startswith("http://") or image_hint.startswith("https://"):
-        async with aiohttp.ClientSession() as session:
-            async with session.get(image_hint) as resp:
-                resp.raise_for_status()
-                content = await resp.read()
+        response = await _get_shared_http_client().get(image_hint, timeout=60.0)
+        response.raise_for_status()
+        content = response.content
     else:
         client = get_comfyui_client()
         hint_path = Path(image_hint)
@@ -599,24 +1106,22 @@ async def send_image_generation_webhook(
     await webhook_manager.send_webhook(IMAGE_GENERATION_N8N_WEBHOOK_URL, payload, event_type)
 
     duration_observed = False
-    async with _metrics_lock:
-        start_ts = _job_start_times.pop(run_id, None)
-        if run_id in _active_runs:
-            _active_runs.remove(run_id)
-        worker_active.set(len(_active_runs))
-        if start_ts is not None:
-            duration = max(0.0, time.time() - start_ts)
-            job_total_seconds.observe(duration)
-            duration_observed = True
+    start_ts = _job_start_times.pop(run_id, None)
+    worker_active.set(len(_job_start_times))
+    if start_ts is not None:
+        duration = time.monotonic() - start_ts
+        job_total_seconds.observe(duration)
+        duration_observed = True
 
     if status == "completed":
         jobs_completed_total.inc()
     else:
         reason_label = failure_reason or "unknown"
         jobs_failed_total.labels(reason=reason_label).inc()
+    _forget_run(run_id)
 
     if not duration_observed:
-        logger.debug(f"[metrics] No start timestamp recorded for run_id={run_id}; skipping job_total_seconds")
+        logger.debug("[metrics] No start timestamp recorded for run_id=%s; skipping job_total_seconds", run_id)
 
 
 @activity.defn
@@ -630,20 +1135,23 @@ async def generate_image(
     comfyui_workflow_name: str | None = None,
     image_style: str | None = None,
 ) -> str:
-    """Generates a single image from a text prompt."""
+    """Generates a single image from a text prompt.
+
+    Network-bound (waits on ComfyUI); safe to run concurrently up to the
+    ComfyUI queue depth.
+    """
     activity.heartbeat()
-    logger.info(f"Generating image for prompt index {index}")
+    logger.info("Generating image for prompt index %s", index)
 
     # Determine length bucket for this run (used for aggregated GPU timing)
-    length_bucket = _load_length_bucket(run_id)
+    length_bucket = await _aload_length_bucket(run_id)
 
     # Convert string path to Path object
     workflow_path = Path(workflow_path)
 
-    # Force refresh the client to get latest configuration
-    client = get_comfyui_client(ClientType.IMAGE, force_refresh=True)
+    client = get_comfyui_client(ClientType.IMAGE)
 
-    start_time = time.time()
+    start_time = time.monotonic()
     width = int(image_width) if image_width is not None else int(IMAGE_WIDTH)
     height = int(image_height) if image_height is not None else int(IMAGE_HEIGHT)
     prompt_id = await asyncio.to_thread(
@@ -655,25 +1163,52 @@ async def generate_image(
         image_height=height,
         image_style=image_style,
     )
-    filenames = await _run_in_thread_with_heartbeats(
-        client.poll_until_complete,
+    filenames = await _poll_comfyui_outputs(
+        client,
         prompt_id,
         timeout_s=int(IMAGE_JOB_TIMEOUT_SECONDS),
         poll_interval_s=float(IMAGE_POLL_INTERVAL_SECONDS),
-        heartbeat_interval_s=30.0,
     )
-    duration = time.time() - start_time
+    duration = time.monotonic() - start_time
 
     if length_bucket is not None:
-        total_images_generation_seconds.labels(length_bucket=length_bucket).observe(duration)
+        total_images_generation_seconds_by_bucket[length_bucket].observe(duration)
 
     if not filenames:
         raise RuntimeError(f"Image generation failed for prompt index {index}: No output files.")
-    return filenames[0]
+
+    first_hint = filenames[0]
+    # RunPod returns base64 data URLs; keep multi-MB strings out of Temporal
+    # payloads by decoding to disk here and returning the short path instead.
+    if first_hint.startswith("data:image/"):
+        image_path = await asyncio.to_thread(_persist_data_url_image, first_hint, DATA_SHARED_BASE / run_id / "frames")
+        logger.info("[image] Saved image for prompt index %s to %s", index, image_path)
+        return str(image_path)
+    return first_hint
+
+
+def _persist_data_url_image(data_url: str, dest_dir: Path) -> Path:
+    """Decode a ``data:image/...;base64,`` URL to ``dest_dir`` and return the path.
+
+    Files are content-addressed by a SHA-1 prefix so the same image is only
+    written once.
+    """
+    header, _, payload = data_url.partition(",")
+    media_type = header[5:].split(";", 1)[0].lower()
+    ext = media_type.split("/", 1)[1] if "/" in media_type else "png"
+    if ext == "jpeg":
+        ext = "jpg"
+    raw = _fast_base64.b64decode(payload)
+    digest = hashlib.sha1(raw).hexdigest()[:12]
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    image_path = dest_dir / f"{digest}.{ext}"
+    if not image_path.exists():
+        image_path.write_bytes(raw)
+    return image_path
 
 
 @activity.defn
-async def upload_image_for_video_generation(image_hint: str) -> str:
+async def upload_image_for_video_generation(image_hint: str, run_id: str | None = None) -> str:
     """Process image for video generation.
     
     For RunPod: Returns the local file path. The client will handle reading and converting to base64.
@@ -681,101 +1216,103 @@ async def upload_image_for_video_generation(image_hint: str) -> str:
     
     Args:
         image_hint: Either base64 image data, data URL, or local file path.
+        run_id: Optional run identifier; decoded data URLs are stored under its run directory.
     
     Returns:
-        For RunPod: Local file path or base64 data URL
+        For RunPod: Local file path
         For Local: Uploaded filename in ComfyUI
     """
     activity.heartbeat()
-    
+    return await _prepare_video_image_input(image_hint, run_id)
+
+
+async def _prepare_video_image_input(image_hint: str, run_id: str | None = None) -> str:
+    """Turn an image hint into the input expected by the video generation client."""
     from videomerge.config import RUN_ENV
     
-    # Check if this is already a RunPod base64 image data URL
+    # Decode base64 data URLs to disk so only a short path travels through
+    # Temporal payloads and workflow history.
     if image_hint.startswith("data:image/"):
-        logger.info(f"[RunPod] Passing through base64 image data for video generation: {image_hint[:50]}...")
-        return image_hint
+        frames_dir = (DATA_SHARED_BASE / run_id if run_id else TMP_BASE) / "frames"
+        image_path = await asyncio.to_thread(_persist_data_url_image, image_hint, frames_dir)
+        logger.info("Decoded base64 image data for video generation to %s", image_path)
+        image_hint = str(image_path)
         
     if RUN_ENV == "runpod":
-        logger.info(f"[RunPod] Returning local file path for video generation client to read later: {image_hint}")
+        logger.info("[RunPod] Returning local file path for video generation client to read later: %s", image_hint)
         return image_hint
         
     # Local environment
-    client = get_comfyui_client(ClientType.VIDEO, force_refresh=True)
+    client = get_comfyui_client(ClientType.VIDEO)
 
-    if image_hint.startswith("/data/shared/") or "\\" in image_hint or "/" in image_hint:
+    if "/" in image_hint or "\\" in image_hint:
         # This is a local file path from poll_image_generation
-        logger.info(f"[Local] Reading image file for video generation: {image_hint}")
+        logger.info("[Local] Reading image file for video generation: %s", image_hint)
         
-        # Read the file directly
-        with open(image_hint, "rb") as f:
-            content = f.read()
+        # Stream the file from disk rather than reading it into memory
         filename = Path(image_hint).name
-        
-        uploaded_filename = await asyncio.to_thread(
-            client.upload_image_to_input, filename, content, overwrite=True
-        )
-        logger.info(f"[Local] Uploaded image {image_hint} as {uploaded_filename}")
+        with open(image_hint, "rb") as f:
+            uploaded_filename = await asyncio.to_thread(
+                client.upload_image_to_input, filename, f, overwrite=True
+            )
+        logger.info("[Local] Uploaded image %s as %s", image_hint, uploaded_filename)
         return uploaded_filename
     else:
         # For local development, upload the image to ComfyUI
-        logger.info(f"[Local] Fetching and uploading image {image_hint} to ComfyUI input directory.")
-        
-        filename, content = await asyncio.to_thread(client.fetch_output_bytes, image_hint)
-        uploaded_filename = await asyncio.to_thread(
-            client.upload_image_to_input, filename, content, overwrite=True
-        )
-        logger.info(f"[Local] Uploaded image {image_hint} as {uploaded_filename}")
+        logger.info("[Local] Fetching and uploading image %s to ComfyUI input directory.", image_hint)
+
+        # Stage the output on disk and stream it back up, instead of holding
+        # the whole image in memory between download and upload.
+        with tempfile.TemporaryDirectory(prefix="comfyui-upload-") as tmp_dir:
+            local_path = await asyncio.to_thread(client.fetch_output_to_file, image_hint, Path(tmp_dir))
+            with open(local_path, "rb") as f:
+                uploaded_filename = await asyncio.to_thread(
+                    client.upload_image_to_input, local_path.name, f, overwrite=True
+                )
+        logger.info("[Local] Uploaded image %s as %s", image_hint, uploaded_filename)
         return uploaded_filename
 
 
 @activity.defn
 async def generate_video_from_image(run_id: str, video_prompt: str, image_input: str, index: int) -> List[str]:
-    """Generates a video clip from an image and a video prompt."""
+    """Generates a video clip from an image and a video prompt.
+
+    Network-bound (waits on ComfyUI); safe to run concurrently up to the
+    ComfyUI queue depth.
+    """
     activity.heartbeat()
     run_dir = DATA_SHARED_BASE / run_id
-    logger.info(f"Generating video for prompt index {index}")
+    logger.info("Generating video for prompt index %s", index)
 
-    length_bucket = _load_length_bucket(run_id)
+    length_bucket = await _aload_length_bucket(run_id)
 
-    # Force refresh the client to get latest configuration
-    client = get_comfyui_client(ClientType.VIDEO, force_refresh=True)
+    client = get_comfyui_client(ClientType.VIDEO)
 
-    start_time = time.time()
-    prompt_id = await asyncio.to_thread(
+    start_time = time.monotonic()
+    prompt_id = await _run_in_thread_with_heartbeats(
         client.submit_image_to_video,
         video_prompt,
         image_input,
         template_path=WORKFLOW_I2V_PATH,
         run_id=run_id,
     )
-    video_hints = await _run_in_thread_with_heartbeats(
-        client.poll_until_complete,
+    video_hints = await _poll_comfyui_outputs(
+        client,
         prompt_id,
         timeout_s=int(VIDEO_JOB_TIMEOUT_SECONDS),
         poll_interval_s=float(VIDEO_POLL_INTERVAL_SECONDS),
-        heartbeat_interval_s=30.0,
     )
-    saved_files = await asyncio.to_thread(client.download_outputs, video_hints, run_dir)
-    duration = time.time() - start_time
-
-    # Rename files to sequential prefixed names
-    renamed_files = []
-    for p in saved_files:
-        original_name = p.name
-        if original_name.startswith("000_"):
-            uuid_part = original_name[4:]  # remove "000_"
-            new_name = f"{index:03d}_{uuid_part}"
-            new_path = p.parent / new_name
-            p.rename(new_path)
-            renamed_files.append(new_path)
-        else:
-            renamed_files.append(p)
+    # Files are saved under their sequential {index:03d}_ names directly.
+    saved_files = await _run_async_with_heartbeats(
+        _download_comfyui_outputs, client, video_hints, run_dir, index=index
+    )
+    duration = time.monotonic() - start_time
 
     if length_bucket is not None:
-        total_videos_generation_seconds.labels(length_bucket=length_bucket).observe(duration)
+        total_videos_generation_seconds_by_bucket[length_bucket].observe(duration)
 
-    logger.info(f"Video generated for prompt index {index}: {renamed_files}")
-    return [str(p) for p in renamed_files]
+    logger.info("Video generated for prompt index %s: %d file(s)", index, len(saved_files))
+    return [str(p) for p in saved_files]
 
 
 @activity.defn
@@ -795,7 +1332,7 @@ async def start_image_generation(
     logger.info(f"Submitting image generation for prompt index {index}")
 
     workflow_path_obj = Path(workflow_path)
-    client = get_comfyui_client(ClientType.IMAGE, force_refresh=True)
+    client = get_comfyui_client(ClientType.IMAGE)
 
     width = int(image_width) if image_width is not None else int(IMAGE_WIDTH)
     height = int(image_height) if image_height is not None else int(IMAGE_HEIGHT)
@@ -818,13 +1355,12 @@ async def poll_image_generation(prompt_id: str, run_id: str, index: int) -> str:
     activity.heartbeat()
     logger.info(f"Polling image generation for prompt index {index}")
 
-    client = get_comfyui_client(ClientType.IMAGE, force_refresh=True)
-    filenames = await _run_in_thread_with_heartbeats(
-        client.poll_until_complete,
+    client = get_comfyui_client(ClientType.IMAGE)
+    filenames = await _poll_comfyui_outputs(
+        client,
         prompt_id,
         timeout_s=int(IMAGE_JOB_TIMEOUT_SECONDS),
         poll_interval_s=float(IMAGE_POLL_INTERVAL_SECONDS),
-        heartbeat_interval_s=30.0,
     )
     if not filenames:
         raise RuntimeError(f"Image generation failed for prompt index {index}: No output files.")
@@ -835,8 +1371,7 @@ async def poll_image_generation(prompt_id: str, run_id: str, index: int) -> str:
     # If it's a data URL (RunPod), save to disk to avoid Temporal payload size limit
     if first_hint.startswith("data:"):
         logger.info(f"[image] Saving base64 image data to disk for prompt index {index}")
-        run_dir = DATA_SHARED_BASE / run_id
-        run_dir.mkdir(parents=True, exist_ok=True)
+        run_dir = _ensure_run_dir(run_id)
 
         filename, content = await asyncio.to_thread(client.fetch_output_bytes, first_hint)
         image_path = run_dir / filename
@@ -874,7 +1409,7 @@ async def start_video_generation(
     activity.heartbeat()
     logger.info(f"Submitting video generation for prompt index {index}")
 
-    client = get_comfyui_client(ClientType.VIDEO, force_refresh=True)
+    client = get_comfyui_client(ClientType.VIDEO)
     prompt_id = await asyncio.to_thread(
         client.submit_image_to_video,
         video_prompt,
@@ -896,29 +1431,17 @@ async def poll_video_generation(prompt_id: str, run_id: str, index: int) -> List
     run_dir = DATA_SHARED_BASE / run_id
     logger.info(f"Polling video generation for prompt index {index}")
 
-    client = get_comfyui_client(ClientType.VIDEO, force_refresh=True)
-    video_hints = await _run_in_thread_with_heartbeats(
-        client.poll_until_complete,
+    client = get_comfyui_client(ClientType.VIDEO)
+    video_hints = await _poll_comfyui_outputs(
+        client,
         prompt_id,
         timeout_s=int(VIDEO_JOB_TIMEOUT_SECONDS),
         poll_interval_s=float(VIDEO_POLL_INTERVAL_SECONDS),
-        heartbeat_interval_s=30.0,
     )
-    saved_files = await asyncio.to_thread(client.download_outputs, video_hints, run_dir)
-
-    renamed_files = []
-    for p in saved_files:
-        original_name = p.name
-        if original_name.startswith("000_"):
-            uuid_part = original_name[4:]
-            new_name = f"{index:03d}_{uuid_part}"
-            new_path = p.parent / new_name
-            p.rename(new_path)
-            renamed_files.append(new_path)
-        else:
-            renamed_files.append(p)
-
-    return [str(p) for p in renamed_files]
+    saved_files = await _run_async_with_heartbeats(
+        _download_comfyui_outputs, client, video_hints, run_dir, index=index
+    )
+    return [str(p) for p in saved_files]
 
 
 @activity.defn
@@ -929,22 +1452,22 @@ async def stitch_videos(run_id: str, video_paths: List[str], voiceover_path: str
     output_path = run_dir / "stitched_output.mp4"
     logger.info(f"Stitching {len(video_paths)} videos for run_id={run_id}")
 
-    length_bucket = _load_length_bucket(run_id)
+    length_bucket = await _aload_length_bucket(run_id)
 
     from videomerge.config import VIDEO_SPEED_FACTOR
 
-    start_time = time.time()
-    await asyncio.to_thread(
+    start_time = time.monotonic()
+    await _run_in_process_with_heartbeats(
         concat_videos_with_voiceover,
-        [Path(p) for p in video_paths],
-        Path(voiceover_path),
+        video_paths,
+        voiceover_path,
         output_path,
         video_speed_factor=VIDEO_SPEED_FACTOR,
     )
-    duration = time.time() - start_time
+    duration = time.monotonic() - start_time
 
     if length_bucket is not None:
-        stitch_seconds.labels(length_bucket=length_bucket).observe(duration)
+        stitch_seconds_by_bucket[length_bucket].observe(duration)
 
     logger.info(f"Stitching complete for run_id={run_id}")
     return str(output_path)
@@ -958,25 +1481,67 @@ async def burn_subtitles_into_video(run_id: str, stitched_video_path: str, langu
     final_path = run_dir / "final_video.mp4"
     logger.info(f"Generating and burning subtitles for run_id={run_id}")
 
-    length_bucket = _load_length_bucket(run_id)
+    length_bucket = await _aload_length_bucket(run_id)
 
-    start_time = time.time()
-    await asyncio.to_thread(
+    start_time = time.monotonic()
+    await _run_in_process_with_heartbeats(
         generate_and_burn_subtitles,
-        Path(stitched_video_path),
+        stitched_video_path,
         final_path,
         language=language,
-        audio_hint=Path(voiceover_path),
+        audio_hint=voiceover_path,
     )
-    duration = time.time() - start_time
+    duration = time.monotonic() - start_time
 
     if length_bucket is not None:
-        subtitles_seconds.labels(length_bucket=length_bucket).observe(duration)
+        subtitles_seconds_by_bucket[length_bucket].observe(duration)
 
     logger.info(f"Subtitles burned successfully for run_id={run_id}")
     return str(final_path)
 
 
+@activity.defn
+async def stitch_and_finalize(run_id: str, video_paths: List[str], voiceover_path: str, language: str) -> str:
+    """Stitches video clips with the voiceover and burns subtitles in one encode."""
+    activity.heartbeat()
+    run_dir = DATA_SHARED_BASE / run_id
+    final_path = run_dir / "final_video.mp4"
+    logger.info(f"Stitching {len(video_paths)} videos with subtitles for run_id={run_id}")
+
+    length_bucket = await _aload_length_bucket(run_id)
+
+    from videomerge.config import VIDEO_SPEED_FACTOR
+
+    # Transcription and the fused concat + burn-in encode are timed separately
+    # so subtitles_seconds and stitch_seconds keep covering their own phases.
+    start_time = time.monotonic()
+    srt_path = await _run_in_process_with_heartbeats(
+        transcribe_to_srt,
+        voiceover_path,
+        run_dir / "generated.srt",
+        language=language,
+    )
+    subtitles_duration = time.monotonic() - start_time
+
+    start_time = time.monotonic()
+    await _run_in_process_with_heartbeats(
+        concat_and_burn_subtitles,
+        video_paths,
+        voiceover_path,
+        srt_path,
+        final_path,
+        video_speed_factor=VIDEO_SPEED_FACTOR,
+    )
+    stitch_duration = time.monotonic() - start_time
+
+    if length_bucket is not None:
+        subtitles_seconds_by_bucket[length_bucket].observe(subtitles_duration)
+        stitch_seconds_by_bucket[length_bucket].observe(stitch_duration)
+
+    logger.info(f"Stitch and subtitles complete for run_id={run_id}")
+    return str(final_path)
+
+
 @activity.defn
 async def send_completion_webhook(
     run_id: str,
@@ -1035,32 +1600,32 @@ async def send_completion_webhook(
         payload["platform"] = platform
 
     event_type = "job_completed" if status == "completed" else "job_failed"
+    # Delivered inside the activity so a failed POST fails the activity and is
+    # retried durably by Temporal; metrics are only recorded once it succeeds.
     logger.info(f"Sending '{event_type}' webhook for run_id={run_id}")
     await webhook_manager.send_webhook(VIDEO_COMPLETED_N8N_WEBHOOK_URL, payload, event_type)
 
     # Record a completed video for this length bucket when the job finishes
     if status == "completed":
-        length_bucket = _load_length_bucket(run_id)
+        length_bucket = await _aload_length_bucket(run_id)
         if length_bucket is not None:
-            videos_completed_total.labels(length_bucket=length_bucket).inc()
+            videos_completed_total_by_bucket[length_bucket].inc()
         jobs_completed_total.inc()
     else:
         reason_label = failure_reason or "unknown"
         jobs_failed_total.labels(reason=reason_label).inc()
 
     duration_observed = False
-    async with _metrics_lock:
-        start_ts = _job_start_times.pop(run_id, None)
-        if run_id in _active_runs:
-            _active_runs.remove(run_id)
-        worker_active.set(len(_active_runs))
-        if start_ts is not None:
-            duration = max(0.0, time.time() - start_ts)
-            job_total_seconds.observe(duration)
-            duration_observed = True
+    start_ts = _job_start_times.pop(run_id, None)
+    worker_active.set(len(_job_start_times))
+    if start_ts is not None:
+        duration = time.monotonic() - start_ts
+        job_total_seconds.observe(duration)
+        duration_observed = True
+    _forget_run(run_id)
 
     if not duration_observed:
-        logger.debug(f"[metrics] No start timestamp recorded for run_id={run_id}; skipping job_total_seconds")
+        logger.debug("[metrics] No start timestamp recorded for run_id=%s; skipping job_total_seconds", run_id)
 
 
 @activity.defn
@@ -1073,19 +1638,113 @@ async def download_video(video_url: str, video_id: str) -> str:
 
     logger.info(f"[download] Downloading video from {video_url} for video_id={video_id}")
 
-    async with httpx.AsyncClient(timeout=300.0) as client:  # 5 minute timeout
-        response = await client.get(video_url)
+    client = _get_shared_http_client()
+    # Stream to disk so large inputs are never held in memory in full.
+    async with client.stream("GET", video_url, timeout=300.0) as response:  # 5 minute timeout
+        if response.is_error:
+            body = (await response.aread())[:500].decode("utf-8", errors="replace")
+            raise RuntimeError(f"Failed to download video from {video_url} with status {response.status_code}: {body}")
+        # Disk writes run in worker threads so the event loop shared with
+        # workflow tasks and heartbeats never blocks on I/O.
+        f = await asyncio.to_thread(open, video_path, "wb")
         try:
-            response.raise_for_status()
-        except httpx.HTTPStatusError as exc:
-            raise RuntimeError(f"Failed to download video from {video_url} with status {response.status_code}: {response.text[:500]}") from exc
-        with open(video_path, "wb") as f:
-            f.write(response.content)
+            async for chunk in response.aiter_bytes(1 << 20):
+                await asyncio.to_thread(f.write, chunk)
+                _safe_heartbeat()
+        finally:
+            await asyncio.to_thread(f.close)
 
     logger.info(f"[download] Video downloaded successfully to {video_path}")
     return str(video_path)
 
 
+async def _ffprobe_json(args: List[str]) -> Dict[str, Any]:
+    """Run ``ffprobe -of json`` with ``args`` as a native asyncio subprocess."""
+    proc = await asyncio.create_subprocess_exec(
+        "ffprobe",
+        "-v",
+        "error",
+        "-of",
+        "json",
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    out, err = await proc.communicate()
+    if proc.returncode:
+        raise RuntimeError(
+            f"ffprobe exited with status {proc.returncode}: {err.decode('utf-8', errors='replace')[:500]}"
+        )
+    return _loads_json(out or b"{}")
+
+
+def _parse_upscale_probe(probe: Dict[str, Any]) -> tuple[int, int, int]:
+    """Return ``(width, height, frame_count)`` from parsed ffprobe JSON.
+
+    The frame count comes from the container's ``nb_frames`` when present,
+    otherwise it is estimated as ``duration * avg_frame_rate``.
+    """
+    try:
+        stream = (probe.get("streams") or [{}])[0]
+        width, height = int(stream["width"]), int(stream["height"])
+    except (ValueError, KeyError, TypeError, IndexError) as e:
+        raise RuntimeError(f"Failed to get video dimensions: {e}")
+
+    nb_frames = str(stream.get("nb_frames") or "")
+    if nb_frames.isdigit() and int(nb_frames) > 0:
+        return width, height, int(nb_frames)
+
+    duration_seconds: float | None = None
+    fps: float | None = None
+    try:
+        duration_seconds = float((probe.get("format") or {}).get("duration"))
+    except (TypeError, ValueError):
+        pass
+    raw_fps = str(stream.get("avg_frame_rate") or "")
+    try:
+        if raw_fps and raw_fps != "0/0":
+            num_str, _, den_str = raw_fps.partition("/")
+            den = float(den_str) if den_str else 1.0
+            if den != 0:
+                fps = float(num_str) / den
+    except ValueError:
+        pass
+
+    if duration_seconds is None or fps is None:
+        raise RuntimeError(
+            f"Failed to determine video frame count for upscaling (nb_frames unavailable; duration={duration_seconds}, fps={fps})"
+        )
+    return width, height, max(1, int(round(duration_seconds * fps)))
+
+
+def _build_upscale_request_body(
+    video_path: str, input_fields: Dict[str, Any], webhook: Optional[str] = None
+) -> bytes:
+    """Build the RunPod upscale JSON body with the clip inlined as a data URL.
+
+    The endpoint only accepts the video inline, so the body is assembled
+    directly: the file is base64-encoded chunk by chunk into one buffer instead
+    of holding the raw bytes, the base64 string, the data URL and the
+    serialized JSON as separate full-size copies. ``webhook`` is RunPod's
+    top-level completion callback URL.
+    """
+    body = bytearray(b'{"input": {"video": "data:video/mp4;base64,')
+    with open(video_path, "rb") as f:
+        while True:
+            encoded_chunk = _read_and_b64encode_chunk(f, 3 * 1024 * 1024)
+            if not encoded_chunk:
+                break
+            body += encoded_chunk
+    body += b'"'
+    for key, value in input_fields.items():
+        body += f", {json.dumps(key)}: {json.dumps(value)}".encode("utf-8")
+    body += b"}"
+    if webhook:
+        body += f", \"webhook\": {json.dumps(webhook)}".encode("utf-8")
+    body += b"}"
+    return bytes(body)
+
+
 @activity.defn
 async def start_video_upscaling(video_id: str, video_path: str, target_resolution: str) -> str:
     """Prepares video for upscaling, converts to base64, gets dimensions, and calls Runpod."""
@@ -1099,152 +1758,64 @@ async def start_video_upscaling(video_id: str, video_path: str, target_resolutio
     else:
         raise ValueError(f"Unsupported target_resolution: {target_resolution}")
 
-    # Get video dimensions using ffmpeg
-    probe_cmd = [
-        "ffprobe", "-v", "error", "-select_streams", "v:0", "-show_entries", 
-        "stream=width,height", "-of", "csv=s=x:p=0", video_path
-    ]
+    # One ffprobe pass for dimensions, frame count and the duration/fps fallback.
+    # -count_frames is deliberately not used: it decodes the whole stream.
     try:
-        result = subprocess.run(probe_cmd, capture_output=True, text=True, check=True)
-        width, height = map(int, result.stdout.strip().split('x'))
-        logger.info(f"[upscale] Video dimensions: {width}x{height}")
-    except subprocess.CalledProcessError as e:
-        logger.error(f"[upscale] Failed to get video dimensions: {e}")
+        probe = await _ffprobe_json(
+            [
+                "-select_streams",
+                "v:0",
+                "-show_entries",
+                "stream=width,height,nb_frames,avg_frame_rate:format=duration",
+                video_path,
+            ]
+        )
+    except RuntimeError as e:
+        logger.error(f"[upscale] Failed to probe video: {e}")
         raise RuntimeError(f"Failed to get video dimensions: {e}")
-
-    # Get video frame count for batch_size calculation
-    frame_count: int | None = None
-    batch_size: int
-
-    frame_probe_cmd = [
-        "ffprobe",
-        "-v",
-        "error",
-        "-count_frames",
-        "-select_streams",
-        "v:0",
-        "-show_entries",
-        "stream=nb_read_frames",
-        "-of",
-        "default=nokey=1:noprint_wrappers=1",
-        video_path,
-    ]
-    try:
-        result = subprocess.run(frame_probe_cmd, capture_output=True, text=True, check=True)
-        raw = result.stdout.strip()
-        if raw.isdigit():
-            frame_count = int(raw)
-    except subprocess.CalledProcessError as e:
-        logger.warning(f"[upscale] Failed to get video frame count via nb_read_frames: {e}")
-
-    if frame_count is None:
-        frame_probe_cmd = [
-            "ffprobe",
-            "-v",
-            "error",
-            "-select_streams",
-            "v:0",
-            "-show_entries",
-            "stream=nb_frames",
-            "-of",
-            "default=nokey=1:noprint_wrappers=1",
-            video_path,
-        ]
-        try:
-            result = subprocess.run(frame_probe_cmd, capture_output=True, text=True, check=True)
-            raw = result.stdout.strip()
-            if raw.isdigit():
-                frame_count = int(raw)
-        except subprocess.CalledProcessError as e:
-            logger.warning(f"[upscale] Failed to get video frame count via nb_frames: {e}")
-
-    if frame_count is None:
-        duration_seconds: float | None = None
-        fps: float | None = None
-
-        duration_cmd = [
-            "ffprobe",
-            "-v",
-            "error",
-            "-show_entries",
-            "format=duration",
-            "-of",
-            "default=nokey=1:noprint_wrappers=1",
-            video_path,
-        ]
-        try:
-            result = subprocess.run(duration_cmd, capture_output=True, text=True, check=True)
-            raw = result.stdout.strip()
-            if raw:
-                duration_seconds = float(raw)
-        except (subprocess.CalledProcessError, ValueError) as e:
-            logger.warning(f"[upscale] Failed to get video duration for frame estimation: {e}")
-
-        fps_cmd = [
-            "ffprobe",
-            "-v",
-            "error",
-            "-select_streams",
-            "v:0",
-            "-show_entries",
-            "stream=avg_frame_rate",
-            "-of",
-            "default=nokey=1:noprint_wrappers=1",
-            video_path,
-        ]
-        try:
-            result = subprocess.run(fps_cmd, capture_output=True, text=True, check=True)
-            raw = result.stdout.strip()
-            if raw and raw != "0/0":
-                if "/" in raw:
-                    num_str, den_str = raw.split("/", 1)
-                    num = float(num_str)
-                    den = float(den_str)
-                    if den != 0:
-                        fps = num / den
-                else:
-                    fps = float(raw)
-        except (subprocess.CalledProcessError, ValueError) as e:
-            logger.warning(f"[upscale] Failed to get video fps for frame estimation: {e}")
-
-        if duration_seconds is None or fps is None:
-            raise RuntimeError(
-                f"Failed to determine video frame count for upscaling (nb_read_frames/nb_frames unavailable; duration={duration_seconds}, fps={fps})"
-            )
-
-        frame_count = max(1, int(round(duration_seconds * fps)))
+    width, height, frame_count = _parse_upscale_probe(probe)
+    logger.info(f"[upscale] Video dimensions: {width}x{height}")
 
     batch_size = UPSCALE_BATCH_SIZE
     logger.info(f"[upscale] Video frame count: {frame_count}, using batch_size: {batch_size}")
 
-    # Convert video to base64
-    with open(video_path, "rb") as f:
-        video_data = f.read()
-    video_b64 = base64.b64encode(video_data).decode('utf-8')
-    video_data_url = f"data:video/mp4;base64,{video_b64}"
-
     # Call Runpod API
     url = f"{RUNPOD_BASE_URL}/v2/{RUNPOD_VIDEO_INSTANCE_ID}/run"
     headers = {
         "Authorization": f"Bearer {RUNPOD_API_KEY}",
         "Content-Type": "application/json",
     }
-    payload = {
-        "input": {
-            "video": video_data_url,
+    # With a callback URL configured, RunPod notifies the API on completion and
+    # the API signals this activity's workflow (see routers/upscale.py).
+    webhook = None
+    if UPSCALE_CALLBACK_BASE_URL and UPSCALE_CALLBACK_TOKEN:
+        webhook = (
+            f"{UPSCALE_CALLBACK_BASE_URL}/upscale/runpod/callback/{activity.info().workflow_id}"
+            f"?token={quote(UPSCALE_CALLBACK_TOKEN, safe='')}"
+        )
+    body = await asyncio.to_thread(
+        _build_upscale_request_body,
+        video_path,
+        {
             "width": width,
             "height": height,
             "output_resolution": output_resolution,
             "comfyui_workflow_name": "seedvr2_video_upscale",
             "comfy_org_api_key": COMFY_ORG_API_KEY,
             "batch_size": batch_size,
-        }
-    }
+        },
+        webhook,
+    )
+    if UPSCALE_GZIP_REQUEST:
+        # Level 1: the MP4 itself is incompressible; this only claws back the
+        # base64 expansion, so spend as little CPU as possible on it.
+        body = await asyncio.to_thread(gzip.compress, body, compresslevel=1)
+        headers["Content-Encoding"] = "gzip"
 
     logger.info(f"[upscale] Calling Runpod upscaling API for video_id={video_id}")
 
     async with httpx.AsyncClient(timeout=float(RUNPOD_UPSCALE_HTTP_TIMEOUT_SECONDS)) as client:
-        response = await client.post(url, json=payload, headers=headers)
+        response = await client.post(url, content=body, headers=headers)
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError as exc:
@@ -1253,7 +1824,7 @@ async def start_video_upscaling(video_id: str, video_path: str, target_resolutio
                 raise RuntimeError(f"ComfyUI job submission failed with status {response.status_code}: {error_detail}") from exc
             except Exception:
                 raise RuntimeError(f"ComfyUI job submission failed with status {response.status_code}: {response.text}") from exc
-        data = response.json()
+        data = _response_json(response)
         job_id = data.get("id")
         if not job_id:
             raise RuntimeError(f"Runpod API did not return job_id: {data}")
@@ -1280,9 +1851,11 @@ async def poll_upscale_status(job_id: str, run_id: str, video_id: str) -> str:
     queue_start_time: float | None = None
     running_start_time: float | None = None
 
-    while time.time() - start_time < UPSCALE_JOB_TIMEOUT_SECONDS:
-        activity.heartbeat()
-        async with httpx.AsyncClient(timeout=float(RUNPOD_UPSCALE_HTTP_TIMEOUT_SECONDS)) as client:
+    # One client for the whole poll so every status check reuses the same
+    # keep-alive connection to RunPod.
+    async with httpx.AsyncClient(timeout=float(RUNPOD_UPSCALE_HTTP_TIMEOUT_SECONDS)) as client:
+        while time.time() - start_time < UPSCALE_JOB_TIMEOUT_SECONDS:
+            activity.heartbeat()
             response = await client.get(status_url, headers=headers)
             try:
                 response.raise_for_status()
@@ -1292,59 +1865,54 @@ async def poll_upscale_status(job_id: str, run_id: str, video_id: str) -> str:
                     raise RuntimeError(f"ComfyUI status check failed with status {response.status_code}: {error_detail}") from exc
                 except Exception:
                     raise RuntimeError(f"ComfyUI status check failed with status {response.status_code}: {response.text}") from exc
-            data = response.json()
-
-        status = data.get("status", "").upper()
-        logger.debug(f"[upscale] Runpod job status: {status}")
-
-        if status == "COMPLETED":
-            outputs = data.get("output", {}).get("output", [])
-            videos = outputs.get("videos", [])
-            if videos:
-                video_data_b64 = videos[0].get("data")
-                if video_data_b64:
-                    logger.info(f"[upscale] Upscaling completed, saving to disk")
-                    
-                    # Save video directly to disk to avoid Temporal payload size limit
-                    run_dir = DATA_SHARED_BASE / run_id
-                    run_dir.mkdir(parents=True, exist_ok=True)
+            data = _response_json(response)
+
+            status = data.get("status", "").upper()
+            logger.debug("[upscale] Runpod job status: %s", status)
+
+            if status == "COMPLETED":
+                outputs = data.get("output", {}).get("output", [])
+                videos = outputs.get("videos", [])
+                if videos:
+                    video_data_b64 = videos[0].get("data")
+                    if video_data_b64:
+                        logger.info("[upscale] Upscaling completed, saving to disk")
                     
-                    payload = _strip_base64_data_url(video_data_b64)
-                    video_data = base64.b64decode(payload)
+                        # Save video directly to disk to avoid Temporal payload size limit
+                        run_dir = _ensure_run_dir(run_id)
                     
-                    upscaled_path = run_dir / f"{video_id}_upscaled.mp4"
-                    with open(upscaled_path, "wb") as f:
-                        f.write(video_data)
+                        upscaled_path = run_dir / f"{video_id}_upscaled.mp4"
+                        await _write_base64_to_file(video_data_b64, upscaled_path)
                     
-                    logger.info(f"[upscale] Saved upscaled video to {upscaled_path}")
-                    return str(upscaled_path)
-            raise RuntimeError("Runpod job completed but no video output found")
-
-        elif status in ("FAILED", "ERROR"):
-            error_msg = data.get("error", "Unknown Runpod error")
-            raise NonRetryableError(f"Runpod upscaling failed: {error_msg}")
-
-        elif status in ("IN_QUEUE", "RUNNING", "IN_PROGRESS"):
-            now = time.time()
-            if status == "IN_QUEUE":
-                queue_start_time = queue_start_time or now
-                if queue_budget is not None and (now - queue_start_time) > queue_budget:
-                    raise TimeoutError(
-                        f"Timed out waiting in Runpod queue for upscaling job {job_id} "
-                        f"after {int(now - queue_start_time)}s"
-                    )
+                        logger.info("[upscale] Saved upscaled video to %s", upscaled_path)
+                        return str(upscaled_path)
+                raise RuntimeError("Runpod job completed but no video output found")
+
+            elif status in ("FAILED", "ERROR"):
+                error_msg = data.get("error", "Unknown Runpod error")
+                raise NonRetryableError(f"Runpod upscaling failed: {error_msg}")
+
+            elif status in ("IN_QUEUE", "RUNNING", "IN_PROGRESS"):
+                now = time.time()
+                if status == "IN_QUEUE":
+                    queue_start_time = queue_start_time or now
+                    if queue_budget is not None and (now - queue_start_time) > queue_budget:
+                        raise TimeoutError(
+                            f"Timed out waiting in Runpod queue for upscaling job {job_id} "
+                            f"after {int(now - queue_start_time)}s"
+                        )
+                else:
+                    running_start_time = running_start_time or now
+                    if running_budget is not None and (now - running_start_time) > running_budget:
+                        raise TimeoutError(
+                            f"Timed out waiting for Runpod upscaling job {job_id} to finish running "
+                            f"after {int(now - running_start_time)}s"
+                        )
+                await asyncio.sleep(UPSCALE_POLL_INTERVAL_SECONDS)
+                continue
             else:
-                running_start_time = running_start_time or now
-                if running_budget is not None and (now - running_start_time) > running_budget:
-                    raise TimeoutError(
-                        f"Timed out waiting for Runpod upscaling job {job_id} to finish running "
-                        f"after {int(now - running_start_time)}s"
-                    )
-            await asyncio.sleep(UPSCALE_POLL_INTERVAL_SECONDS)
-            continue
-        else:
-            await asyncio.sleep(UPSCALE_POLL_INTERVAL_SECONDS)
-            continue
+                await asyncio.sleep(UPSCALE_POLL_INTERVAL_SECONDS)
+                continue
 
     raise TimeoutError(f"Timed out waiting for Runpod upscaling job {job_id}")
 
@@ -1355,8 +1923,8 @@ async def list_run_videos_for_upscale(run_id: str) -> List[str]:
 
     activity.heartbeat()
     run_dir = DATA_SHARED_BASE / run_id
-    files = sorted(run_dir.glob("[0-9][0-9][0-9]_*.mp4"), key=lambda p: p.name)
-    return [str(p) for p in files]
+    names = await asyncio.to_thread(_list_file_names, run_dir, "[0-9][0-9][0-9]_*.mp4")
+    return [str(run_dir / name) for name in sorted(names)]
 
 
 @activity.defn
@@ -1365,8 +1933,8 @@ async def list_upscaled_videos(run_id: str) -> List[str]:
 
     activity.heartbeat()
     run_dir = DATA_SHARED_BASE / run_id
-    files = sorted(run_dir.glob("*_upscaled.mp4"), key=lambda p: p.name)
-    return [str(p) for p in files]
+    names = await asyncio.to_thread(_list_file_names, run_dir, "*_upscaled.mp4")
+    return [str(run_dir / name) for name in sorted(names)]
 
 
 @activity.defn
@@ -1381,12 +1949,10 @@ async def list_existing_video_clips(run_id: str) -> Dict[str, List[str]]:
     activity.heartbeat()
     run_dir = DATA_SHARED_BASE / run_id
     existing: Dict[str, List[str]] = {}
-    if not run_dir.exists():
-        return existing
-    for mp4 in sorted(run_dir.glob("[0-9][0-9][0-9]_*.mp4"), key=lambda p: p.name):
-        prefix = mp4.stem.split("_")[0]
+    for name in sorted(await asyncio.to_thread(_list_file_names, run_dir, "[0-9][0-9][0-9]_*.mp4")):
+        prefix = name.split("_")[0]
         if prefix.isdigit():
-            existing.setdefault(prefix, []).append(str(mp4))
+            existing.setdefault(prefix, []).append(str(run_dir / name))
     logger.info(
         "[list_existing_video_clips] run_id=%s — found clips for %d scene(s): indices=%s",
         run_id, len(existing), sorted(existing.keys()),
@@ -1404,25 +1970,50 @@ def _strip_base64_data_url(value: str) -> str:
     return value
 
 
+def _b64decode_and_write_chunk(f: BinaryIO, chunk: str) -> None:
+    """Decode one base64 ``chunk`` and append the bytes to ``f``."""
+    f.write(_fast_base64.b64decode(chunk))
+
+
+async def _write_base64_to_file(value: str, path: Path) -> None:
+    """Stream-decode a base64 string (or data URL) into ``path``.
+
+    The payload is decoded in 4 MiB slices (a multiple of 4 characters, so only
+    the last slice can carry padding) instead of materializing the whole decoded
+    video next to its encoding. Each decode+write runs off the event loop.
+    """
+    payload = _strip_base64_data_url(value)
+    if "\n" in payload or "\r" in payload:
+        # Embedded line breaks would shift the 4-character slice alignment.
+        payload = "".join(payload.split())
+
+    chunk_size = 4 * 1024 * 1024
+    with open(path, "wb") as f:
+        for start in range(0, len(payload), chunk_size):
+            await asyncio.to_thread(_b64decode_and_write_chunk, f, payload[start : start + chunk_size])
+            _safe_heartbeat()
+
+
 @activity.defn
 async def save_upscaled_video(run_id: str, video_id: str, upscaled_video_b64: str) -> str:
     """Persist an upscaled video (base64 or data URL) to the shared run directory."""
 
     activity.heartbeat()
-    run_dir = DATA_SHARED_BASE / run_id
-    run_dir.mkdir(parents=True, exist_ok=True)
-
-    payload = _strip_base64_data_url(upscaled_video_b64)
-    video_data = base64.b64decode(payload)
+    run_dir = _ensure_run_dir(run_id)
 
     upscaled_path = run_dir / f"{video_id}_upscaled.mp4"
-    with open(upscaled_path, "wb") as f:
-        f.write(video_data)
+    await _write_base64_to_file(upscaled_video_b64, upscaled_path)
 
     logger.info(f"Saved upscaled video to {upscaled_path}")
     return str(upscaled_path)
 
 
+def _read_and_b64encode_chunk(f: BinaryIO, size: int) -> bytes:
+    """Read up to ``size`` bytes from ``f`` and return them base64-encoded."""
+    chunk = f.read(size)
+    return _fast_base64.b64encode(chunk) if chunk else b""
+
+
 @activity.defn
 async def encode_file_to_base64(file_path: str) -> str:
     """Read a file and return its base64-encoded contents."""
@@ -1440,42 +2031,52 @@ async def encode_file_to_base64(file_path: str) -> str:
         logger.error(f"[encode_file_to_base64] File not found: {file_path}")
         raise FileNotFoundError(f"File not found: {file_path}")
     logger.info(f"[encode_file_to_base64] File exists confirmed")
-    
-    # Wait a moment to ensure file is fully written and closed by previous process
-    logger.info(f"[encode_file_to_base64] Sleeping for 2 seconds...")
-    await asyncio.sleep(2)
-    logger.info(f"[encode_file_to_base64] Sleep completed")
-    
+
+    # No settle delay: the producing activity has closed the file before it
+    # returned, and a transient OSError is retried below.
     # Get file size for logging
     file_size = file_path_obj.stat().st_size
     logger.info(f"Encoding file to base64: {file_path} (size: {file_size} bytes)")
     
-    # Read file in chunks to send heartbeats for large files
-    chunk_size = 10 * 1024 * 1024  # 10MB chunks
-    data = bytearray()
-    
+    # Encode while reading, in chunks that are a multiple of 3 bytes so no
+    # padding appears mid-stream. Each read+encode runs off the event loop and
+    # the raw bytes are never held in full alongside their encoding.
+    chunk_size = 3 * 1024 * 1024
+
+    # The output buffer is allocated once at its final size (4 bytes per 3 input
+    # bytes) so appending chunks never reallocates and copies the partial result.
+    encoded_size = 4 * ((file_size + 2) // 3)
+
     max_retries = 3
     for attempt in range(max_retries):
+        encoded_buf = bytearray(encoded_size)
+        written = 0
         try:
             with open(file_path, "rb") as f:
                 while True:
-                    chunk = f.read(chunk_size)
-                    if not chunk:
+                    encoded_chunk = await asyncio.to_thread(_read_and_b64encode_chunk, f, chunk_size)
+                    if not encoded_chunk:
                         break
-                    data.extend(chunk)
+                    encoded_buf[written : written + len(encoded_chunk)] = encoded_chunk
+                    written += len(encoded_chunk)
                     activity.heartbeat()
+            del encoded_buf[written:]
             break  # Success, exit retry loop
         except OSError as e:
             if attempt < max_retries - 1:
-                logger.warning(f"OSError reading file (attempt {attempt + 1}/{max_retries}): {e}. Retrying...")
-                await asyncio.sleep(2)
+                # Exponential backoff with jitter so clips that hit the same
+                # shared-storage hiccup don't retry in lock-step.
+                delay = min(30.0, 2.0 ** (attempt + 1)) + random.uniform(0, 1)
+                logger.warning(
+                    f"OSError reading file (attempt {attempt + 1}/{max_retries}): {e}. Retrying in {delay:.1f}s..."
+                )
+                await asyncio.sleep(delay)
             else:
                 logger.error(f"Failed to read file after {max_retries} attempts: {e}")
                 raise
-    
-    activity.heartbeat()
-    logger.info(f"Encoding {len(data)} bytes to base64")
-    encoded = base64.b64encode(data).decode("utf-8")
+
+    encoded = encoded_buf.decode("ascii")
+    del encoded_buf
     activity.heartbeat()
     logger.info(f"Base64 encoding complete, result length: {len(encoded)}")
     
@@ -1526,6 +2127,7 @@ async def send_upscale_completion_webhook(
     event_type = "job_completed" if status == "completed" else "job_failed"
     logger.info(f"Sending '{event_type}' webhook for run_id={run_id}")
     await webhook_manager.send_webhook(VIDEO_COMPLETED_N8N_WEBHOOK_URL, payload, event_type)
+    _forget_run(run_id)
 
 
 @activity.defn
@@ -1598,7 +2200,7 @@ async def handoff_to_compositor(payload: HandoffPayload) -> str:
             f"run_id={payload.run_id}: {error_detail}"
         )
 
-    data = response.json()
+    data = _response_json(response)
     compose_job_id = data.get("compose_job_id")
     if not compose_job_id:
         raise RuntimeError(
@@ -1642,8 +2244,7 @@ async def generate_talking_head_video(
     from videomerge.services.media_providers.fal_provider import FalProvider
 
     _safe_heartbeat()
-    run_dir = DATA_SHARED_BASE / run_id
-    run_dir.mkdir(parents=True, exist_ok=True)
+    run_dir = _ensure_run_dir(run_id)
 
     # Convert voiceover to WAV once per run (idempotent)
     wav_path = run_dir / "voiceover.wav"
@@ -1744,66 +2345,67 @@ async def poll_compose_status(
         url,
     )
 
-    while elapsed < timeout_seconds:
-        activity.heartbeat()
+    # Reuse one keep-alive connection to the compositor across polls.
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        while elapsed < timeout_seconds:
+            activity.heartbeat()
 
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            try:
                 response = await client.get(url)
-        except httpx.RequestError as exc:
-            logger.warning(
-                "[poll_compose] Network error polling compose_job_id=%s: %s — retrying",
-                compose_job_id,
-                exc,
-            )
-            await asyncio.sleep(poll_interval_seconds)
-            elapsed += poll_interval_seconds
-            continue
-
-        if not response.is_success:
-            logger.warning(
-                "[poll_compose] Unexpected %s from compositor for compose_job_id=%s — retrying",
-                response.status_code,
-                compose_job_id,
-            )
-            await asyncio.sleep(poll_interval_seconds)
-            elapsed += poll_interval_seconds
-            continue
-
-        data = response.json()
-        status = data.get("status")
+            except httpx.RequestError as exc:
+                logger.warning(
+                    "[poll_compose] Network error polling compose_job_id=%s: %s — retrying",
+                    compose_job_id,
+                    exc,
+                )
+                await asyncio.sleep(poll_interval_seconds)
+                elapsed += poll_interval_seconds
+                continue
+
+            if not response.is_success:
+                logger.warning(
+                    "[poll_compose] Unexpected %s from compositor for compose_job_id=%s — retrying",
+                    response.status_code,
+                    compose_job_id,
+                )
+                await asyncio.sleep(poll_interval_seconds)
+                elapsed += poll_interval_seconds
+                continue
 
-        logger.info(
-            "[poll_compose] compose_job_id=%s run_id=%s status=%s elapsed=%.0fs",
-            compose_job_id,
-            run_id,
-            status,
-            elapsed,
-        )
+            data = _response_json(response)
+            status = data.get("status")
 
-        if status == "done":
-            final_video_path = data.get("final_video_path")
-            if not final_video_path:
-                raise RuntimeError(
-                    f"[poll_compose] Compositor reported done but final_video_path is missing "
-                    f"for compose_job_id={compose_job_id}"
-                )
             logger.info(
-                "[poll_compose] compose_job_id=%s complete. final_video_path=%s",
+                "[poll_compose] compose_job_id=%s run_id=%s status=%s elapsed=%.0fs",
                 compose_job_id,
-                final_video_path,
+                run_id,
+                status,
+                elapsed,
             )
-            return final_video_path
 
-        if status == "failed":
-            error = data.get("error", "unknown error")
-            raise NonRetryableError(
-                f"[poll_compose] Compositor job failed for compose_job_id={compose_job_id} "
-                f"run_id={run_id}: {error}"
-            )
+            if status == "done":
+                final_video_path = data.get("final_video_path")
+                if not final_video_path:
+                    raise RuntimeError(
+                        f"[poll_compose] Compositor reported done but final_video_path is missing "
+                        f"for compose_job_id={compose_job_id}"
+                    )
+                logger.info(
+                    "[poll_compose] compose_job_id=%s complete. final_video_path=%s",
+                    compose_job_id,
+                    final_video_path,
+                )
+                return final_video_path
+
+            if status == "failed":
+                error = data.get("error", "unknown error")
+                raise NonRetryableError(
+                    f"[poll_compose] Compositor job failed for compose_job_id={compose_job_id} "
+                    f"run_id={run_id}: {error}"
+                )
 
-        await asyncio.sleep(poll_interval_seconds)
-        elapsed += poll_interval_seconds
+            await asyncio.sleep(poll_interval_seconds)
+            elapsed += poll_interval_seconds
 
     raise RuntimeError(
         f"[poll_compose] Timed out after {timeout_seconds}s waiting for compose_job_id={compose_job_id} "
@@ -1964,8 +2566,7 @@ async def poll_image_generation_provider(
         raise RuntimeError(f"Image generation failed for scene {index}: No outputs")
     
     # Download outputs
-    run_dir = DATA_SHARED_BASE / run_id
-    run_dir.mkdir(parents=True, exist_ok=True)
+    run_dir = _ensure_run_dir(run_id)
     
     saved_files = await provider_instance.download_outputs(
         output_urls=output_urls,
@@ -2023,6 +2624,34 @@ async def start_video_generation_provider(
     return job_id
 
 
+@activity.defn
+async def upload_and_start_video_generation_provider(
+    provider: str,
+    prompt_text: str,
+    image_hint: str,
+    run_id: str,
+    model: str,
+    width: int,
+    height: int,
+    index: int,
+) -> str:
+    """Prepare the scene image and submit the video job in a single activity.
+
+    Fuses upload_image_for_video_generation and start_video_generation_provider
+    so the intermediate image input never round-trips through workflow history.
+    Re-running the upload on retry is cheap: data URLs are decoded to a
+    content-addressed file and local uploads overwrite in place.
+
+    Returns:
+        Job ID
+    """
+    _safe_heartbeat()
+    image_input = await _prepare_video_image_input(image_hint, run_id)
+    return await start_video_generation_provider(
+        provider, prompt_text, image_input, model, width, height, index
+    )
+
+
 @activity.defn
 async def poll_video_generation_provider(
     provider: str,
@@ -2075,8 +2704,7 @@ async def poll_video_generation_provider(
         raise RuntimeError(f"Video generation failed for scene {index}: No outputs")
     
     # Download outputs (if needed - Runpod already downloads during polling)
-    run_dir = DATA_SHARED_BASE / run_id
-    run_dir.mkdir(parents=True, exist_ok=True)
+    run_dir = _ensure_run_dir(run_id)
     
     if provider == "fal":
         saved_files = await provider_instance.download_outputs(
@@ -2099,7 +2727,7 @@ async def poll_video_generation_provider(
                     fragment_filename = None
                     clean_url = url
                 raw_b64 = _strip_base64_data_url(clean_url)
-                video_data = base64.b64decode(raw_b64)
+                video_data = _fast_base64.b64decode(raw_b64)
                 # Always prefix with scene index so concurrent scenes writing the
                 # same ComfyUI output name (e.g. ComfyUI_00001_.mp4) don't
                 # overwrite each other on disk.
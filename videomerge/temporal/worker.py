@@ -1,21 +1,32 @@
 import asyncio
+import signal
+import time
 from typing import Optional
 
+from aiohttp import web
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from temporalio.client import Client
 from temporalio.worker import Worker
 
 from videomerge.config import (
+    ENCODER,
+    GENERATION_MAX_CONCURRENT_ACTIVITIES,
+    RENDER_MAX_CONCURRENT_ACTIVITIES,
+    RENDER_TASK_QUEUE,
+    TEMPORAL_DISABLE_EAGER_ACTIVITY_EXECUTION,
     TEMPORAL_SERVER_URL,
     TEMPORAL_UPSCALE_GENERATION_TIMEOUT_MINUTES,
     UPSCALE_JOB_TIMEOUT_SECONDS,
+    UPSCALE_MAX_CONCURRENT_ACTIVITIES,
     UPSCALE_POLL_INTERVAL_SECONDS,
     VIDEO_JOB_TIMEOUT_SECONDS,
     VIDEO_POLL_INTERVAL_SECONDS,
     IMAGE_JOB_TIMEOUT_SECONDS,
     IMAGE_POLL_INTERVAL_SECONDS,
 )
+from videomerge.services.media import resolve_video_encoder
 from videomerge.services.metrics import registry
+from videomerge.services.webhook_manager import webhook_manager
 from videomerge.temporal.workflows import ImageGenerationWorkflow, ProcessSceneWorkflow, StoryBoardVideoGeneration, VideoGenerationWorkflow, VideoUpscalingChildWorkflow, VideoUpscalingStitchWorkflow, VideoUpscalingWorkflow
 from videomerge.temporal import activities
 from videomerge.utils.logging import get_logger
@@ -24,83 +35,48 @@ logger = get_logger(__name__)
 
 _METRICS_HOST = "0.0.0.0"
 _METRICS_PORT = 9100
+# Scrapes within this window share one rendering of the registry.
+_METRICS_CACHE_TTL_SECONDS = 1.0
+_metrics_cache: tuple[float, bytes] = (float("-inf"), b"")
 
 
-async def _handle_metrics(
-    reader: asyncio.StreamReader,
-    writer: asyncio.StreamWriter,
-) -> None:
-    """Handle a single HTTP request to the worker metrics endpoint.
+async def _handle_metrics(request: web.Request) -> web.Response:
+    """Serve the shared Prometheus ``registry`` from ``videomerge.services.metrics``.
 
-    This implements a minimal HTTP 1.1 server that serves ``/metrics`` using the
-    shared Prometheus ``registry`` from ``videomerge.services.metrics``.
+    The rendered text is reused for ``_METRICS_CACHE_TTL_SECONDS`` so scrapes from
+    several Prometheus replicas cost one pass over the registry. generate_latest
+    is synchronous, so concurrent requests cannot race on the cache.
     """
-    try:
-        request_line = await reader.readline()
-        if not request_line:
-            return
-
-        parts = request_line.split(maxsplit=2)
-        if len(parts) < 2:
-            return
-
-        method, path = parts[0], parts[1]
-
-        # Consume and ignore the rest of the request headers/body.
-        while True:
-            line = await reader.readline()
-            if line in (b"\r\n", b"\n", b""):
-                break
-
-        status_line: bytes
-        headers: list[bytes]
-        body: bytes
-
-        if method == b"GET" and path in (b"/metrics", b"/metrics/"):
-            body = generate_latest(registry)
-            status_line = b"HTTP/1.1 200 OK"
-            headers = [
-                b"Content-Type: " + CONTENT_TYPE_LATEST.encode("ascii"),
-                f"Content-Length: {len(body)}".encode("ascii"),
-                b"Connection: close",
-            ]
-        else:
-            body = b"Not Found"
-            status_line = b"HTTP/1.1 404 Not Found"
-            headers = [
-                b"Content-Type: text/plain; charset=utf-8",
-                f"Content-Length: {len(body)}".encode("ascii"),
-                b"Connection: close",
-            ]
-
-        response_head = b"\r\n".join([status_line, *headers, b"", b""])
-        writer.write(response_head + body)
-        await writer.drain()
-    finally:
-        writer.close()
-        try:
-            await writer.wait_closed()
-        except Exception:
-            # Best-effort cleanup; ignore socket errors during shutdown.
-            pass
+    global _metrics_cache
+    now = time.monotonic()
+    rendered_at, body = _metrics_cache
+    if now - rendered_at > _METRICS_CACHE_TTL_SECONDS:
+        body = generate_latest(registry)
+        _metrics_cache = (now, body)
+    return web.Response(body=body, headers={"Content-Type": CONTENT_TYPE_LATEST})
 
 
-async def _start_metrics_server() -> Optional[asyncio.AbstractServer]:
+async def _start_metrics_server() -> Optional[web.AppRunner]:
     """Start the metrics HTTP server for the Temporal worker.
 
-    Returns the created ``asyncio.AbstractServer`` instance, or ``None`` if the
-    server fails to bind (for example if the port is already in use).
+    aiohttp keeps scrape connections alive between requests. Returns the
+    ``web.AppRunner`` to clean up on shutdown, or ``None`` if the server fails
+    to bind (for example if the port is already in use).
     """
+    app = web.Application()
+    app.router.add_get("/metrics", _handle_metrics)
+    app.router.add_get("/metrics/", _handle_metrics)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
     try:
-        server = await asyncio.start_server(_handle_metrics, _METRICS_HOST, _METRICS_PORT)
+        await web.TCPSite(runner, _METRICS_HOST, _METRICS_PORT).start()
     except OSError as exc:  # Port already in use or similar
         logger.warning("Failed to start worker metrics server on %s:%s: %s", _METRICS_HOST, _METRICS_PORT, exc)
+        await runner.cleanup()
         return None
 
-    sockets = server.sockets or []
-    bound_addrs = ", ".join(str(sock.getsockname()) for sock in sockets)
-    logger.info("Worker metrics server listening on %s", bound_addrs)
-    return server
+    logger.info("Worker metrics server listening on %s", ", ".join(str(addr) for addr in runner.addresses))
+    return runner
 
 
 async def main() -> None:
@@ -120,6 +96,10 @@ async def main() -> None:
         VIDEO_POLL_INTERVAL_SECONDS,
     )
 
+    # Probe the configured encoder once at startup so a missing hardware encoder
+    # is reported (and falls back to libx264) before any render runs.
+    logger.info("Final render encoder: %s (configured %s)", resolve_video_encoder(ENCODER), ENCODER)
+
     logger.info("Connecting to Temporal server at %s", TEMPORAL_SERVER_URL)
     client = await Client.connect(TEMPORAL_SERVER_URL)
 
@@ -147,6 +127,7 @@ async def main() -> None:
             activities.poll_video_generation,
             activities.stitch_videos,
             activities.burn_subtitles_into_video,
+            activities.stitch_and_finalize,
             activities.send_completion_webhook,
             activities.start_video_upscaling,
             activities.poll_upscale_status,
@@ -162,9 +143,12 @@ async def main() -> None:
             activities.start_image_generation_provider,
             activities.poll_image_generation_provider,
             activities.start_video_generation_provider,
+            activities.upload_and_start_video_generation_provider,
             activities.poll_video_generation_provider,
             activities.list_existing_video_clips,
         ],
+        max_concurrent_activities=GENERATION_MAX_CONCURRENT_ACTIVITIES,
+        disable_eager_activity_execution=TEMPORAL_DISABLE_EAGER_ACTIVITY_EXECUTION,
     )
 
     worker_upscale = Worker(
@@ -181,18 +165,62 @@ async def main() -> None:
             activities.encode_file_to_base64,
             activities.stitch_videos,
             activities.burn_subtitles_into_video,
+            activities.stitch_and_finalize,
             activities.send_upscale_completion_webhook,
         ],
+        max_concurrent_activities=UPSCALE_MAX_CONCURRENT_ACTIVITIES,
+        disable_eager_activity_execution=TEMPORAL_DISABLE_EAGER_ACTIVITY_EXECUTION,
     )
 
+    workers = [worker_gen, worker_upscale]
+    if RENDER_TASK_QUEUE:
+        # Dedicated queue for CPU-bound ffmpeg renders, sized to the media process pool.
+        workers.append(
+            Worker(
+                client,
+                task_queue=RENDER_TASK_QUEUE,
+                activities=[
+                    activities.stitch_videos,
+                    activities.burn_subtitles_into_video,
+                    activities.stitch_and_finalize,
+                ],
+                max_concurrent_activities=RENDER_MAX_CONCURRENT_ACTIVITIES,
+            )
+        )
+        logger.info(
+            "Render activities routed to task queue %s (max_concurrent_activities=%s)",
+            RENDER_TASK_QUEUE,
+            RENDER_MAX_CONCURRENT_ACTIVITIES,
+        )
+
     logger.info("Starting Temporal worker...")
 
+    # Race the workers against a stop signal so SIGTERM/SIGINT trigger a
+    # graceful Worker.shutdown() immediately instead of tearing down the loop.
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except (NotImplementedError, RuntimeError):
+            # Signal handlers are unavailable on some platforms (e.g. Windows).
+            pass
+
+    run_task = asyncio.gather(*(w.run() for w in workers))
+    stop_task = asyncio.create_task(stop_event.wait())
     try:
-        await asyncio.gather(worker_gen.run(), worker_upscale.run())
+        done, _ = await asyncio.wait({run_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+        if stop_task in done:
+            logger.info("Stop signal received; shutting down Temporal workers...")
+            await asyncio.gather(*(w.shutdown() for w in workers))
+        await run_task
     finally:
+        stop_task.cancel()
+        activities.shutdown_media_process_pool()
+        await activities.close_shared_http_client()
+        await webhook_manager.close()
         if metrics_server is not None:
-            metrics_server.close()
-            await metrics_server.wait_closed()
+            await metrics_server.cleanup()
 
 
 if __name__ == "__main__":
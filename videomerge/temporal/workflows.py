@@ -36,6 +36,29 @@ def _is_content_policy_violation(exc: BaseException) -> bool:
     ))
 
 
+def _extract_image_files(prompts: list) -> list[str]:
+    """Return the non-empty image prompts of ``prompts`` (dicts or PromptItem-like objects).
+
+    A run's prompts all come from one activity result, so the element type is
+    checked once rather than per prompt.
+    """
+    if not prompts:
+        return []
+    if isinstance(prompts[0], dict):
+        return [p["image_prompt"] for p in prompts if p.get("image_prompt")]
+    return [p.image_prompt for p in prompts if getattr(p, "image_prompt", None)]
+
+
+async def _run_with_semaphore(semaphore: asyncio.Semaphore, fn, *args, **kwargs):
+    """Await ``fn(*args, **kwargs)`` while holding ``semaphore``.
+
+    Used to cap how many child workflows a parent has in flight at once so a
+    long script does not flood the GPU provider queue.
+    """
+    async with semaphore:
+        return await fn(*args, **kwargs)
+
+
 from videomerge.config import (
     ACTIVITY_SHORT_TIMEOUT_MINUTES,
     DATA_SHARED_BASE,
@@ -52,6 +75,8 @@ from videomerge.config import (
     IMAGE_STYLE_TO_WORKFLOW_MAPPING,
     IMAGE_WIDTH,
     IMAGE_WORKFLOWS,
+    RENDER_TASK_QUEUE,
+    SCENE_CHILD_WORKFLOW_CONCURRENCY,
     SCENE_CLASSIFIER_ENABLED,
     SETUP_RUN_DIRECTORY_TIMEOUT_SECONDS,
     STITCH_TIMEOUT_MINUTES,
@@ -59,6 +84,10 @@ from videomerge.config import (
     TEMPORAL_IMAGE_GENERATION_TIMEOUT_MINUTES,
     TEMPORAL_VIDEO_GENERATION_TIMEOUT_MINUTES,
     TEMPORAL_UPSCALE_GENERATION_TIMEOUT_MINUTES,
+    UPSCALE_CALLBACK_BASE_URL,
+    UPSCALE_CALLBACK_TOKEN,
+    UPSCALE_CALLBACK_WAIT_SECONDS,
+    UPSCALE_CHILD_WORKFLOW_CONCURRENCY,
     VIDEO_JOB_TIMEOUT_SECONDS,
     VIDEO_POLL_INTERVAL_SECONDS,
     WORKFLOWS_BASE_PATH,
@@ -95,6 +124,7 @@ with workflow.unsafe.imports_passed_through():
         poll_video_generation,
         stitch_videos,
         burn_subtitles_into_video,
+        stitch_and_finalize,
         send_completion_webhook,
         handoff_to_compositor,
         poll_compose_status,
@@ -104,6 +134,7 @@ with workflow.unsafe.imports_passed_through():
         start_image_generation_provider,
         poll_image_generation_provider,
         start_video_generation_provider,
+        upload_and_start_video_generation_provider,
         poll_video_generation_provider,
         start_video_upscaling,
         poll_upscale_status,
@@ -122,6 +153,55 @@ with workflow.unsafe.imports_passed_through():
     )
 
 
+# ComfyUI text-to-image workflow path per image style, resolved once at import
+# (the config values are import-time constants in this module) rather than
+# formatted on every workflow task and replay.
+_IMAGE_WORKFLOW_PATHS = {
+    style: f"{WORKFLOWS_BASE_PATH}/{filename}" for style, filename in IMAGE_WORKFLOWS.items()
+}
+
+
+def _image_workflow_path(image_style: str) -> str:
+    """Return the ComfyUI workflow path for ``image_style``, falling back to the default style."""
+    return _IMAGE_WORKFLOW_PATHS.get(image_style, _IMAGE_WORKFLOW_PATHS["default"])
+
+
+# Shared by every workflow run instead of being rebuilt per run; never mutated.
+# Single attempt: workflows handle activity failures themselves (failure webhooks).
+_DEFAULT_RETRY_POLICY = RetryPolicy(
+    maximum_attempts=1,
+    initial_interval=timedelta(seconds=10),
+    backoff_coefficient=2.0,
+)
+_DEFAULT_ACTIVITY_OPTIONS = {
+    "start_to_close_timeout": timedelta(minutes=DEFAULT_ACTIVITY_TIMEOUT_MINUTES),
+    "retry_policy": _DEFAULT_RETRY_POLICY,
+}
+# Retry transient failures but immediately fail on permanent errors
+# (e.g. invalid image_style, RunPod validation failures).
+_SCENE_RETRY_POLICY = RetryPolicy(
+    maximum_attempts=3,
+    non_retryable_error_types=["NonRetryableError"],
+)
+_SCENE_ACTIVITY_OPTIONS = {
+    "start_to_close_timeout": timedelta(minutes=DEFAULT_ACTIVITY_TIMEOUT_MINUTES),
+    "retry_policy": _SCENE_RETRY_POLICY,
+}
+# Webhook activities await the N8N POST, so delivery failures fail the activity
+# and are retried here with backoff; 4xx rejections raise NonRetryableError and
+# stop immediately. The timeout leaves room for the webhook client's 30s limit.
+_WEBHOOK_RETRY_POLICY = RetryPolicy(
+    maximum_attempts=5,
+    initial_interval=timedelta(seconds=1),
+    backoff_coefficient=2.0,
+    non_retryable_error_types=["NonRetryableError"],
+)
+_WEBHOOK_ACTIVITY_OPTIONS = {
+    "start_to_close_timeout": timedelta(seconds=60),
+    "retry_policy": _WEBHOOK_RETRY_POLICY,
+}
+
+
 @workflow.defn
 class ProcessSceneWorkflow:
     @workflow.run
@@ -151,16 +231,7 @@ class ProcessSceneWorkflow:
                 f"workflow_id={parent_info.workflow_id}, run_id={parent_info.run_id}"
             )
         
-        # Retry transient failures but immediately fail on permanent errors
-        # (e.g. invalid image_style, RunPod validation failures).
-        scene_retry_policy = RetryPolicy(
-            maximum_attempts=3,
-            non_retryable_error_types=["NonRetryableError"],
-        )
-        activity_defaults = {
-            "start_to_close_timeout": timedelta(minutes=DEFAULT_ACTIVITY_TIMEOUT_MINUTES),
-            "retry_policy": scene_retry_policy,
-        }
+        activity_defaults = _SCENE_ACTIVITY_OPTIONS
 
         _cls = scene_classification or {}
         _scene_type = _cls.get("scene_type", "concept_visual")
@@ -195,7 +266,7 @@ class ProcessSceneWorkflow:
                                 index,
                             ],
                             start_to_close_timeout=timedelta(minutes=TEMPORAL_IMAGE_GENERATION_TIMEOUT_MINUTES),
-                            retry_policy=scene_retry_policy,
+                            retry_policy=_SCENE_RETRY_POLICY,
                         )
 
                         image_hint = await workflow.execute_activity(
@@ -204,7 +275,7 @@ class ProcessSceneWorkflow:
                             schedule_to_close_timeout=timedelta(minutes=TEMPORAL_IMAGE_GENERATION_TIMEOUT_MINUTES),
                             start_to_close_timeout=timedelta(minutes=TEMPORAL_IMAGE_GENERATION_TIMEOUT_MINUTES),
                             heartbeat_timeout=timedelta(minutes=2),
-                            retry_policy=scene_retry_policy,
+                            retry_policy=_SCENE_RETRY_POLICY,
                         )
                     else:
                         # Fall back to ComfyUI
@@ -221,7 +292,7 @@ class ProcessSceneWorkflow:
                                 image_style,
                             ],
                             start_to_close_timeout=timedelta(minutes=TEMPORAL_IMAGE_GENERATION_TIMEOUT_MINUTES),
-                            retry_policy=scene_retry_policy,
+                            retry_policy=_SCENE_RETRY_POLICY,
                         )
 
                         image_hint = await workflow.execute_activity(
@@ -230,7 +301,7 @@ class ProcessSceneWorkflow:
                             schedule_to_close_timeout=timedelta(minutes=TEMPORAL_IMAGE_GENERATION_TIMEOUT_MINUTES),
                             start_to_close_timeout=timedelta(minutes=TEMPORAL_IMAGE_GENERATION_TIMEOUT_MINUTES),
                             heartbeat_timeout=timedelta(minutes=2),
-                            retry_policy=scene_retry_policy,
+                            retry_policy=_SCENE_RETRY_POLICY,
                         )
                 except Exception as e:
                     detail = _root_cause_message(e)
@@ -274,7 +345,7 @@ class ProcessSceneWorkflow:
                         ],
                         start_to_close_timeout=timedelta(minutes=TEMPORAL_VIDEO_GENERATION_TIMEOUT_MINUTES),
                         heartbeat_timeout=timedelta(minutes=2),
-                        retry_policy=scene_retry_policy,
+                        retry_policy=_SCENE_RETRY_POLICY,
                     )
                 except Exception as e:
                     detail = _root_cause_message(e)
@@ -286,39 +357,44 @@ class ProcessSceneWorkflow:
                 workflow.logger.info(f"Scene {index} (talking_head) completed: {talking_head_path}")
                 return [talking_head_path]
 
-            # 2. Upload image for video generation
-            try:
-                image_input = await workflow.execute_activity(
-                    upload_image_for_video_generation, args=[image_hint], **activity_defaults
-                )
-            except Exception as e:
-                detail = _root_cause_message(e)
-                workflow.logger.error(f"Image upload failed for scene {index}: {detail}")
-                raise ApplicationError(
-                    f"Scene {index} image upload failed: {detail}",
-                    non_retryable=True,
+            # 2. Generate video from image. The fused activity prepares the image
+            # input (data URL decode / ComfyUI upload) and submits the job. Runs
+            # started before it replay the separate upload activity instead.
+            fused_video_submit = workflow.patched("upload-and-start-video-generation")
+            image_input = image_hint
+            if not fused_video_submit:
+                try:
+                    image_input = await workflow.execute_activity(
+                        upload_image_for_video_generation, args=[image_hint, run_id], **activity_defaults
+                    )
+                except Exception as e:
+                    detail = _root_cause_message(e)
+                    workflow.logger.error(f"Image upload failed for scene {index}: {detail}")
+                    raise ApplicationError(
+                        f"Scene {index} image upload failed: {detail}",
+                        non_retryable=True,
+                    )
+
+            def _submit_video(provider: str, model: str):
+                if fused_video_submit:
+                    activity_fn = upload_and_start_video_generation_provider
+                    args = [provider, prompt.video_prompt, image_hint, run_id, model, video_width, video_height, index]
+                else:
+                    activity_fn = start_video_generation_provider
+                    args = [provider, prompt.video_prompt, image_input, model, video_width, video_height, index]
+                return workflow.execute_activity(
+                    activity_fn,
+                    args=args,
+                    start_to_close_timeout=timedelta(minutes=TEMPORAL_VIDEO_GENERATION_TIMEOUT_MINUTES),
+                    retry_policy=activity_defaults["retry_policy"],
                 )
 
-            # 3. Generate video from image
             video_paths = []
             if prompt.video_prompt:
                 try:
                     if VIDEO_PROVIDER == "runpod":
                         workflow.logger.info(f"[ProcessSceneWorkflow] VIDEO_PROVIDER=runpod, using RunPod Wan2.2 directly for scene {index}")
-                        video_job_id = await workflow.execute_activity(
-                            start_video_generation_provider,
-                            args=[
-                                "runpod",
-                                prompt.video_prompt,
-                                image_input,
-                                DEFAULT_I2V_WORKFLOW_NAME,
-                                video_width,
-                                video_height,
-                                index,
-                            ],
-                            start_to_close_timeout=timedelta(minutes=TEMPORAL_VIDEO_GENERATION_TIMEOUT_MINUTES),
-                            retry_policy=activity_defaults["retry_policy"],
-                        )
+                        video_job_id = await _submit_video("runpod", DEFAULT_I2V_WORKFLOW_NAME)
                         video_paths = await workflow.execute_activity(
                             poll_video_generation_provider,
                             args=["runpod", video_job_id, run_id, index, VIDEO_JOB_TIMEOUT_SECONDS, VIDEO_POLL_INTERVAL_SECONDS],
@@ -331,20 +407,7 @@ class ProcessSceneWorkflow:
                         # Fal with automatic RunPod fallback on content-policy rejection
                         workflow.logger.info(f"[ProcessSceneWorkflow] VIDEO_PROVIDER=fal, using Fal for scene {index}")
                         try:
-                            video_job_id = await workflow.execute_activity(
-                                start_video_generation_provider,
-                                args=[
-                                    "fal",
-                                    prompt.video_prompt,
-                                    image_input,
-                                    FAL_VIDEO_MODEL,
-                                    video_width,
-                                    video_height,
-                                    index,
-                                ],
-                                start_to_close_timeout=timedelta(minutes=TEMPORAL_VIDEO_GENERATION_TIMEOUT_MINUTES),
-                                retry_policy=activity_defaults["retry_policy"],
-                            )
+                            video_job_id = await _submit_video("fal", FAL_VIDEO_MODEL)
                             video_paths = await workflow.execute_activity(
                                 poll_video_generation_provider,
                                 args=["fal", video_job_id, run_id, index, VIDEO_JOB_TIMEOUT_SECONDS, VIDEO_POLL_INTERVAL_SECONDS, FAL_VIDEO_MODEL],
@@ -360,20 +423,7 @@ class ProcessSceneWorkflow:
                                 f"[ProcessSceneWorkflow] Fal content-policy rejection for scene {index}, "
                                 f"falling back to RunPod Wan2.2"
                             )
-                            video_job_id = await workflow.execute_activity(
-                                start_video_generation_provider,
-                                args=[
-                                    "runpod",
-                                    prompt.video_prompt,
-                                    image_input,
-                                    DEFAULT_I2V_WORKFLOW_NAME,
-                                    video_width,
-                                    video_height,
-                                    index,
-                                ],
-                                start_to_close_timeout=timedelta(minutes=TEMPORAL_VIDEO_GENERATION_TIMEOUT_MINUTES),
-                                retry_policy=activity_defaults["retry_policy"],
-                            )
+                            video_job_id = await _submit_video("runpod", DEFAULT_I2V_WORKFLOW_NAME)
                             video_paths = await workflow.execute_activity(
                                 poll_video_generation_provider,
                                 args=["runpod", video_job_id, run_id, index, VIDEO_JOB_TIMEOUT_SECONDS, VIDEO_POLL_INTERVAL_SECONDS],
@@ -411,16 +461,13 @@ class VideoGenerationWorkflow:
         """Main workflow execution method."""
         workflow.logger.info(f"Starting video generation workflow for run_id={req.run_id}")
 
-        # Define a retry policy for activities that might fail due to transient issues.
-        retry_policy = RetryPolicy(
-            maximum_attempts=1,
-            initial_interval=timedelta(seconds=10),
-            backoff_coefficient=2.0,
-        )
-        activity_defaults = {
-            "start_to_close_timeout": timedelta(minutes=DEFAULT_ACTIVITY_TIMEOUT_MINUTES),
-            "retry_policy": retry_policy,
-        }
+        retry_policy = _DEFAULT_RETRY_POLICY
+
+        # Reported by the failure webhook with whatever was produced before the error.
+        run_dir = ""
+        voiceover_path = ""
+        video_paths: list[str] = []
+        image_files: list[str] = []
 
         try:
             # 1. Setup run directory and save manifest
@@ -444,17 +491,13 @@ class VideoGenerationWorkflow:
                 workflow.logger.info("Skipping voiceover generation as ENABLE_VOICEOVER_GEN is false.")
 
             if not voiceover_path:
-                if run_dir.endswith("/") or run_dir.endswith("\\"):
-                    default_voiceover = f"{run_dir}voiceover.mp3"
-                elif "\\" in run_dir:
-                    default_voiceover = f"{run_dir}\\voiceover.mp3"
-                else:
-                    default_voiceover = f"{run_dir}/voiceover.mp3"
+                default_voiceover = str(Path(run_dir) / "voiceover.mp3")
 
                 workflow.logger.info("Using default voiceover path %s", default_voiceover)
                 voiceover_path = default_voiceover
 
-            # 3. Generate prompts for each scene via external service
+            # 3. Generate prompts for each scene via external service. Must run after
+            # the voiceover: it reads audio_duration from voiceover_metadata.json.
             image_style = req.image_style or "default"
             timeout_retry_policy = RetryPolicy(
                 maximum_attempts=3,
@@ -468,19 +511,44 @@ class VideoGenerationWorkflow:
                 start_to_close_timeout=timedelta(minutes=GENERATE_SCENES_TIMEOUT_MINUTES),
                 retry_policy=timeout_retry_policy,
             )
+            # Generated image prompts, reported in the completion (or failure) webhook.
+            image_files = _extract_image_files(scene_prompts)
 
             # 3b. Classify scenes for provider selection (when SCENE_CLASSIFIER_ENABLED)
-            scene_classifications = []
-            if SCENE_CLASSIFIER_ENABLED:
+            async def _classify_scenes() -> list:
+                if not SCENE_CLASSIFIER_ENABLED:
+                    return []
                 import json
                 workflow.logger.info("[VideoGenerationWorkflow] Classifying scenes from script")
-                scene_classifications = await workflow.execute_activity(
+                classifications = await workflow.execute_activity(
                     classify_scenes_from_script_activity,
                     args=[json.dumps(req.script), json.dumps(scene_prompts)],
                     start_to_close_timeout=timedelta(minutes=2),
                     retry_policy=RetryPolicy(maximum_attempts=2),
                 )
-                workflow.logger.info(f"[VideoGenerationWorkflow] Classified {len(scene_classifications)} scenes")
+                workflow.logger.info(f"[VideoGenerationWorkflow] Classified {len(classifications)} scenes")
+                return classifications
+
+            def _list_existing_clips():
+                return workflow.execute_activity(
+                    list_existing_video_clips,
+                    args=[req.run_id],
+                    start_to_close_timeout=timedelta(seconds=SETUP_RUN_DIRECTORY_TIMEOUT_SECONDS),
+                    retry_policy=RetryPolicy(maximum_attempts=3),
+                )
+
+            # Classification and the existing-clip scan (used below to skip scenes whose
+            # clip is already on disk, so retries don't re-pay for completed scenes) are
+            # independent, so run them concurrently. Runs started before this change
+            # replay the original sequential order.
+            if workflow.patched("concurrent-scene-classification"):
+                scene_classifications, existing_clips = await asyncio.gather(
+                    _classify_scenes(),
+                    _list_existing_clips(),
+                )
+            else:
+                scene_classifications = await _classify_scenes()
+                existing_clips = await _list_existing_clips()
 
             # Image dimensions are always derived from aspect ratio, capped at 720p.
             # req.image_width/image_height are intentionally ignored to enforce the cap.
@@ -489,22 +557,14 @@ class VideoGenerationWorkflow:
             # Calculate video dimensions from format and resolution
             video_width, video_height = calculate_video_dimensions(req.video_format, req.target_resolution)
 
-            # 4. Process each scene as a child workflow, skipping any whose clip
-            #    already exists on disk (so retries don't re-pay for completed scenes).
-            existing_clips = await workflow.execute_activity(
-                list_existing_video_clips,
-                args=[req.run_id],
-                start_to_close_timeout=timedelta(seconds=SETUP_RUN_DIRECTORY_TIMEOUT_SECONDS),
-                retry_policy=RetryPolicy(maximum_attempts=3),
-            )
+            # 4. Process each scene as a child workflow
             if existing_clips:
                 workflow.logger.info(
                     "[VideoGenerationWorkflow] Found existing clips for %d scene(s) — those will be skipped",
                     len(existing_clips),
                 )
 
-            workflow_filename = IMAGE_WORKFLOWS.get(image_style, IMAGE_WORKFLOWS["default"])
-            workflow_path = f"{WORKFLOWS_BASE_PATH}/{workflow_filename}"
+            workflow_path = _image_workflow_path(image_style)
 
             # Map image_style to comfyui_workflow_name using the YAML config
             comfyui_workflow_name: str | None = IMAGE_STYLE_TO_WORKFLOW_MAPPING.get(image_style)
@@ -513,8 +573,9 @@ class VideoGenerationWorkflow:
             z_image_style: str | None = req.z_image_style if comfyui_workflow_name == "z-image-photo" else None
 
             # Get parent workflow info for child correlation
-            parent_workflow_id = workflow.info().workflow_id
-            parent_run_id = workflow.info().run_id
+            parent_info = workflow.info()
+            parent_workflow_id = parent_info.workflow_id
+            parent_run_id = parent_info.run_id
 
             # Compute cumulative audio offsets per scene (for talking_head routing).
             # When the brief carries per-scene duration_seconds, use those directly.
@@ -531,6 +592,8 @@ class VideoGenerationWorkflow:
                         _cumulative += float(_scene.duration_seconds)
 
             # List of (scene_index, awaitable) so we can map results back to indices.
+            # Children run concurrently but at most SCENE_CHILD_WORKFLOW_CONCURRENCY at a time.
+            scene_semaphore = asyncio.Semaphore(SCENE_CHILD_WORKFLOW_CONCURRENCY)
             scene_processing_tasks: list[tuple[int, Any]] = []
             for i, prompt in enumerate(scene_prompts):
                 if str(i) in existing_clips:
@@ -539,13 +602,6 @@ class VideoGenerationWorkflow:
                     )
                     continue
 
-                # Support both dict-based prompts and PromptItem-like objects
-                if isinstance(prompt, dict):
-                    image_prompt = prompt.get("image_prompt")
-                    video_prompt = prompt.get("video_prompt")
-                else:
-                    image_prompt = getattr(prompt, "image_prompt", None)
-                    video_prompt = getattr(prompt, "video_prompt", None)
                 # Each scene gets its own child workflow for better isolation and resumability
                 child_id = f"{req.run_id}-scene-{i}"
 
@@ -556,7 +612,9 @@ class VideoGenerationWorkflow:
                 _audio_start = scene_audio_starts[i] if i < len(scene_audio_starts) else None
                 _audio_dur = scene_audio_durations[i] if i < len(scene_audio_durations) else None
 
-                task = workflow.execute_child_workflow(
+                task = _run_with_semaphore(
+                    scene_semaphore,
+                    workflow.execute_child_workflow,
                     ProcessSceneWorkflow.run,
                     args=[
                         req.run_id,
@@ -587,15 +645,11 @@ class VideoGenerationWorkflow:
                 )
                 scene_processing_tasks.append((i, task))
 
-                workflow.logger.info(
-                    f"Started child workflow {child_id} for scene {i} "
-                    f"(parent: {parent_workflow_id})"
-                )
-
             workflow.logger.info(
-                "[VideoGenerationWorkflow] Starting %d scene child workflow(s) "
+                "[VideoGenerationWorkflow] Starting %d scene child workflow(s), max %d in flight "
                 "(%d skipped — clips already on disk)",
                 len(scene_processing_tasks),
+                SCENE_CHILD_WORKFLOW_CONCURRENCY,
                 len(scene_prompts) - len(scene_processing_tasks),
             )
 
@@ -681,8 +735,7 @@ class VideoGenerationWorkflow:
                             req.video_idea_id,
                             req.platform,
                         ],
-                        start_to_close_timeout=timedelta(minutes=ACTIVITY_SHORT_TIMEOUT_MINUTES),
-                        retry_policy=retry_policy,
+                        **_WEBHOOK_ACTIVITY_OPTIONS,
                     )
                     raise ApplicationError(
                         f"Handoff to compositor failed for run_id={req.run_id}: {detail}",
@@ -725,37 +778,37 @@ class VideoGenerationWorkflow:
                         req.video_idea_id,
                         req.platform,
                     ],
-                    start_to_close_timeout=timedelta(minutes=ACTIVITY_SHORT_TIMEOUT_MINUTES),
-                    retry_policy=retry_policy,
+                    **_WEBHOOK_ACTIVITY_OPTIONS,
                 )
 
                 workflow.logger.info(f"Workflow for run_id={req.run_id} completed via compositor handoff.")
                 return final_video_path
 
-            # Legacy tail: stitch -> subtitles -> upload -> webhook
-            stitched_video_path = await workflow.execute_activity(
-                stitch_videos,
-                args=[req.run_id, video_paths, voiceover_path],
-                start_to_close_timeout=timedelta(minutes=ACTIVITY_SHORT_TIMEOUT_MINUTES),
-                retry_policy=retry_policy,
-            )
-
-            final_video_path = await workflow.execute_activity(
-                burn_subtitles_into_video,
-                args=[req.run_id, stitched_video_path, req.language, voiceover_path],
-                start_to_close_timeout=timedelta(minutes=ACTIVITY_SHORT_TIMEOUT_MINUTES),
-                retry_policy=retry_policy,
-            )
-
-            # Collect generated image filenames from prompts for webhook payload
-            image_files = []
-            for prompt in scene_prompts:
-                if isinstance(prompt, dict):
-                    img = prompt.get("image_prompt")
-                else:
-                    img = getattr(prompt, "image_prompt", None)
-                if img:
-                    image_files.append(img)
+            # Legacy tail: stitch + subtitles (single encode) -> upload -> webhook
+            if workflow.patched("stitch-and-finalize"):
+                final_video_path = await workflow.execute_activity(
+                    stitch_and_finalize,
+                    args=[req.run_id, video_paths, voiceover_path, req.language],
+                    start_to_close_timeout=timedelta(minutes=ACTIVITY_SHORT_TIMEOUT_MINUTES),
+                    retry_policy=retry_policy,
+                    task_queue=RENDER_TASK_QUEUE,
+                )
+            else:
+                # Runs started before the fused activity replay the two-step tail.
+                stitched_video_path = await workflow.execute_activity(
+                    stitch_videos,
+                    args=[req.run_id, video_paths, voiceover_path],
+                    start_to_close_timeout=timedelta(minutes=ACTIVITY_SHORT_TIMEOUT_MINUTES),
+                    retry_policy=retry_policy,
+                    task_queue=RENDER_TASK_QUEUE,
+                )
+                final_video_path = await workflow.execute_activity(
+                    burn_subtitles_into_video,
+                    args=[req.run_id, stitched_video_path, req.language, voiceover_path],
+                    start_to_close_timeout=timedelta(minutes=ACTIVITY_SHORT_TIMEOUT_MINUTES),
+                    retry_policy=retry_policy,
+                    task_queue=RENDER_TASK_QUEUE,
+                )
 
             await workflow.execute_activity(
                 send_completion_webhook,
@@ -773,8 +826,7 @@ class VideoGenerationWorkflow:
                     req.video_idea_id,
                     req.platform,
                 ],
-                start_to_close_timeout=timedelta(minutes=ACTIVITY_SHORT_TIMEOUT_MINUTES),
-                retry_policy=retry_policy,
+                **_WEBHOOK_ACTIVITY_OPTIONS,
             )
 
             workflow.logger.info(f"Workflow for run_id={req.run_id} completed successfully.")
@@ -791,21 +843,16 @@ class VideoGenerationWorkflow:
                     "failed",
                     "",
                     req.workflow_id,
-                    run_dir if "run_dir" in locals() else "",
-                    locals().get("video_paths", []),
-                    [
-                        (p.get("image_prompt") if isinstance(p, dict) else getattr(p, "image_prompt", None)) or ""
-                        for p in locals().get("scene_prompts", [])
-                        if (p.get("image_prompt") if isinstance(p, dict) else getattr(p, "image_prompt", None))
-                    ],
-                    voiceover_path if "voiceover_path" in locals() else "",
+                    run_dir,
+                    video_paths,
+                    image_files,
+                    voiceover_path,
                     detail,
                     None,  # uploaded_video_object_path
                     req.video_idea_id,
                     req.platform,
                 ],
-                start_to_close_timeout=timedelta(minutes=ACTIVITY_SHORT_TIMEOUT_MINUTES),
-                retry_policy=retry_policy,
+                **_WEBHOOK_ACTIVITY_OPTIONS,
             )
             if isinstance(e, ApplicationError):
                 raise
@@ -878,8 +925,7 @@ class ImageGenerationWorkflow:
             # Explicit req.image_width/image_height are ignored to enforce the cap,
             # matching the same policy used by VideoGenerationWorkflow.
             image_width, image_height = calculate_image_dimensions(req.video_format, req.target_resolution)
-            workflow_filename = IMAGE_WORKFLOWS.get(image_style, IMAGE_WORKFLOWS["default"])
-            workflow_path = f"{WORKFLOWS_BASE_PATH}/{workflow_filename}"
+            workflow_path = _image_workflow_path(image_style)
             comfyui_workflow_name = IMAGE_STYLE_TO_WORKFLOW_MAPPING.get(image_style)
             style_override = req.z_image_style if comfyui_workflow_name == "z-image-photo" else None
 
@@ -999,8 +1045,7 @@ class ImageGenerationWorkflow:
                     req.video_idea_id,
                     req.platform,
                 ],
-                start_to_close_timeout=timedelta(minutes=ACTIVITY_SHORT_TIMEOUT_MINUTES),
-                retry_policy=retry_policy,
+                **_WEBHOOK_ACTIVITY_OPTIONS,
             )
             return saved_images
 
@@ -1020,8 +1065,7 @@ class ImageGenerationWorkflow:
                     req.video_idea_id,
                     req.platform,
                 ],
-                start_to_close_timeout=timedelta(minutes=ACTIVITY_SHORT_TIMEOUT_MINUTES),
-                retry_policy=retry_policy,
+                **_WEBHOOK_ACTIVITY_OPTIONS,
             )
             if isinstance(e, ApplicationError):
                 raise
@@ -1038,21 +1082,13 @@ class StoryBoardVideoGeneration:
         """Generate ordered storyboard-based video clips and publish the final video."""
         workflow.logger.info(f"Starting storyboard video generation workflow for run_id={req.run_id}")
 
-        retry_policy = RetryPolicy(
-            maximum_attempts=1,
-            initial_interval=timedelta(seconds=10),
-            backoff_coefficient=2.0,
-        )
+        retry_policy = _DEFAULT_RETRY_POLICY
         prompt_retry_policy = RetryPolicy(
             maximum_attempts=3,
             initial_interval=timedelta(seconds=10),
             backoff_coefficient=2.0,
             non_retryable_error_types=["RuntimeError"],
         )
-        activity_defaults = {
-            "start_to_close_timeout": timedelta(minutes=DEFAULT_ACTIVITY_TIMEOUT_MINUTES),
-            "retry_policy": retry_policy,
-        }
 
         video_paths: list[str] = []
         failure_webhook_sent = False
@@ -1253,7 +1289,7 @@ class StoryBoardVideoGeneration:
                             req.video_idea_id,
                             req.platform,
                         ],
-                        **activity_defaults,
+                        **_WEBHOOK_ACTIVITY_OPTIONS,
                     )
                     failure_webhook_sent = True
                     raise ApplicationError(
@@ -1299,7 +1335,7 @@ class StoryBoardVideoGeneration:
                         req.video_idea_id,
                         req.platform,
                     ],
-                    **activity_defaults,
+                    **_WEBHOOK_ACTIVITY_OPTIONS,
                 )
 
                 workflow.logger.info(
@@ -1308,20 +1344,31 @@ class StoryBoardVideoGeneration:
                 )
                 return final_video_path
 
-            # Legacy tail: stitch -> subtitles -> upload -> webhook
-            stitched_video_path = await workflow.execute_activity(
-                stitch_videos,
-                args=[req.run_id, video_paths, voiceover_path],
-                start_to_close_timeout=timedelta(minutes=ACTIVITY_SHORT_TIMEOUT_MINUTES),
-                retry_policy=retry_policy,
-            )
-
-            final_video_path = await workflow.execute_activity(
-                burn_subtitles_into_video,
-                args=[req.run_id, stitched_video_path, req.language, voiceover_path],
-                start_to_close_timeout=timedelta(minutes=ACTIVITY_SHORT_TIMEOUT_MINUTES),
-                retry_policy=retry_policy,
-            )
+            # Legacy tail: stitch + subtitles (single encode) -> upload -> webhook
+            if workflow.patched("stitch-and-finalize"):
+                final_video_path = await workflow.execute_activity(
+                    stitch_and_finalize,
+                    args=[req.run_id, video_paths, voiceover_path, req.language],
+                    start_to_close_timeout=timedelta(minutes=ACTIVITY_SHORT_TIMEOUT_MINUTES),
+                    retry_policy=retry_policy,
+                    task_queue=RENDER_TASK_QUEUE,
+                )
+            else:
+                # Runs started before the fused activity replay the two-step tail.
+                stitched_video_path = await workflow.execute_activity(
+                    stitch_videos,
+                    args=[req.run_id, video_paths, voiceover_path],
+                    start_to_close_timeout=timedelta(minutes=ACTIVITY_SHORT_TIMEOUT_MINUTES),
+                    retry_policy=retry_policy,
+                    task_queue=RENDER_TASK_QUEUE,
+                )
+                final_video_path = await workflow.execute_activity(
+                    burn_subtitles_into_video,
+                    args=[req.run_id, stitched_video_path, req.language, voiceover_path],
+                    start_to_close_timeout=timedelta(minutes=ACTIVITY_SHORT_TIMEOUT_MINUTES),
+                    retry_policy=retry_policy,
+                    task_queue=RENDER_TASK_QUEUE,
+                )
 
             uploaded_object_path = await workflow.execute_activity(
                 upload_final_video_output,
@@ -1346,7 +1393,7 @@ class StoryBoardVideoGeneration:
                     req.video_idea_id,
                     req.platform,
                 ],
-                **activity_defaults,
+                **_WEBHOOK_ACTIVITY_OPTIONS,
             )
 
             workflow.logger.info(
@@ -1377,7 +1424,7 @@ class StoryBoardVideoGeneration:
                         req.video_idea_id,
                         req.platform,
                     ],
-                    **activity_defaults,
+                    **_WEBHOOK_ACTIVITY_OPTIONS,
                 )
             if isinstance(e, ApplicationError):
                 raise
@@ -1389,17 +1436,20 @@ class StoryBoardVideoGeneration:
 
 @workflow.defn
 class VideoUpscalingChildWorkflow:
+    def __init__(self) -> None:
+        self._upscale_job_finished = False
+
+    @workflow.signal
+    def upscale_job_finished(self) -> None:
+        """Signalled by the RunPod completion callback (see routers/upscale.py)."""
+        self._upscale_job_finished = True
+
     @workflow.run
     async def run(self, req: UpscaleChildRequest) -> str:
         """Main workflow execution method for video upscaling."""
         workflow.logger.info(f"Starting video upscaling workflow for video_id={req.video_id}")
 
-        # Define a retry policy for activities that might fail due to transient issues.
-        retry_policy = RetryPolicy(
-            maximum_attempts=1,
-            initial_interval=timedelta(seconds=10),
-            backoff_coefficient=2.0,
-        )
+        retry_policy = _DEFAULT_RETRY_POLICY
 
         # Polling an existing RunPod job is idempotent and safe to retry,
         # but permanent failures (e.g. FAILED status) should not be retried.
@@ -1410,10 +1460,6 @@ class VideoUpscalingChildWorkflow:
             maximum_interval=timedelta(minutes=2),
             non_retryable_error_types=["NonRetryableError"],
         )
-        activity_defaults = {
-            "start_to_close_timeout": timedelta(minutes=DEFAULT_ACTIVITY_TIMEOUT_MINUTES),
-            "retry_policy": retry_policy,
-        }
 
         try:
             # 1. Setup run directory and save manifest
@@ -1432,7 +1478,22 @@ class VideoUpscalingChildWorkflow:
                 retry_policy=retry_policy,
             )
 
-            # 3. Poll for completion and save to disk (returns file path)
+            # 3. With a RunPod callback registered, wait for its signal before
+            # polling; the poll below then finds the job finished on its first
+            # request. The wait is capped so a lost callback only delays the
+            # fallback poll by UPSCALE_CALLBACK_WAIT_SECONDS.
+            if UPSCALE_CALLBACK_BASE_URL and UPSCALE_CALLBACK_TOKEN and UPSCALE_CALLBACK_WAIT_SECONDS > 0:
+                try:
+                    await workflow.wait_condition(
+                        lambda: self._upscale_job_finished,
+                        timeout=timedelta(seconds=UPSCALE_CALLBACK_WAIT_SECONDS),
+                    )
+                except asyncio.TimeoutError:
+                    workflow.logger.warning(
+                        f"No upscale callback for video_id={req.video_id}; falling back to polling"
+                    )
+
+            # 4. Poll for completion and save to disk (returns file path)
             upscaled_video_path = await workflow.execute_activity(
                 poll_upscale_status,
                 args=[upscale_job_id, req.run_id, req.video_id],
@@ -1464,20 +1525,10 @@ class VideoUpscalingStitchWorkflow:
         """Workflow to stitch upscaled videos with voiceover and burn subtitles."""
         workflow.logger.info(f"Starting upscaling stitch workflow for run_id={req.run_id}")
 
-        # Define a retry policy for activities that might fail due to transient issues.
-        retry_policy = RetryPolicy(
-            maximum_attempts=1,
-            initial_interval=timedelta(seconds=10),
-            backoff_coefficient=2.0,
-        )
-        activity_defaults = {
-            "start_to_close_timeout": timedelta(minutes=DEFAULT_ACTIVITY_TIMEOUT_MINUTES),
-            "retry_policy": retry_policy,
-        }
+        retry_policy = _DEFAULT_RETRY_POLICY
+        activity_defaults = _DEFAULT_ACTIVITY_OPTIONS
 
         try:
-            run_dir = DATA_SHARED_BASE / req.run_id
-
             upscaled_files = await workflow.execute_activity(
                 list_upscaled_videos,
                 args=[req.run_id],
@@ -1486,25 +1537,38 @@ class VideoUpscalingStitchWorkflow:
             workflow.logger.info(f"Found {len(upscaled_files)} upscaled video files to stitch")
 
             voiceover_path = DATA_SHARED_BASE / req.run_id / "voiceover.mp3"
-            srt_path = DATA_SHARED_BASE / req.run_id / "generated.srt"
 
-            # Stitch videos with voiceover
-            output_path = run_dir / "stitched_output.mp4"
-            await workflow.execute_activity(
-                stitch_videos,
-                args=[req.run_id, [str(p) for p in upscaled_files], str(voiceover_path)],
-                start_to_close_timeout=timedelta(minutes=STITCH_TIMEOUT_MINUTES),
-                retry_policy=retry_policy,
-            )
-
-            # Burn subtitles into video
-            final_path = run_dir / "final_video.mp4"
-            final_video_path = await workflow.execute_activity(
-                burn_subtitles_into_video,
-                args=[req.run_id, str(output_path), req.voice_language or "en", str(voiceover_path)],
-                start_to_close_timeout=timedelta(minutes=SUBTITLES_TIMEOUT_MINUTES),
-                retry_policy=retry_policy,
-            )
+            if workflow.patched("stitch-and-finalize"):
+                # Stitch videos with voiceover and burn subtitles in a single encode
+                final_video_path = await workflow.execute_activity(
+                    stitch_and_finalize,
+                    args=[
+                        req.run_id,
+                        [str(p) for p in upscaled_files],
+                        str(voiceover_path),
+                        req.voice_language or "en",
+                    ],
+                    start_to_close_timeout=timedelta(minutes=STITCH_TIMEOUT_MINUTES + SUBTITLES_TIMEOUT_MINUTES),
+                    retry_policy=retry_policy,
+                    task_queue=RENDER_TASK_QUEUE,
+                )
+            else:
+                # Runs started before the fused activity replay the two-step tail.
+                output_path = DATA_SHARED_BASE / req.run_id / "stitched_output.mp4"
+                await workflow.execute_activity(
+                    stitch_videos,
+                    args=[req.run_id, [str(p) for p in upscaled_files], str(voiceover_path)],
+                    start_to_close_timeout=timedelta(minutes=STITCH_TIMEOUT_MINUTES),
+                    retry_policy=retry_policy,
+                    task_queue=RENDER_TASK_QUEUE,
+                )
+                final_video_path = await workflow.execute_activity(
+                    burn_subtitles_into_video,
+                    args=[req.run_id, str(output_path), req.voice_language or "en", str(voiceover_path)],
+                    start_to_close_timeout=timedelta(minutes=SUBTITLES_TIMEOUT_MINUTES),
+                    retry_policy=retry_policy,
+                    task_queue=RENDER_TASK_QUEUE,
+                )
 
             workflow.logger.info(f"Upscaling stitch workflow for run_id={req.run_id} completed successfully.")
             return final_video_path
@@ -1527,16 +1591,8 @@ class VideoUpscalingWorkflow:
         """Parent workflow for video upscaling that starts child workflows for each video clip."""
         workflow.logger.info(f"Starting video upscaling parent workflow for run_id={req.run_id}")
 
-        # Define a retry policy for activities that might fail due to transient issues.
-        retry_policy = RetryPolicy(
-            maximum_attempts=1,
-            initial_interval=timedelta(seconds=10),
-            backoff_coefficient=2.0,
-        )
-        activity_defaults = {
-            "start_to_close_timeout": timedelta(minutes=DEFAULT_ACTIVITY_TIMEOUT_MINUTES),
-            "retry_policy": retry_policy,
-        }
+        retry_policy = _DEFAULT_RETRY_POLICY
+        activity_defaults = _DEFAULT_ACTIVITY_OPTIONS
 
         try:
             # List video files in shared directory (must be done via activity; workflow sandbox forbids I/O)
@@ -1548,9 +1604,16 @@ class VideoUpscalingWorkflow:
 
             workflow.logger.info(f"Found {len(video_files)} video files to upscale")
             
-            # Start all upscaling child workflows immediately - RunPod will handle queuing
-            workflow.logger.info(f"Starting {len(video_files)} upscaling child workflows (RunPod will queue)")
-            
+            # Children run concurrently but at most UPSCALE_CHILD_WORKFLOW_CONCURRENCY at a
+            # time, so a long run does not flood the RunPod upscale endpoint.
+            workflow.logger.info(
+                f"Starting {len(video_files)} upscaling child workflows "
+                f"(max {UPSCALE_CHILD_WORKFLOW_CONCURRENCY} in flight)"
+            )
+
+            # Runs started before the cap replay with every child started at once.
+            cap_children = workflow.patched("cap-upscale-children")
+            upscale_semaphore = asyncio.Semaphore(UPSCALE_CHILD_WORKFLOW_CONCURRENCY)
             futures = []
             for idx, video_file in enumerate(video_files):
                 video_path = str(video_file)
@@ -1563,13 +1626,21 @@ class VideoUpscalingWorkflow:
                     workflow_id=req.workflow_id,
                 )
 
-                futures.append(
-                    workflow.execute_child_workflow(
-                        VideoUpscalingChildWorkflow.run,
-                        child_req,
-                        id=f"upscale-child-{req.run_id}-{idx}",
+                child_id = f"upscale-child-{req.run_id}-{idx}"
+                if cap_children:
+                    futures.append(
+                        _run_with_semaphore(
+                            upscale_semaphore,
+                            workflow.execute_child_workflow,
+                            VideoUpscalingChildWorkflow.run,
+                            child_req,
+                            id=child_id,
+                        )
+                    )
+                else:
+                    futures.append(
+                        workflow.execute_child_workflow(VideoUpscalingChildWorkflow.run, child_req, id=child_id)
                     )
-                )
 
             await asyncio.gather(*futures)
 
@@ -1596,7 +1667,7 @@ class VideoUpscalingWorkflow:
                     req.user_id,
                     None,
                 ],
-                **activity_defaults,
+                **_WEBHOOK_ACTIVITY_OPTIONS,
             )
 
             workflow.logger.info(f"Parent upscaling workflow for run_id={req.run_id} completed all workflows.")
@@ -1616,7 +1687,7 @@ class VideoUpscalingWorkflow:
                     req.user_id,
                     detail,
                 ],
-                **activity_defaults,
+                **_WEBHOOK_ACTIVITY_OPTIONS,
             )
             if isinstance(e, ApplicationError):
                 raise
@@ -6,18 +6,81 @@ from typing import Tuple
 
 from videomerge.utils.logging import get_logger
 
+try:
+    # PyAV ships with faster-whisper; decoding in-process avoids an ffmpeg spawn.
+    import av
+except ImportError:  # pragma: no cover - PyAV is optional
+    av = None
+
 logger = get_logger(__name__)
 
+# Static head of the ffmpeg fallback command.
+_FFMPEG_PREFIX = ('ffmpeg', '-hide_banner', '-loglevel', 'error', '-y')
+
+# Mirrors ffmpeg's ``-sseof -0.1``: seek this far before the end for the last frame.
+_LAST_FRAME_SEEK_US = 100_000
+# Generated clips this short usually hold a single GOP, so seeking near the end
+# lands back on the first keyframe anyway; decode them straight through instead.
+_LINEAR_DECODE_MAX_US = 5_000_000
+
+
+def _write_png(frame, path: Path) -> None:
+    """Encode a decoded PyAV frame to ``path`` as a single PNG image."""
+    rgb = frame.reformat(format="rgb24")
+    rgb.pts = 0
+    with av.open(str(path), mode="w", format="image2") as output:
+        stream = output.add_stream("png", options={"compression_level": "1"})
+        stream.width = rgb.width
+        stream.height = rgb.height
+        stream.pix_fmt = "rgb24"
+        for packet in stream.encode(rgb):
+            output.mux(packet)
+        for packet in stream.encode():
+            output.mux(packet)
+
+
+def _extract_frames_with_av(video_path: Path, first_frame_path: Path, last_frame_path: Path) -> None:
+    """Grab the first and last video frames in-process with PyAV."""
+    with av.open(str(video_path)) as container:
+        # Default (slice) threading: frame threading would buffer several frames
+        # before returning the first one, which only adds latency for two grabs.
+        stream = container.streams.video[0]
+        last_frame = first_frame = next(container.decode(stream))
+        _write_png(first_frame, first_frame_path)
+
+        if container.duration and container.duration > _LINEAR_DECODE_MAX_US:
+            # Seeks to the keyframe at or before the target, like an input-side -sseof.
+            container.seek(container.duration - _LAST_FRAME_SEEK_US)
+        for frame in container.decode(stream):
+            last_frame = frame
+        _write_png(last_frame, last_frame_path)
+
+
+def _frames_up_to_date(video_path: Path, first_frame_path: Path, last_frame_path: Path) -> bool:
+    """Return True if both frame files exist and are not older than the video."""
+    try:
+        video_mtime = video_path.stat().st_mtime
+        return (
+            first_frame_path.stat().st_mtime >= video_mtime
+            and last_frame_path.stat().st_mtime >= video_mtime
+        )
+    except FileNotFoundError:
+        return False
+
 
 def extract_first_and_last_frames(
     video_path: Path,
     output_dir: Path,
+    force: bool = False,
 ) -> Tuple[Path, Path]:
     """Extract the first and last frames from a video file as PNG images.
     
+    Frames that already exist and are at least as new as the video are reused.
+    
     Args:
         video_path: Path to the video file (e.g., 000_c04213ad065847ca8097c4f541be3b8e.mp4)
         output_dir: Directory where the PNG frames should be saved
+        force: Re-extract even if up-to-date frames already exist
         
     Returns:
         Tuple of (first_frame_path, last_frame_path)
@@ -37,37 +100,47 @@ def extract_first_and_last_frames(
     first_frame_path = output_dir / f"{video_stem}_first.png"
     last_frame_path = output_dir / f"{video_stem}_last.png"
     
-    # Extract first frame (frame 0)
-    logger.debug(f"[video_frames] Extracting first frame from {video_path} to {first_frame_path}")
-    first_cmd = [
-        'ffmpeg', '-hide_banner', '-loglevel', 'error', '-y',
-        '-i', str(video_path),
-        '-vf', 'select=eq(n\\,0)',
-        '-vframes', '1',
-        str(first_frame_path)
-    ]
+    if not force and _frames_up_to_date(video_path, first_frame_path, last_frame_path):
+        logger.debug("[video_frames] Frames for %s are up to date; skipping extraction", video_path)
+        return first_frame_path, last_frame_path
     
-    result = subprocess.run(first_cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        logger.error(f"[video_frames] Failed to extract first frame: {result.stderr}")
-        raise RuntimeError(f"Failed to extract first frame from {video_path}: {result.stderr}")
+    if av is not None:
+        try:
+            _extract_frames_with_av(video_path, first_frame_path, last_frame_path)
+            logger.info("[video_frames] Extracted frames: %s, %s", first_frame_path, last_frame_path)
+            return first_frame_path, last_frame_path
+        except Exception as e:
+            logger.warning("[video_frames] PyAV frame extraction failed for %s, falling back to ffmpeg: %s", video_path, e)
     
-    # Extract last frame
-    # Using select='eq(n,0)' with reverse input to get the last frame efficiently
-    logger.debug(f"[video_frames] Extracting last frame from {video_path} to {last_frame_path}")
-    last_cmd = [
-        'ffmpeg', '-hide_banner', '-loglevel', 'error', '-y',
-        '-sseof', '-0.1',  # Seek to 0.1 seconds before end
-        '-i', str(video_path),
-        '-update', '1',
-        '-frames:v', '1',
-        str(last_frame_path)
+    # Extract both frames in one ffmpeg process. The video is opened as two
+    # inputs: input 0 is decoded from the start (frame 0), input 1 seeks to
+    # 0.1 seconds before the end and keeps the last decoded frame. PNG stays
+    # lossless; the fastest deflate level keeps encoding from dominating.
+    logger.debug(
+        "[video_frames] Extracting first/last frames from %s to %s, %s",
+        video_path,
+        first_frame_path,
+        last_frame_path,
+    )
+    video = str(video_path)
+    cmd = [
+        *_FFMPEG_PREFIX,
+        # Single-threaded decoders: frame threading delays the first output frame.
+        '-threads', '1', '-i', video,
+        '-threads', '1', '-sseof', '-0.1',  # Seek to 0.1 seconds before end
+        '-i', video,
+        '-map', '0:v:0', '-frames:v', '1', '-compression_level', '1',
+        str(first_frame_path),
+        '-map', '1:v:0', '-update', '1', '-frames:v', '1', '-compression_level', '1',
+        str(last_frame_path),
     ]
     
-    result = subprocess.run(last_cmd, capture_output=True, text=True)
+    # ffmpeg writes nothing useful to stdout here; stderr is only decoded on failure.
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
     if result.returncode != 0:
-        logger.error(f"[video_frames] Failed to extract last frame: {result.stderr}")
-        raise RuntimeError(f"Failed to extract last frame from {video_path}: {result.stderr}")
+        stderr = result.stderr.decode("utf-8", "replace")
+        logger.error("[video_frames] Failed to extract frames: %s", stderr)
+        raise RuntimeError(f"Failed to extract first/last frames from {video_path}: {stderr}")
     
-    logger.info(f"[video_frames] Extracted frames: {first_frame_path}, {last_frame_path}")
+    logger.info("[video_frames] Extracted frames: %s, %s", first_frame_path, last_frame_path)
     return first_frame_path, last_frame_path